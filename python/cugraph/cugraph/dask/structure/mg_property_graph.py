@@ -16,6 +16,8 @@ import cudf
 import cugraph
 import dask_cudf
 import cugraph.dask as dcg
+from cugraph.structure.selection_expression import (
+    compile_selection_expression)
 
 
 class EXPERIMENTAL__MGPropertySelection:
@@ -646,10 +648,12 @@ class EXPERIMENTAL__MGPropertyGraph:
         >>>
         """
         # FIXME: check types
-        globals = {}
+        # FIXME: push down _TYPE_ comparisons as done for PropertyGraph
         locals = self.__edge_prop_eval_dict
+        expression = compile_selection_expression(
+            expr, tuple(locals), self.type_col_name)
 
-        selected_col = eval(expr, globals, locals)
+        selected_col = expression.evaluate(locals)
         return EXPERIMENTAL__MGPropertySelection(
             edge_selection_series=selected_col)
 
@@ -11,33 +11,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.utilities.api_tools import experimental_warning_wrapper
-from cugraph.utilities.api_tools import deprecated_warning_wrapper
-
-from cugraph.structure.property_graph import EXPERIMENTAL__PropertyGraph
-PropertyGraph = experimental_warning_wrapper(EXPERIMENTAL__PropertyGraph)
-
-from cugraph.structure.property_graph import EXPERIMENTAL__PropertySelection
-PropertySelection = experimental_warning_wrapper(EXPERIMENTAL__PropertySelection)
-
-from cugraph.dask.structure.mg_property_graph import EXPERIMENTAL__MGPropertyGraph
-MGPropertyGraph = experimental_warning_wrapper(EXPERIMENTAL__MGPropertyGraph)
-
-from cugraph.dask.structure.mg_property_graph import EXPERIMENTAL__MGPropertySelection
-MGPropertySelection = experimental_warning_wrapper(EXPERIMENTAL__MGPropertySelection)
-
-from cugraph.experimental.community.triangle_count import \
-    EXPERIMENTAL__triangle_count
-triangle_count = experimental_warning_wrapper(EXPERIMENTAL__triangle_count)
-
-from cugraph.experimental.components.scc import \
-    EXPERIMENTAL__strong_connected_component
-strong_connected_component = \
-    experimental_warning_wrapper(EXPERIMENTAL__strong_connected_component)
-
-from cugraph.experimental.structure.bicliques import EXPERIMENTAL__find_bicliques
-find_bicliques = deprecated_warning_wrapper(
-    experimental_warning_wrapper(EXPERIMENTAL__find_bicliques)
-)
-
-from cugraph.experimental.datasets.dataset import Dataset
+import importlib.util
+
+# See cugraph/__init__.py. Without cuDF, only PropertyGraph (using pandas
+# DataFrames) is available.
+if importlib.util.find_spec("cudf") is not None:
+    from cugraph.utilities.api_tools import experimental_warning_wrapper
+    from cugraph.utilities.api_tools import deprecated_warning_wrapper
+
+    from cugraph.structure.property_graph import EXPERIMENTAL__PropertyGraph
+    PropertyGraph = experimental_warning_wrapper(EXPERIMENTAL__PropertyGraph)
+
+    from cugraph.structure.property_graph import EXPERIMENTAL__PropertySelection
+    PropertySelection = experimental_warning_wrapper(EXPERIMENTAL__PropertySelection)
+
+    from cugraph.dask.structure.mg_property_graph import EXPERIMENTAL__MGPropertyGraph
+    MGPropertyGraph = experimental_warning_wrapper(EXPERIMENTAL__MGPropertyGraph)
+
+    from cugraph.dask.structure.mg_property_graph import EXPERIMENTAL__MGPropertySelection
+    MGPropertySelection = experimental_warning_wrapper(EXPERIMENTAL__MGPropertySelection)
+
+    from cugraph.experimental.community.triangle_count import \
+        EXPERIMENTAL__triangle_count
+    triangle_count = experimental_warning_wrapper(EXPERIMENTAL__triangle_count)
+
+    from cugraph.experimental.components.scc import \
+        EXPERIMENTAL__strong_connected_component
+    strong_connected_component = \
+        experimental_warning_wrapper(EXPERIMENTAL__strong_connected_component)
+
+    from cugraph.experimental.structure.bicliques import EXPERIMENTAL__find_bicliques
+    find_bicliques = deprecated_warning_wrapper(
+        experimental_warning_wrapper(EXPERIMENTAL__find_bicliques)
+    )
+
+    from cugraph.experimental.datasets.dataset import Dataset
+else:
+    from cugraph.structure.property_graph import (
+        EXPERIMENTAL__PropertyGraph as PropertyGraph,
+        EXPERIMENTAL__PropertySelection as PropertySelection,
+    )
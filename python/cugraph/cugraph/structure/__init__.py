@@ -11,29 +11,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cugraph.structure.graph_classes import (Graph,
-                                             DiGraph,
-                                             MultiGraph,
-                                             MultiDiGraph,
-                                             BiPartiteGraph,
-                                             BiPartiteDiGraph)
-from cugraph.structure.graph_classes import (is_weighted,
-                                             is_directed,
-                                             is_multigraph,
-                                             is_bipartite,
-                                             is_multipartite)
-from cugraph.structure.number_map import NumberMap
-from cugraph.structure.symmetrize import symmetrize, symmetrize_df , symmetrize_ddf
-from cugraph.structure.convert_matrix import (from_edgelist,
-                                              from_cudf_edgelist,
-                                              from_pandas_edgelist,
-                                              to_pandas_edgelist,
-                                              from_pandas_adjacency,
-                                              to_pandas_adjacency,
-                                              from_numpy_array,
-                                              to_numpy_array,
-                                              from_numpy_matrix,
-                                              to_numpy_matrix,
-                                              from_adjlist)
-from cugraph.structure.hypergraph import hypergraph
-from cugraph.structure.shuffle import shuffle
+import importlib.util
+
+# See cugraph/__init__.py
+if importlib.util.find_spec("cudf") is not None:
+    from cugraph.structure.graph_classes import (Graph,
+                                                 DiGraph,
+                                                 MultiGraph,
+                                                 MultiDiGraph,
+                                                 BiPartiteGraph,
+                                                 BiPartiteDiGraph)
+    from cugraph.structure.graph_classes import (is_weighted,
+                                                 is_directed,
+                                                 is_multigraph,
+                                                 is_bipartite,
+                                                 is_multipartite)
+    from cugraph.structure.number_map import NumberMap
+    from cugraph.structure.symmetrize import symmetrize, symmetrize_df , symmetrize_ddf
+    from cugraph.structure.convert_matrix import (from_edgelist,
+                                                  from_cudf_edgelist,
+                                                  from_pandas_edgelist,
+                                                  to_pandas_edgelist,
+                                                  from_pandas_adjacency,
+                                                  to_pandas_adjacency,
+                                                  from_numpy_array,
+                                                  to_numpy_array,
+                                                  from_numpy_matrix,
+                                                  to_numpy_matrix,
+                                                  from_adjlist)
+    from cugraph.structure.hypergraph import hypergraph
+    from cugraph.structure.shuffle import shuffle
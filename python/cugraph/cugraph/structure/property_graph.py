@@ -11,12 +11,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import cudf
+import json
+import os
+import threading
+from collections import OrderedDict
 
 import cugraph
+from cugraph.structure.selection_expression import (
+    compile_selection_expression)
 from cugraph.utilities.utils import import_optional, MissingModule
 
+
+class _MissingCuDF(MissingModule):
+    """
+    Used in place of the cudf module when cuDF is not installed (see
+    cugraph/__init__.py). No objects are instances of its DataFrame, Series,
+    and RangeIndex types, so only pandas DataFrames can be used.
+    """
+    class DataFrame:
+        pass
+
+    class Series:
+        pass
+
+    class RangeIndex:
+        pass
+
+
+cudf = import_optional("cudf", default_mod_class=_MissingCuDF)
 pd = import_optional("pandas")
+np = import_optional("numpy")
+cp = import_optional("cupy")
+pq = import_optional("pyarrow.parquet")
 
 _dataframe_types = [cudf.DataFrame]
 if not isinstance(pd, MissingModule):
@@ -33,9 +59,17 @@ class EXPERIMENTAL__PropertySelection:
     """
     def __init__(self,
                  vertex_selection_series=None,
-                 edge_selection_series=None):
+                 edge_selection_series=None,
+                 vertex_selection_key=None,
+                 edge_selection_key=None):
         self.vertex_selections = vertex_selection_series
         self.edge_selections = edge_selection_series
+        # Hashable values identifying the expressions used to create the
+        # vertex and edge selections, used by PropertyGraph.extract_subgraph()
+        # to look up previously extracted Graphs. These are None if the
+        # selections were not created from expressions.
+        self.vertex_selection_key = vertex_selection_key
+        self.edge_selection_key = edge_selection_key
 
     def __add__(self, other):
         """
@@ -43,12 +77,16 @@ class EXPERIMENTAL__PropertySelection:
         instance from "other" if either are not already set.
         """
         vs = self.vertex_selections
+        vs_key = self.vertex_selection_key
         if vs is None:
             vs = other.vertex_selections
+            vs_key = other.vertex_selection_key
         es = self.edge_selections
+        es_key = self.edge_selection_key
         if es is None:
             es = other.edge_selections
-        return EXPERIMENTAL__PropertySelection(vs, es)
+            es_key = other.edge_selection_key
+        return EXPERIMENTAL__PropertySelection(vs, es, vs_key, es_key)
 
 
 # FIXME: remove leading EXPERIMENTAL__ when no longer experimental
@@ -57,6 +95,31 @@ class EXPERIMENTAL__PropertyGraph:
     Class which stores vertex and edge properties that can be used to construct
     Graphs from individual property selections and used later to annotate graph
     algorithm results with corresponding properties.
+
+    Parameters
+    ----------
+    subgraph_cache_size : int (default 0)
+        The maximum number of Graphs returned by extract_subgraph() to keep,
+        so that calling extract_subgraph() again with the same selection
+        expressions and arguments returns the same Graph instead of creating
+        it again. Cached Graphs are removed when data is added. Caching is
+        disabled by default, since cached Graphs (and the memory they use)
+        are kept alive by the PropertyGraph and are shared by all callers.
+    per_type_storage : bool (default False)
+        If True, the properties for each vertex and edge type are stored in a
+        separate DataFrame containing only the columns used by that type,
+        instead of being merged into a single DataFrame containing the columns
+        for all types. This keeps the memory used by graphs with many types
+        proportional to the data added and makes adding data for a type touch
+        only the existing data for that type. The single DataFrame of all
+        properties is only created when needed (eg. by select_vertices() or
+        extract_subgraph()).
+    categorical_string_properties : bool (default False)
+        If True, string property columns are stored as categorical columns,
+        which store each distinct string once along with an integer code for
+        each row. This uses less memory and makes comparisons faster for
+        properties with few distinct values. The type column is always stored
+        as a categorical column.
     """
     # column name constants used in internal DataFrames
     vertex_col_name = "_VERTEX_"
@@ -67,8 +130,12 @@ class EXPERIMENTAL__PropertyGraph:
     vertex_id_col_name = "_VERTEX_ID_"
     weight_col_name = "_WEIGHT_"
     _default_type_name = ""
+    # file name and format version used by save() and load()
+    _metadata_file_name = "property_graph.json"
+    _save_format_version = 1
 
-    def __init__(self):
+    def __init__(self, subgraph_cache_size=0, per_type_storage=False,
+                 categorical_string_properties=False):
         # The dataframe containing the properties for each vertex.
         # Each vertex occupies a row, and individual properties are maintained
         # in individual columns. The table contains a column for each property
@@ -96,6 +163,59 @@ class EXPERIMENTAL__PropertyGraph:
         #   9 |  88 | ""        | NaN   | NaN   | 2
         self.__edge_prop_dataframe = None
 
+        # If per_type_storage is True, properties are kept in the following
+        # dictionaries of type_name:DataFrame instead of the DataFrames above.
+        # Each DataFrame contains only the vertex ID (or src, dst, and edge ID)
+        # column and the property columns added for that type. The DataFrames
+        # above are then only used to cache the result of concatenating all
+        # per-type DataFrames, and are reset to None when data is added.
+        # Example:
+        # {"user":    vertex | propA | propC
+        #             --------------------
+        #                  3 | 22    | 11
+        #  "service": vertex | propB | propC
+        #             --------------------
+        #                 88 | 3.14  | 21
+        # }
+        self.__per_type_storage = per_type_storage
+        self.__vertex_prop_dataframes = {}
+        self.__edge_prop_dataframes = {}
+
+        # The names of all vertex and edge types, in the order they were first
+        # added. The type columns of the DataFrames above are categorical
+        # columns with these names as the categories, so each type name is
+        # only stored once, rows store an integer code for their type, and the
+        # code for a type never changes as more types are added.
+        self.__type_names = []
+        self.__categorical_string_properties = categorical_string_properties
+
+        # Indices used to look up the rows for individual vertex IDs using
+        # binary searches instead of scanning every row. Each index is a
+        # Series of the vertex IDs in a DataFrame sorted by ID, with the row
+        # position of each ID as the index. __vertex_id_index is used for the
+        # DataFrame of all vertex properties, and __vertex_id_indices contains
+        # an index for each type when per_type_storage is True. An index is
+        # (re)created as needed after vertex data is added to its DataFrame.
+        # Indices are not needed for edge IDs, since edges are always stored
+        # in the order they were added, which is sorted by edge ID.
+        self.__vertex_id_index = None
+        self.__vertex_id_indices = {}
+
+        # The list of (type_name, DataFrame) tuples for edge data that has been
+        # added but not yet appended to the edge property DataFrame(s) above.
+        # Appending is deferred until the edge data is needed so that adding
+        # many DataFrames only results in a single concat, rather than a
+        # concat (or merge) of all existing edge data for each DataFrame added.
+        self.__edge_prop_chunks = []
+
+        # Dictionaries of type_name:row labels of the rows for each type in
+        # the DataFrames of all vertex and edge properties, used for
+        # evaluating only the rows of specific types when a selection
+        # expression is restricted to those types (eg. "_TYPE_=='users' & ...")
+        # These are (re)created as needed.
+        self.__vertex_type_index = None
+        self.__edge_type_index = None
+
         # The var:value dictionaries used during evaluation of filter/query
         # expressions for vertices and edges. These dictionaries contain
         # entries for each column name in their respective dataframes which
@@ -135,22 +255,54 @@ class EXPERIMENTAL__PropertyGraph:
         # incrementing this counter.
         self.__last_edge_id = None
 
+        # The distinct IDs of all vertices in the vertex and edge data, as a
+        # sorted Series, and a list of the Series of vertex IDs added since it
+        # was last updated. The new IDs are merged into the sorted IDs only
+        # when needed, so that adding data does not need to find the unique
+        # IDs of all existing data.
+        self.__vertex_ids = None
+        self.__new_vertex_id_sers = []
+
         # Cached property values
-        self.__num_vertices = None
         self.__vertex_type_value_counts = None
         self.__edge_type_value_counts = None
 
+        # Graphs returned by extract_subgraph(), in least to most recently used
+        # order, keyed by the selection expressions and arguments used. The
+        # data version is incremented each time data is added, and is also part
+        # of each key to ensure a Graph is never returned for older data.
+        self.__subgraph_cache = OrderedDict()
+        self.__subgraph_cache_size = subgraph_cache_size
+        # extract_subgraph() can be called concurrently (eg. by a server
+        # handling requests in multiple threads), so the cache is only
+        # accessed while holding this lock.
+        self.__subgraph_cache_lock = threading.Lock()
+        self.__subgraph_cache_hits = 0
+        self.__subgraph_cache_misses = 0
+        self.__data_version = 0
+
     # PropertyGraph read-only attributes
     @property
     def edges(self):
-        if self.__edge_prop_dataframe is not None:
-            return self.__edge_prop_dataframe[[self.src_col_name,
-                                               self.dst_col_name,
-                                               self.edge_id_col_name]]
+        columns = [self.src_col_name, self.dst_col_name, self.edge_id_col_name]
+        self.__append_edge_prop_chunks()
+        if self.__per_type_storage:
+            if self.__edge_prop_dataframes:
+                return self.__concat([df[columns] for df in
+                                      self.__edge_prop_dataframes.values()],
+                                     ignore_index=True)
+        elif self.__edge_prop_dataframe is not None:
+            return self.__edge_prop_dataframe[columns]
         return None
 
     @property
     def vertex_property_names(self):
+        if self.__per_type_storage:
+            props = self.__get_type_dataframes_columns(
+                self.__vertex_prop_dataframes)
+            if self.vertex_col_name in props:
+                props.remove(self.vertex_col_name)
+            return props
         if self.__vertex_prop_dataframe is not None:
             props = list(self.__vertex_prop_dataframe.columns)
             props.remove(self.vertex_col_name)
@@ -160,6 +312,15 @@ class EXPERIMENTAL__PropertyGraph:
 
     @property
     def edge_property_names(self):
+        self.__append_edge_prop_chunks()
+        if self.__per_type_storage:
+            props = self.__get_type_dataframes_columns(
+                self.__edge_prop_dataframes)
+            for col in [self.src_col_name, self.dst_col_name,
+                        self.edge_id_col_name, self.weight_col_name]:
+                if col in props:
+                    props.remove(col)
+            return props
         if self.__edge_prop_dataframe is not None:
             props = list(self.__edge_prop_dataframe.columns)
             props.remove(self.src_col_name)
@@ -201,36 +362,49 @@ class EXPERIMENTAL__PropertyGraph:
     # PropertyGraph read-only attributes for debugging
     @property
     def _vertex_prop_dataframe(self):
-        return self.__vertex_prop_dataframe
+        return self.__get_vertex_prop_dataframe()
 
     @property
     def _edge_prop_dataframe(self):
-        return self.__edge_prop_dataframe
+        return self.__get_edge_prop_dataframe()
 
     @property
     def _vertex_type_value_counts(self):
         """A Series of the counts of types in __vertex_prop_dataframe"""
+        if self.__per_type_storage:
+            if not self.__vertex_prop_dataframes:
+                return
+            if self.__vertex_type_value_counts is None:
+                self.__vertex_type_value_counts = \
+                    self.__get_type_dataframes_lengths(
+                        self.__vertex_prop_dataframes)
+            return self.__vertex_type_value_counts
         if self.__vertex_prop_dataframe is None:
             return
         if self.__vertex_type_value_counts is None:
             # Types should all be strings; what should we do if we see NaN?
-            self.__vertex_type_value_counts = (
-                self.__vertex_prop_dataframe[self.type_col_name]
-                .value_counts(sort=False, dropna=False)
-            )
+            self.__vertex_type_value_counts = self.__get_type_value_counts(
+                self.__vertex_prop_dataframe)
         return self.__vertex_type_value_counts
 
     @property
     def _edge_type_value_counts(self):
         """A Series of the counts of types in __edge_prop_dataframe"""
+        self.__append_edge_prop_chunks()
+        if self.__per_type_storage:
+            if not self.__edge_prop_dataframes:
+                return
+            if self.__edge_type_value_counts is None:
+                self.__edge_type_value_counts = \
+                    self.__get_type_dataframes_lengths(
+                        self.__edge_prop_dataframes)
+            return self.__edge_type_value_counts
         if self.__edge_prop_dataframe is None:
             return
         if self.__edge_type_value_counts is None:
             # Types should all be strings; what should we do if we see NaN?
-            self.__edge_type_value_counts = (
-                self.__edge_prop_dataframe[self.type_col_name]
-                .value_counts(sort=False, dropna=False)
-            )
+            self.__edge_type_value_counts = self.__get_type_value_counts(
+                self.__edge_prop_dataframe)
         return self.__edge_type_value_counts
 
     def get_num_vertices(self, type=None, *, include_edge_data=True):
@@ -253,30 +427,23 @@ class EXPERIMENTAL__PropertyGraph:
         """
         if type is None:
             if not include_edge_data:
-                if self.__vertex_prop_dataframe is None:
+                value_counts = self._vertex_type_value_counts
+                if value_counts is None:
                     return 0
-                return len(self.__vertex_prop_dataframe)
-            if self.__num_vertices is not None:
-                return self.__num_vertices
-            self.__num_vertices = 0
-            vert_sers = self.__get_all_vertices_series()
-            if vert_sers:
-                if self.__series_type is cudf.Series:
-                    self.__num_vertices = cudf.concat(vert_sers).nunique()
-                else:
-                    self.__num_vertices = pd.concat(vert_sers).nunique()
-            return self.__num_vertices
+                return int(value_counts.sum())
+            vertex_ids = self.__get_vertex_ids()
+            return 0 if vertex_ids is None else len(vertex_ids)
         value_counts = self._vertex_type_value_counts
         if type == self._default_type_name and include_edge_data:
             # The default type, "", can refer to both vertex and edge data
-            if self.__vertex_prop_dataframe is None:
+            if value_counts is None:
                 return self.get_num_vertices()
             return (
                 self.get_num_vertices()
-                - len(self.__vertex_prop_dataframe)
+                - self.get_num_vertices(include_edge_data=False)
                 + (value_counts[type] if type in value_counts else 0)
             )
-        if self.__vertex_prop_dataframe is None:
+        if value_counts is None:
             return 0
         return value_counts[type] if type in value_counts else 0
 
@@ -293,6 +460,14 @@ class EXPERIMENTAL__PropertyGraph:
         --------
         PropertyGraph.get_num_vertices
         """
+        self.__append_edge_prop_chunks()
+        if self.__per_type_storage:
+            if type is None:
+                return sum(len(df) for df in
+                           self.__edge_prop_dataframes.values())
+            if type in self.__edge_prop_dataframes:
+                return len(self.__edge_prop_dataframes[type])
+            return 0
         if type is None:
             if self.__edge_prop_dataframe is not None:
                 return len(self.__edge_prop_dataframe)
@@ -306,15 +481,12 @@ class EXPERIMENTAL__PropertyGraph:
     def get_vertices(self, selection=None):
         """
         Return a Series containing the unique vertex IDs contained in both
-        the vertex and edge property data.
+        the vertex and edge property data, in ascending order.
         """
-        vert_sers = self.__get_all_vertices_series()
-        if vert_sers:
-            if self.__series_type is cudf.Series:
-                return self.__series_type(cudf.concat(vert_sers).unique())
-            else:
-                return self.__series_type(pd.concat(vert_sers).unique())
-        return self.__series_type()
+        vertex_ids = self.__get_vertex_ids()
+        if vertex_ids is None:
+            return self.__series_type()
+        return vertex_ids.copy()
 
     def vertices_ids(self):
         """
@@ -390,13 +562,16 @@ class EXPERIMENTAL__PropertyGraph:
 
         # Clear the cached values related to the number of vertices since more
         # could be added in this method.
-        self.__num_vertices = None
         self.__vertex_type_value_counts = None  # Could update instead
+        self.__vertex_type_index = None
+        self.__data_version += 1
+        self.__remove_cached_subgraphs()
 
         # Initialize the __vertex_prop_dataframe if necessary using the same
         # type as the incoming dataframe.
         default_vertex_columns = [self.vertex_col_name, self.type_col_name]
-        if self.__vertex_prop_dataframe is None:
+        if (self.__vertex_prop_dataframe is None) and \
+           not(self.__per_type_storage):
             self.__vertex_prop_dataframe = \
                 self.__dataframe_type(columns=default_vertex_columns)
             # Initialize the new columns to the same dtype as the appropriate
@@ -415,8 +590,15 @@ class EXPERIMENTAL__PropertyGraph:
         # deleted when out-of-scope.
         tmp_df = dataframe.copy(deep=True)
         tmp_df[self.vertex_col_name] = tmp_df[vertex_col_name]
+        if type_name not in self.__type_names:
+            self.__type_names.append(type_name)
         # FIXME: handle case of a type_name column already being in tmp_df
-        tmp_df[self.type_col_name] = type_name
+        if not self.__per_type_storage:
+            # With per-type storage the type is implied by the DataFrame the
+            # properties are stored in.
+            tmp_df[self.type_col_name] = type_name
+            tmp_df[self.type_col_name] = \
+                tmp_df[self.type_col_name].astype(self.__get_type_dtype())
 
         if property_columns:
             # all columns
@@ -427,6 +609,29 @@ class EXPERIMENTAL__PropertyGraph:
         else:
             column_names_to_drop = {vertex_col_name}
         tmp_df.drop(labels=column_names_to_drop, axis=1, inplace=True)
+        self.__new_vertex_id_sers.append(tmp_df[self.vertex_col_name])
+        tmp_df = self.__convert_property_dtypes(tmp_df,
+                                                default_vertex_columns)
+
+        if self.__per_type_storage:
+            self.__vertex_prop_dtypes.update(
+                self.__get_new_prop_column_dtypes(
+                    tmp_df, self.__vertex_prop_dtypes,
+                    default_vertex_columns))
+            type_df = self.__vertex_prop_dataframes.get(type_name)
+            if type_df is not None:
+                (type_df, tmp_df) = \
+                    self.__unify_categorical_columns([type_df, tmp_df])
+                tmp_df = type_df.merge(tmp_df, how="outer")
+            else:
+                # Row labels are used as row positions in the ID index
+                tmp_df.reset_index(drop=True, inplace=True)
+            self.__vertex_prop_dataframes[type_name] = tmp_df
+            # The DataFrame of all vertex properties, the eval dict, and the
+            # ID index for the type are recreated when needed.
+            self.__vertex_prop_dataframe = None
+            self.__vertex_id_indices.pop(type_name, None)
+            return
 
         # Save the original dtypes for each new column so they can be restored
         # prior to constructing subgraphs (since column dtypes may get altered
@@ -435,8 +640,12 @@ class EXPERIMENTAL__PropertyGraph:
                            tmp_df, self.__vertex_prop_dataframe)
         self.__vertex_prop_dtypes.update(new_col_info)
 
+        (self.__vertex_prop_dataframe, tmp_df) = \
+            self.__unify_categorical_columns([self.__vertex_prop_dataframe,
+                                              tmp_df])
         self.__vertex_prop_dataframe = \
             self.__vertex_prop_dataframe.merge(tmp_df, how="outer")
+        self.__vertex_id_index = None
 
         # Update the vertex eval dict with the latest column instances
         latest = dict([(n, self.__vertex_prop_dataframe[n])
@@ -448,20 +657,38 @@ class EXPERIMENTAL__PropertyGraph:
         Return a dataframe containing vertex properties for only the specified
         vertex_ids, columns, and/or types, or all vertex IDs if not specified.
         """
+        if self.__per_type_storage:
+            if not self.__vertex_prop_dataframes:
+                return None
+            return self.__get_type_dataframes_data(
+                self.__vertex_prop_dataframes,
+                self.__get_type_vertex_id_index,
+                vertex_ids,
+                types,
+                [self.vertex_col_name, self.type_col_name],
+                self.vertex_property_names if columns is None else columns)
+
         if self.__vertex_prop_dataframe is not None:
             if vertex_ids is not None:
-                df_mask = (
-                    self.__vertex_prop_dataframe[self.vertex_col_name]
-                    .isin(vertex_ids)
-                )
-                df = self.__vertex_prop_dataframe.loc[df_mask]
+                if self.__vertex_id_index is None:
+                    self.__vertex_id_index = self.__create_id_index(
+                        self.__vertex_prop_dataframe[self.vertex_col_name])
+                df = self.__vertex_prop_dataframe.take(
+                    self.__find_id_positions(self.__vertex_id_index,
+                                             vertex_ids))
+                if types is not None:
+                    # FIXME: coerce types to a list-like if not?
+                    df_mask = df[self.type_col_name].isin(types)
+                    df = df.loc[df_mask]
+            elif types is not None:
+                if self.__vertex_type_index is None:
+                    self.__vertex_type_index = \
+                        self.__create_type_index(self.__vertex_prop_dataframe)
+                df = self.__vertex_prop_dataframe.loc[
+                    self.__get_type_rows(self.__vertex_type_index, types)]
             else:
                 df = self.__vertex_prop_dataframe
-
-            if types is not None:
-                # FIXME: coerce types to a list-like if not?
-                df_mask = df[self.type_col_name].isin(types)
-                df = df.loc[df_mask]
+            df = self.__update_type_dtype(df)
 
             # The "internal" pG.vertex_col_name and pG.type_col_name columns
             # are also included/added since they are assumed to be needed by
@@ -475,6 +702,167 @@ class EXPERIMENTAL__PropertyGraph:
 
         return None
 
+    def update_vertex_data(self,
+                           dataframe,
+                           vertex_col_name,
+                           type_name=None,
+                           property_columns=None):
+        """
+        Set the properties of the vertices in dataframe to the values in
+        dataframe, adding the vertices that are not present. Unlike
+        add_vertex_data(), the values of existing vertices are overwritten in
+        place instead of the data being merged, which only touches the rows
+        of the vertices in dataframe.
+
+        Parameters
+        ----------
+        dataframe : DataFrame-compatible instance
+            A DataFrame instance with a compatible Pandas-like DataFrame
+            interface, of the same type as the data already added.
+        vertex_col_name : string
+            The column name that contains the vertex IDs. If a vertex ID is
+            present more than once, the last row is used.
+        type_name : string, optional
+            If specified, only the properties of vertices of this type are
+            set, and vertices without data of this type are added with this
+            type. Otherwise the properties are set for all types of data for
+            each vertex, and vertices that are not present are added with the
+            default type.
+        property_columns : list of strings
+            List of column names in dataframe containing the properties to
+            set. All other columns in dataframe will be ignored. If not
+            specified, all columns in dataframe are used. Properties that are
+            not present are added, with NA values for all other vertices.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        PropertyGraph.add_vertex_data
+        PropertyGraph.remove_vertices
+        """
+        (updates, property_columns) = self.__get_updates(
+            dataframe, vertex_col_name, type_name, property_columns,
+            [self.vertex_col_name, self.type_col_name])
+        vertex_ids = updates[vertex_col_name]
+
+        found_id_sers = []
+        if self.__per_type_storage:
+            if type_name is None:
+                type_names = list(self.__vertex_prop_dataframes)
+            else:
+                type_names = [type_name] if type_name in \
+                    self.__vertex_prop_dataframes else []
+            for t in type_names:
+                df = self.__vertex_prop_dataframes[t]
+                positions = self.__find_id_positions(
+                    self.__get_type_vertex_id_index(t), vertex_ids)
+                self.__update_rows(df, positions, self.vertex_col_name,
+                                   updates, vertex_col_name, property_columns)
+                found_id_sers.append(df[self.vertex_col_name].take(positions))
+            self.__vertex_prop_dataframe = None
+        elif self.__vertex_prop_dataframe is not None:
+            df = self.__vertex_prop_dataframe
+            if self.__vertex_id_index is None:
+                self.__vertex_id_index = self.__create_id_index(
+                    df[self.vertex_col_name])
+            positions = self.__find_id_positions(self.__vertex_id_index,
+                                                 vertex_ids)
+            if type_name is not None:
+                xp = cp if self.__series_type is cudf.Series else np
+                positions = positions[xp.asarray(
+                    (df[self.type_col_name].take(positions) == type_name)
+                    .values)]
+            self.__update_rows(df, positions, self.vertex_col_name,
+                               updates, vertex_col_name, property_columns)
+            found_id_sers.append(df[self.vertex_col_name].take(positions))
+            self.__vertex_prop_eval_dict.update(
+                dict([(n, df[n]) for n in property_columns]))
+
+        self.__vertex_prop_dtypes.update(
+            self.__get_new_prop_column_dtypes(
+                updates[property_columns], self.__vertex_prop_dtypes, []))
+        self.__data_version += 1
+        self.__remove_cached_subgraphs()
+
+        if found_id_sers:
+            updates = updates[~vertex_ids.isin(
+                self.__concat(found_id_sers, ignore_index=True))]
+        if len(updates) > 0:
+            self.add_vertex_data(updates, vertex_col_name, type_name,
+                                 property_columns)
+
+    def remove_vertices(self, vertex_ids, types=None):
+        """
+        Remove the data for the vertices in vertex_ids, along with all edges
+        to or from them.
+
+        Parameters
+        ----------
+        vertex_ids : Series or array-like
+            The IDs of the vertices to remove. IDs that are not present are
+            ignored.
+        types : list of strings, optional
+            If specified, only the data of these types is removed for each
+            vertex, and edges are not removed.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        PropertyGraph.remove_edges
+        """
+        if self.__per_type_storage:
+            for t in list(self.__vertex_prop_dataframes):
+                if (types is not None) and (t not in types):
+                    continue
+                positions = self.__find_id_positions(
+                    self.__get_type_vertex_id_index(t), vertex_ids)
+                if len(positions) == 0:
+                    continue
+                df = self.__remove_rows(self.__vertex_prop_dataframes[t],
+                                        positions)
+                if len(df) > 0:
+                    self.__vertex_prop_dataframes[t] = df
+                else:
+                    del self.__vertex_prop_dataframes[t]
+                self.__vertex_id_indices.pop(t, None)
+            # The combined DataFrame, its eval dict, and its type index are
+            # rebuilt from the remaining per-type DataFrames when needed.
+            self.__vertex_prop_dataframe = None
+            self.__vertex_prop_eval_dict = {}
+            self.__vertex_type_index = None
+        elif self.__vertex_prop_dataframe is not None:
+            df = self.__vertex_prop_dataframe
+            if self.__vertex_id_index is None:
+                self.__vertex_id_index = self.__create_id_index(
+                    df[self.vertex_col_name])
+            positions = self.__find_id_positions(self.__vertex_id_index,
+                                                 vertex_ids)
+            if types is not None:
+                xp = cp if self.__series_type is cudf.Series else np
+                positions = positions[xp.asarray(
+                    df[self.type_col_name].take(positions).isin(types)
+                    .values)]
+            df = self.__remove_rows(df, positions)
+            self.__vertex_prop_dataframe = df
+            self.__vertex_prop_eval_dict = dict([(n, df[n])
+                                                 for n in df.columns])
+            self.__vertex_id_index = None
+            self.__vertex_type_index = None
+
+        self.__vertex_type_value_counts = None
+        if types is None:
+            xp = cp if self.__series_type is cudf.Series else np
+            self.__remove_edges(lambda df: xp.flatnonzero(xp.asarray(
+                (df[self.src_col_name].isin(vertex_ids) |
+                 df[self.dst_col_name].isin(vertex_ids)).values)))
+        self.__data_removed()
+
     def add_edge_data(self,
                       dataframe,
                       vertex_col_names,
@@ -546,35 +934,43 @@ class EXPERIMENTAL__PropertyGraph:
                                 "the PropertyGraph was already initialized "
                                 f"using type {self.__dataframe_type}")
 
-        # Clear the cached value for num_vertices since more could be added in
-        # this method. This method cannot affect __node_type_value_counts
-        self.__num_vertices = None
+        # This method cannot affect __node_type_value_counts
         self.__edge_type_value_counts = None  # Could update instead
+        self.__edge_type_index = None
+        self.__data_version += 1
+        self.__remove_cached_subgraphs()
 
         default_edge_columns = [self.src_col_name,
                                 self.dst_col_name,
                                 self.edge_id_col_name,
                                 self.type_col_name]
-        if self.__edge_prop_dataframe is None:
-            self.__edge_prop_dataframe = \
-                self.__dataframe_type(columns=default_edge_columns)
-            # Initialize the new columns to the same dtype as the appropriate
-            # column in the incoming dataframe, since the initial merge may not
-            # result in the same dtype. (see
-            # https://github.com/rapidsai/cudf/issues/9981)
-            self.__edge_prop_dataframe = self.__update_dataframe_dtypes(
-                self.__edge_prop_dataframe,
-                {self.src_col_name: dataframe[vertex_col_names[0]].dtype,
-                 self.dst_col_name: dataframe[vertex_col_names[1]].dtype,
-                 self.edge_id_col_name: "Int64"})
 
-        # NOTE: This copies the incoming DataFrame in order to add the new
-        # columns. The copied DataFrame is then merged (another copy) and then
-        # deleted when out-of-scope.
-        tmp_df = dataframe.copy(deep=True)
-        tmp_df[self.src_col_name] = tmp_df[vertex_col_names[0]]
-        tmp_df[self.dst_col_name] = tmp_df[vertex_col_names[1]]
-        tmp_df[self.type_col_name] = type_name
+        # NOTE: This copies only the columns to be added from the incoming
+        # DataFrame. Since new edges always have new edge IDs and cannot match
+        # existing edges, the copy is not merged with the existing edge data
+        # here but appended later, along with all other pending edge data, in
+        # a single concat (see __append_edge_prop_chunks()).
+        if property_columns:
+            prop_col_names = property_columns
+        else:
+            prop_col_names = [col for col in dataframe.columns
+                              if col not in vertex_col_names]
+        tmp_df = self.__dataframe_type(
+            dict([(self.src_col_name, dataframe[vertex_col_names[0]]),
+                  (self.dst_col_name, dataframe[vertex_col_names[1]])] +
+                 [(col, dataframe[col]) for col in prop_col_names]))
+        tmp_df = self.__convert_property_dtypes(tmp_df,
+                                                default_edge_columns)
+        if type_name not in self.__type_names:
+            self.__type_names.append(type_name)
+        if not self.__per_type_storage:
+            tmp_df[self.type_col_name] = type_name
+            tmp_df[self.type_col_name] = \
+                tmp_df[self.type_col_name].astype(self.__get_type_dtype())
+        # Row labels are used as row positions when looking up edge IDs
+        tmp_df.reset_index(drop=True, inplace=True)
+        self.__new_vertex_id_sers += [tmp_df[self.src_col_name],
+                                      tmp_df[self.dst_col_name]]
 
         # Add unique edge IDs to the new rows. This is just a count for each
         # row starting from the last edge ID value, with initial edge ID 0.
@@ -587,48 +983,60 @@ class EXPERIMENTAL__PropertyGraph:
         )
         self.__last_edge_id = starting_eid + len(tmp_df.index)
 
-        if property_columns:
-            # all columns
-            column_names_to_drop = set(tmp_df.columns)
-            # remove the ones to keep
-            column_names_to_drop.difference_update(property_columns +
-                                                   default_edge_columns)
-        else:
-            column_names_to_drop = {vertex_col_names[0], vertex_col_names[1]}
-        tmp_df.drop(labels=column_names_to_drop, axis=1, inplace=True)
-
         # Save the original dtypes for each new column so they can be restored
         # prior to constructing subgraphs (since column dtypes may get altered
-        # during merge to accommodate NaN values).
-        new_col_info = self.__get_new_column_dtypes(
-            tmp_df, self.__edge_prop_dataframe)
-        self.__edge_prop_dtypes.update(new_col_info)
-
-        self.__edge_prop_dataframe = \
-            self.__edge_prop_dataframe.merge(tmp_df, how="outer")
+        # during concat to accommodate NaN values).
+        self.__edge_prop_dtypes.update(
+            self.__get_new_prop_column_dtypes(
+                tmp_df, self.__edge_prop_dtypes, default_edge_columns))
 
-        # Update the vertex eval dict with the latest column instances
-        latest = dict([(n, self.__edge_prop_dataframe[n])
-                       for n in self.__edge_prop_dataframe.columns])
-        self.__edge_prop_eval_dict.update(latest)
+        self.__edge_prop_chunks.append((type_name, tmp_df))
+        if self.__per_type_storage:
+            # The DataFrame of all edge properties and the eval dict are
+            # recreated from the per-type DataFrames when needed.
+            self.__edge_prop_dataframe = None
 
     def get_edge_data(self, edge_ids=None, types=None, columns=None):
         """
         Return a dataframe containing edge properties for only the specified
         edge_ids, columns, and/or edge type, or all edge IDs if not specified.
         """
+        self.__append_edge_prop_chunks()
+        if self.__per_type_storage:
+            if not self.__edge_prop_dataframes:
+                return None
+            df = self.__get_type_dataframes_data(
+                self.__edge_prop_dataframes,
+                self.__get_type_edge_id_index,
+                edge_ids,
+                types,
+                [self.src_col_name, self.dst_col_name,
+                 self.edge_id_col_name, self.type_col_name],
+                self.edge_property_names if columns is None else columns)
+            # Return edges in the order they were added, as is done when all
+            # properties are stored in a single DataFrame.
+            return df.sort_values(self.edge_id_col_name, ignore_index=True)
+
         if self.__edge_prop_dataframe is not None:
             if edge_ids is not None:
-                df_mask = self.__edge_prop_dataframe[self.edge_id_col_name]\
-                              .isin(edge_ids)
-                df = self.__edge_prop_dataframe.loc[df_mask]
+                # The edge ID column is sorted and can be used as the index
+                df = self.__edge_prop_dataframe.take(
+                    self.__find_id_positions(
+                        self.__edge_prop_dataframe[self.edge_id_col_name],
+                        edge_ids))
+                if types is not None:
+                    # FIXME: coerce types to a list-like if not?
+                    df_mask = df[self.type_col_name].isin(types)
+                    df = df.loc[df_mask]
+            elif types is not None:
+                if self.__edge_type_index is None:
+                    self.__edge_type_index = \
+                        self.__create_type_index(self.__edge_prop_dataframe)
+                df = self.__edge_prop_dataframe.loc[
+                    self.__get_type_rows(self.__edge_type_index, types)]
             else:
                 df = self.__edge_prop_dataframe
-
-            if types is not None:
-                # FIXME: coerce types to a list-like if not?
-                df_mask = df[self.type_col_name].isin(types)
-                df = df.loc[df_mask]
+            df = self.__update_type_dtype(df)
 
             # The "internal" src, dst, edge_id, and type columns are also
             # included/added since they are assumed to be needed by the caller.
@@ -647,6 +1055,100 @@ class EXPERIMENTAL__PropertyGraph:
 
         return None
 
+    def update_edge_data(self,
+                         dataframe,
+                         edge_id_col_name,
+                         property_columns=None):
+        """
+        Set the properties of the edges in dataframe to the values in
+        dataframe. The values are overwritten in place, which only touches the
+        rows of the edges in dataframe.
+
+        Parameters
+        ----------
+        dataframe : DataFrame-compatible instance
+            A DataFrame instance with a compatible Pandas-like DataFrame
+            interface, of the same type as the data already added.
+        edge_id_col_name : string
+            The column name that contains the edge IDs. All edge IDs must be
+            present in the PropertyGraph. If an edge ID is present more than
+            once, the last row is used.
+        property_columns : list of strings
+            List of column names in dataframe containing the properties to
+            set. All other columns in dataframe will be ignored. If not
+            specified, all columns in dataframe are used. Properties that are
+            not present are added, with NA values for all other edges.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        PropertyGraph.add_edge_data
+        PropertyGraph.remove_edges
+        """
+        (updates, property_columns) = self.__get_updates(
+            dataframe, edge_id_col_name, None, property_columns,
+            [self.src_col_name, self.dst_col_name, self.edge_id_col_name,
+             self.type_col_name])
+        edge_ids = updates[edge_id_col_name]
+
+        self.__append_edge_prop_chunks()
+        # Edges are stored sorted by edge ID, so the edge ID column can be
+        # used as the index.
+        if self.__per_type_storage:
+            edge_prop_dfs = list(self.__edge_prop_dataframes.values())
+        elif self.__edge_prop_dataframe is not None:
+            edge_prop_dfs = [self.__edge_prop_dataframe]
+        else:
+            edge_prop_dfs = []
+        positions = [self.__find_id_positions(df[self.edge_id_col_name],
+                                              edge_ids)
+                     for df in edge_prop_dfs]
+        num_missing = len(updates) - sum(len(p) for p in positions)
+        if num_missing > 0:
+            raise ValueError(f"{num_missing} edge ID(s) in {edge_id_col_name} "
+                             "are not present")
+
+        for (df, df_positions) in zip(edge_prop_dfs, positions):
+            self.__update_rows(df, df_positions, self.edge_id_col_name,
+                               updates, edge_id_col_name, property_columns)
+        if self.__per_type_storage:
+            self.__edge_prop_dataframe = None
+        elif edge_prop_dfs:
+            self.__edge_prop_eval_dict.update(
+                dict([(n, edge_prop_dfs[0][n]) for n in property_columns]))
+
+        self.__edge_prop_dtypes.update(
+            self.__get_new_prop_column_dtypes(
+                updates[property_columns], self.__edge_prop_dtypes, []))
+        self.__data_version += 1
+        self.__remove_cached_subgraphs()
+
+    def remove_edges(self, edge_ids):
+        """
+        Remove the data for the edges in edge_ids. Vertices that are then no
+        longer in the vertex or edge data are removed from the PropertyGraph.
+
+        Parameters
+        ----------
+        edge_ids : Series or array-like
+            The IDs of the edges to remove. IDs that are not present are
+            ignored.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        PropertyGraph.remove_vertices
+        """
+        self.__remove_edges(lambda df: self.__find_id_positions(
+            df[self.edge_id_col_name], edge_ids))
+        self.__data_removed()
+
     def select_vertices(self, expr, from_previous_selection=None):
         """
         Evaluate expr and return a PropertySelection object representing the
@@ -669,47 +1171,69 @@ class EXPERIMENTAL__PropertyGraph:
         PropertySelection instance to be used for calls to extract_subgraph()
         in order to construct a Graph containing only specific vertices.
 
+        Notes
+        -----
+        Vertices that do not have a value for a property (eg. vertices of
+        types without that property) are never selected by a comparison using
+        that property, including negated comparisons such as "prop != 1" and
+        "~(prop == 1)". Use "prop.isna()" to select them.
+
         Examples
         --------
         >>>
         """
         # FIXME: check types
+        vertex_prop_dataframe = self.__get_vertex_prop_dataframe()
 
         # Check if the expr is to be evaluated in the context of properties
         # from only the previously selected vertices (as opposed to all
         # properties from all vertices)
         if (from_previous_selection is not None) and \
            (from_previous_selection.vertex_selections is not None):
-            previously_selected_rows = self.__vertex_prop_dataframe[
+            previously_selected_rows = vertex_prop_dataframe[
                 from_previous_selection.vertex_selections]
             verts_from_previously_selected_rows = \
                 previously_selected_rows[self.vertex_col_name]
             # get all the rows from the entire __vertex_prop_dataframe that
             # contain those verts
-            rows_with_verts = \
-                self.__vertex_prop_dataframe[self.vertex_col_name]\
-                    .isin(verts_from_previously_selected_rows)
-            rows_to_eval = self.__vertex_prop_dataframe[rows_with_verts]
+            rows_with_verts = vertex_prop_dataframe[
+                self.vertex_col_name].isin(verts_from_previously_selected_rows)
+            rows_to_eval = vertex_prop_dataframe[rows_with_verts]
             locals = dict([(n, rows_to_eval[n])
                            for n in rows_to_eval.columns])
+            (selected_col, normalized_expr) = \
+                self.__evaluate_selection(expr, locals)
+            previous_key = from_previous_selection.vertex_selection_key
+            if (previous_key is None) or \
+               (previous_key[0] != self.__data_version):
+                selection_key = None
+            else:
+                selection_key = (self.__data_version, normalized_expr,
+                                 previous_key)
         else:
-            locals = self.__vertex_prop_eval_dict
-
-        globals = {}
-        selected_col = eval(expr, globals, locals)
-
-        num_rows = len(self.__vertex_prop_dataframe)
+            if (vertex_prop_dataframe is not None) and \
+               (self.__vertex_type_index is None):
+                self.__vertex_type_index = \
+                    self.__create_type_index(vertex_prop_dataframe)
+            (selected_col, normalized_expr) = self.__evaluate_selection(
+                expr, self.__vertex_prop_eval_dict,
+                vertex_prop_dataframe, self.__vertex_type_index)
+            selection_key = (self.__data_version, normalized_expr)
+
+        num_rows = len(vertex_prop_dataframe)
         # Ensure the column is the same size as the DataFrame, then replace any
         # NA values with False to represent rows that should not be selected.
         # This ensures the selected column can be applied to the entire
         # __vertex_prop_dataframe to determine which rows to use when creating
-        # a Graph from a query.
+        # a Graph from a query. NA values are also the result of comparisons
+        # of missing property values.
         if num_rows != len(selected_col):
             selected_col = selected_col.reindex(range(num_rows), copy=False)
-            selected_col.fillna(False, inplace=True)
+        selected_col = selected_col.fillna(False)
 
         return EXPERIMENTAL__PropertySelection(
-            vertex_selection_series=selected_col)
+            vertex_selection_series=selected_col,
+            vertex_selection_key=selection_key)
 
     def select_edges(self, expr):
         """
@@ -727,17 +1251,39 @@ class EXPERIMENTAL__PropertyGraph:
         PropertySelection instance to be used for calls to extract_subgraph()
         in order to construct a Graph containing only specific edges.
 
+        Notes
+        -----
+        As for select_vertices(), edges without a value for a property are not
+        selected by any comparison using that property.
+
         Examples
         --------
         >>>
         """
         # FIXME: check types
-        globals = {}
-        locals = self.__edge_prop_eval_dict
+        # Ensure the eval dict is up to date with all edge properties
+        edge_prop_dataframe = self.__get_edge_prop_dataframe()
+        if (edge_prop_dataframe is not None) and \
+           (self.__edge_type_index is None):
+            self.__edge_type_index = \
+                self.__create_type_index(edge_prop_dataframe)
+
+        (selected_col, normalized_expr) = self.__evaluate_selection(
+            expr, self.__edge_prop_eval_dict,
+            edge_prop_dataframe, self.__edge_type_index)
+
+        # Ensure the column is the same size as the DataFrame, since only the
+        # rows of specific types may have been evaluated, and that rows
+        # with NA values (including missing property values) are not
+        # selected.
+        num_rows = len(edge_prop_dataframe)
+        if num_rows != len(selected_col):
+            selected_col = selected_col.reindex(range(num_rows), copy=False)
+        selected_col = selected_col.fillna(False)
 
-        selected_col = eval(expr, globals, locals)
         return EXPERIMENTAL__PropertySelection(
-            edge_selection_series=selected_col)
+            edge_selection_series=selected_col,
+            edge_selection_key=(self.__data_version, normalized_expr))
 
     def extract_subgraph(self,
                          create_using=None,
@@ -788,6 +1334,14 @@ class EXPERIMENTAL__PropertyGraph:
         vertices and edges resulting from applying the selection to the set of
         vertex and edge property data.
 
+        Notes
+        -----
+        If subgraph_cache_size was set when creating this PropertyGraph, the
+        returned Graph is cached (see subgraph_cache_info()), and the same
+        Graph instance is returned by subsequent calls using equivalent
+        selection expressions and the same arguments until data is added to
+        this PropertyGraph. The returned Graph should then not be modified.
+
         Examples
         --------
         >>>
@@ -797,33 +1351,54 @@ class EXPERIMENTAL__PropertyGraph:
             raise TypeError("selection must be an instance of "
                             f"PropertySelection, got {type(selection)}")
 
+        cache_key = self.__get_subgraph_cache_key(
+            create_using, selection, edge_weight_property,
+            default_edge_weight, allow_multi_edges, renumber_graph,
+            add_edge_data)
+        if cache_key is not None:
+            with self.__subgraph_cache_lock:
+                G = self.__subgraph_cache.get(cache_key)
+                if G is not None:
+                    self.__subgraph_cache.move_to_end(cache_key)
+                    self.__subgraph_cache_hits += 1
+                    return G
+                self.__subgraph_cache_misses += 1
+
         # NOTE: the expressions passed in to extract specific edges and
         # vertices assume the original dtypes in the user input have been
-        # preserved. However, merge operations on the DataFrames can change
-        # dtypes (eg. int64 to float64 in order to add NaN entries). This
-        # should not be a problem since the conversions do not change the
-        # values.
+        # preserved. Integer and boolean properties are stored using nullable
+        # dtypes so that merge operations on the DataFrames do not need to
+        # change them (eg. int64 to float64 in order to add NaN entries).
         if (selection is not None) and \
            (selection.vertex_selections is not None):
-            selected_vertex_dataframe = \
-                self.__vertex_prop_dataframe[selection.vertex_selections]
+            selected_verts = self.__get_vertex_prop_dataframe().loc[
+                selection.vertex_selections, self.vertex_col_name]
         else:
-            selected_vertex_dataframe = None
+            selected_verts = None
 
+        # Only the columns used by the Graph (and its edge_data, if added) are
+        # selected, so the other edge properties are never copied.
+        edge_prop_dataframe = self.__get_edge_prop_dataframe()
+        columns = [self.src_col_name, self.dst_col_name]
+        if add_edge_data:
+            columns.append(self.edge_id_col_name)
+        # An edge_weight_property that is not an edge property is reported by
+        # edge_props_to_graph()
+        if (edge_weight_property is not None) and \
+           (edge_weight_property in edge_prop_dataframe.columns) and \
+           (edge_weight_property not in columns):
+            columns.append(edge_weight_property)
+        selected_edge_dataframe = edge_prop_dataframe[columns]
         if (selection is not None) and \
            (selection.edge_selections is not None):
             selected_edge_dataframe = \
-                self.__edge_prop_dataframe[selection.edge_selections]
-        else:
-            selected_edge_dataframe = self.__edge_prop_dataframe
+                selected_edge_dataframe[selection.edge_selections]
 
         # FIXME: check that self.__edge_prop_dataframe is set!
 
         # If vertices were specified, select only the edges that contain the
         # selected verts in both src and dst
-        if (selected_vertex_dataframe is not None) and \
-           not(selected_vertex_dataframe.empty):
-            selected_verts = selected_vertex_dataframe[self.vertex_col_name]
+        if (selected_verts is not None) and not(selected_verts.empty):
             has_srcs = selected_edge_dataframe[self.src_col_name]\
                 .isin(selected_verts)
             has_dsts = selected_edge_dataframe[self.dst_col_name]\
@@ -832,18 +1407,23 @@ class EXPERIMENTAL__PropertyGraph:
         else:
             edges = selected_edge_dataframe
 
-        # The __*_prop_dataframes have likely been merged several times and
-        # possibly had their dtypes converted in order to accommodate NaN
-        # values. Restore the original dtypes in the resulting edges df prior
-        # to creating a Graph.
-        edges = self.__update_dataframe_dtypes(edges, self.__edge_prop_dtypes)
+        # The __*_prop_dataframes have likely been merged several times, which
+        # can convert the dtypes of columns that were not stored using
+        # nullable dtypes (eg. by a PropertyGraph saved before they were) in
+        # order to accommodate NaN values. Restore the original dtypes in the
+        # resulting edges df prior to creating a Graph, which does not copy
+        # columns that already have their original dtype.
+        edges = self.__update_dataframe_dtypes(
+            edges, dict([(col, self.__edge_prop_dtypes[col])
+                         for col in columns
+                         if col in self.__edge_prop_dtypes]))
 
         # Default create_using set here instead of function signature to
         # prevent cugraph from running on import. This may help diagnose errors
         if create_using is None:
             create_using = cugraph.Graph(directed=True)
 
-        return self.edge_props_to_graph(
+        G = self.edge_props_to_graph(
             edges,
             create_using=create_using,
             edge_weight_property=edge_weight_property,
@@ -852,6 +1432,54 @@ class EXPERIMENTAL__PropertyGraph:
             renumber_graph=renumber_graph,
             add_edge_data=add_edge_data)
 
+        if cache_key is not None:
+            with self.__subgraph_cache_lock:
+                self.__subgraph_cache[cache_key] = G
+                num_removed = max(0, len(self.__subgraph_cache) -
+                                  self.__subgraph_cache_size)
+                for _ in range(num_removed):
+                    self.__subgraph_cache.popitem(last=False)
+        return G
+
+    def subgraph_cache_info(self):
+        """
+        Return a dictionary of statistics for the cache of Graphs returned by
+        extract_subgraph().
+
+        Returns
+        -------
+        dict with the following keys:
+            "hits": number of extract_subgraph() calls that returned a cached
+                    Graph
+            "misses": number of extract_subgraph() calls that created and
+                      cached a new Graph
+            "maxsize": maximum number of cached Graphs
+            "currsize": current number of cached Graphs
+
+        Examples
+        --------
+        >>> import cugraph
+        >>> from cugraph.experimental import PropertyGraph
+        >>> pG = PropertyGraph(subgraph_cache_size=8)
+        >>> pG.subgraph_cache_info()
+        {'hits': 0, 'misses': 0, 'maxsize': 8, 'currsize': 0}
+        """
+        with self.__subgraph_cache_lock:
+            return {"hits": self.__subgraph_cache_hits,
+                    "misses": self.__subgraph_cache_misses,
+                    "maxsize": self.__subgraph_cache_size,
+                    "currsize": len(self.__subgraph_cache)}
+
+    def clear_subgraph_cache(self):
+        """
+        Remove all Graphs cached by extract_subgraph() and reset the
+        statistics returned by subgraph_cache_info().
+        """
+        with self.__subgraph_cache_lock:
+            self.__subgraph_cache.clear()
+            self.__subgraph_cache_hits = 0
+            self.__subgraph_cache_misses = 0
+
     def annotate_dataframe(self, df, G, edge_vertex_col_names):
         """
         Add properties to df that represent the vertices and edges in graph G.
@@ -896,7 +1524,7 @@ class EXPERIMENTAL__PropertyGraph:
         # New result includes only properties from the src/dst edges identified
         # by edge IDs. All other data in df is merged based on src/dst values.
         # NOTE: results from MultiGraph graphs will have to include edge IDs!
-        edge_props_df = edge_info_df.merge(self.__edge_prop_dataframe,
+        edge_props_df = edge_info_df.merge(self.__get_edge_prop_dataframe(),
                                            how="inner")
 
         # FIXME: also allow edge ID col to be passed in and renamed.
@@ -948,26 +1576,32 @@ class EXPERIMENTAL__PropertyGraph:
                                      "contains NA values in the subgraph and "
                                      "default_edge_weight is not set")
                 else:
-                    prop_col.fillna(default_edge_weight, inplace=True)
+                    # edge_prop_df may be (or be a view of) the edge property
+                    # DataFrame, so columns are only set on a shallow copy.
+                    edge_prop_df = edge_prop_df.copy(deep=False)
+                    edge_prop_df[edge_weight_property] = \
+                        prop_col.fillna(default_edge_weight)
             edge_attr = edge_weight_property
 
         # If a default_edge_weight was specified but an edge_weight_property
         # was not, a new edge weight column must be added.
         elif default_edge_weight:
             edge_attr = self.weight_col_name
+            edge_prop_df = edge_prop_df.copy(deep=False)
             edge_prop_df[edge_attr] = default_edge_weight
         else:
             edge_attr = None
 
-        # Set up the new Graph to return
-        if isinstance(create_using, cugraph.Graph):
-            # FIXME: extract more attrs from the create_using instance
-            attrs = {"directed": create_using.is_directed()}
-            G = type(create_using)(**attrs)
+        # Set up the new Graph to return. Types are checked first since
+        # cugraph.Graph is not available without cuDF.
         # FIXME: this allows anything to be instantiated does not check that
         # the type is a valid Graph type.
-        elif type(create_using) is type(type):
+        if type(create_using) is type(type):
             G = create_using()
+        elif isinstance(create_using, cugraph.Graph):
+            # FIXME: extract more attrs from the create_using instance
+            attrs = {"directed": create_using.is_directed()}
+            G = type(create_using)(**attrs)
         else:
             raise TypeError("create_using must be a cugraph.Graph "
                             "(or subclass) type or instance, got: "
@@ -1010,6 +1644,213 @@ class EXPERIMENTAL__PropertyGraph:
 
         return G
 
+    def save(self, path):
+        """
+        Save the vertex and edge data of the PropertyGraph to the directory
+        path, which is created if it does not exist, as Parquet files and a
+        JSON metadata file. The saved PropertyGraph can be recreated using
+        load() without adding the data again.
+
+        Parameters
+        ----------
+        path : string
+            The directory to save the data to. Existing files written by a
+            prior call to save() are overwritten.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        PropertyGraph.load
+
+        Examples
+        --------
+        >>>
+        """
+        self.__append_edge_prop_chunks()
+        os.makedirs(path, exist_ok=True)
+
+        if self.__per_type_storage:
+            vertex_dfs = self.__vertex_prop_dataframes
+            edge_dfs = self.__edge_prop_dataframes
+        else:
+            vertex_dfs = {}
+            edge_dfs = {}
+            if self.__vertex_prop_dataframe is not None:
+                vertex_dfs[None] = self.__vertex_prop_dataframe
+            if self.__edge_prop_dataframe is not None:
+                edge_dfs[None] = self.__edge_prop_dataframe
+
+        def save_dfs(dfs, prefix):
+            file_info = []
+            for (i, (type_name, df)) in enumerate(dfs.items()):
+                # Do not save the "internal" weight column that may have been
+                # added by edge_props_to_graph()
+                if self.weight_col_name in df.columns:
+                    df = df.drop(columns=[self.weight_col_name])
+                file_name = f"{prefix}_{i}.parquet"
+                df.to_parquet(os.path.join(path, file_name), index=False)
+                file_info.append({"type_name": type_name,
+                                  "file_name": file_name,
+                                  "columns": list(df.columns)})
+            return file_info
+
+        if self.__dataframe_type is cudf.DataFrame:
+            dataframe_type = "cudf"
+        elif self.__dataframe_type is None:
+            dataframe_type = None
+        else:
+            dataframe_type = "pandas"
+
+        metadata = {
+            "format_version": self._save_format_version,
+            "dataframe_type": dataframe_type,
+            "per_type_storage": self.__per_type_storage,
+            "categorical_string_properties":
+                self.__categorical_string_properties,
+            "type_names": self.__type_names,
+            "last_edge_id": self.__last_edge_id,
+            "vertex_prop_dtypes": dict(
+                [(col, str(dtype))
+                 for (col, dtype) in self.__vertex_prop_dtypes.items()]),
+            "edge_prop_dtypes": dict(
+                [(col, str(dtype))
+                 for (col, dtype) in self.__edge_prop_dtypes.items()]),
+            "vertex_data": save_dfs(vertex_dfs, "vertex_data"),
+            "edge_data": save_dfs(edge_dfs, "edge_data"),
+        }
+        with open(os.path.join(path, self._metadata_file_name), "w") as f:
+            json.dump(metadata, f, indent=2)
+
+    @classmethod
+    def load(cls,
+             path,
+             vertex_property_columns=None,
+             edge_property_columns=None):
+        """
+        Return a new PropertyGraph containing the vertex and edge data saved
+        to the directory path by a prior call to save().
+
+        Parameters
+        ----------
+        path : string
+            The directory the PropertyGraph was saved to.
+        vertex_property_columns : list of strings, optional
+            List of vertex property names to load. Only the data for these
+            properties is read, other properties are not present in the
+            returned PropertyGraph. If not specified, all vertex properties are
+            loaded.
+        edge_property_columns : list of strings, optional
+            List of edge property names to load. If not specified, all edge
+            properties are loaded.
+
+        Returns
+        -------
+        PropertyGraph instance
+
+        See Also
+        --------
+        PropertyGraph.save
+
+        Examples
+        --------
+        >>>
+        """
+        with open(os.path.join(path, cls._metadata_file_name)) as f:
+            metadata = json.load(f)
+        if metadata["format_version"] != cls._save_format_version:
+            raise ValueError(f"{path} contains a PropertyGraph saved using "
+                             f"format version {metadata['format_version']}, "
+                             f"expected {cls._save_format_version}")
+
+        pG = cls(per_type_storage=metadata["per_type_storage"],
+                 categorical_string_properties=metadata.get(
+                     "categorical_string_properties", False))
+        if metadata["dataframe_type"] == "cudf":
+            pG.__dataframe_type = cudf.DataFrame
+            pG.__series_type = cudf.Series
+        elif metadata["dataframe_type"] == "pandas":
+            pG.__dataframe_type = pd.DataFrame
+            pG.__series_type = pd.Series
+        pG.__last_edge_id = metadata["last_edge_id"]
+
+        def load_dfs(file_info, default_columns, property_columns):
+            dfs = {}
+            loaded_columns = set()
+            for info in file_info:
+                columns = [col for col in info["columns"]
+                           if (col in default_columns) or
+                           (property_columns is None) or
+                           (col in property_columns)]
+                dfs[info["type_name"]] = pG.__read_parquet(
+                    os.path.join(path, info["file_name"]), columns)
+                loaded_columns.update(columns)
+            if property_columns is not None:
+                invalid_columns = \
+                    set(property_columns).difference(loaded_columns)
+                if invalid_columns:
+                    raise ValueError("property_columns contains column(s) "
+                                     f"not found in {path}: "
+                                     f"{list(invalid_columns)}")
+            return (dfs, loaded_columns)
+
+        def load_dtypes(dtypes, loaded_columns):
+            return dict([(col, pd.api.types.pandas_dtype(dtype))
+                         for (col, dtype) in dtypes.items()
+                         if col in loaded_columns])
+
+        (vertex_dfs, vertex_columns) = load_dfs(
+            metadata["vertex_data"],
+            [cls.vertex_col_name, cls.type_col_name],
+            vertex_property_columns)
+        (edge_dfs, edge_columns) = load_dfs(
+            metadata["edge_data"],
+            [cls.src_col_name, cls.dst_col_name, cls.edge_id_col_name,
+             cls.type_col_name],
+            edge_property_columns)
+        pG.__vertex_prop_dtypes = load_dtypes(
+            metadata["vertex_prop_dtypes"], vertex_columns)
+        pG.__edge_prop_dtypes = load_dtypes(
+            metadata["edge_prop_dtypes"], edge_columns)
+
+        # Type names are not in the metadata of PropertyGraphs saved before
+        # the type column was categorical.
+        if "type_names" in metadata:
+            pG.__type_names = metadata["type_names"]
+        elif pG.__per_type_storage:
+            pG.__type_names = list(dict.fromkeys(list(vertex_dfs) +
+                                                 list(edge_dfs)))
+        else:
+            pG.__type_names = list(dict.fromkeys(
+                type_name for df in list(vertex_dfs.values()) +
+                list(edge_dfs.values())
+                for type_name in pG.__get_categories(df[cls.type_col_name])))
+
+        if pG.__per_type_storage:
+            pG.__vertex_prop_dataframes = vertex_dfs
+            pG.__edge_prop_dataframes = edge_dfs
+        else:
+            for dfs in [vertex_dfs, edge_dfs]:
+                if None in dfs:
+                    dfs[None][cls.type_col_name] = \
+                        dfs[None][cls.type_col_name].astype(
+                            pG.__get_type_dtype())
+            if None in vertex_dfs:
+                pG.__vertex_prop_dataframe = vertex_dfs[None]
+                pG.__vertex_prop_eval_dict = dict(
+                    [(n, pG.__vertex_prop_dataframe[n])
+                     for n in pG.__vertex_prop_dataframe.columns])
+            if None in edge_dfs:
+                pG.__edge_prop_dataframe = edge_dfs[None]
+                pG.__edge_prop_eval_dict = dict(
+                    [(n, pG.__edge_prop_dataframe[n])
+                     for n in pG.__edge_prop_dataframe.columns])
+        pG.__new_vertex_id_sers = pG.__get_all_vertices_series()
+
+        return pG
+
     @classmethod
     def has_duplicate_edges(cls, df):
         """
@@ -1043,6 +1884,15 @@ class EXPERIMENTAL__PropertyGraph:
         Return a list of all Series objects that contain vertices from all
         tables.
         """
+        self.__append_edge_prop_chunks()
+        if self.__per_type_storage:
+            vert_sers = [df[self.vertex_col_name] for df in
+                         self.__vertex_prop_dataframes.values()]
+            for df in self.__edge_prop_dataframes.values():
+                vert_sers.append(df[self.src_col_name])
+                vert_sers.append(df[self.dst_col_name])
+            return vert_sers
+
         vpd = self.__vertex_prop_dataframe
         epd = self.__edge_prop_dataframe
         vert_sers = []
@@ -1053,6 +1903,689 @@ class EXPERIMENTAL__PropertyGraph:
             vert_sers.append(epd[self.dst_col_name])
         return vert_sers
 
+    def __get_vertex_ids(self):
+        """
+        Return the sorted Series of the distinct IDs of all vertices, first
+        merging in the IDs of vertices added since it was last updated, or
+        None if there are no vertices.
+        """
+        if self.__new_vertex_id_sers:
+            new_ids = self.__concat(self.__new_vertex_id_sers,
+                                    ignore_index=True)
+            new_ids = new_ids.drop_duplicates().sort_values(ignore_index=True)
+            if self.__vertex_ids is None:
+                self.__vertex_ids = new_ids
+            else:
+                self.__vertex_ids = self.__merge_sorted_ids(self.__vertex_ids,
+                                                            new_ids)
+            self.__new_vertex_id_sers = []
+        return self.__vertex_ids
+
+    def __merge_sorted_ids(self, ids, new_ids):
+        """
+        Return a sorted Series of the distinct values in the ids and new_ids
+        Series, which are each sorted and distinct. For numeric IDs this costs
+        a binary search of ids for each new ID and a single pass over the
+        result, rather than sorting all IDs again.
+        """
+        if not all(isinstance(ser.dtype, np.dtype) and
+                   (ser.dtype.kind in "iuf") for ser in [ids, new_ids]):
+            # FIXME: support merging non-numeric and nullable IDs without
+            # sorting
+            merged = self.__concat([ids, new_ids], ignore_index=True)
+            return merged.drop_duplicates().sort_values(ignore_index=True)
+
+        xp = cp if self.__series_type is cudf.Series else np
+        old = xp.asarray(ids.values)
+        new = xp.asarray(new_ids.values)
+        # Drop the new IDs which are already present
+        positions = xp.searchsorted(old, new)
+        present = positions < len(old)
+        present[present] = old[positions[present]] == new[present]
+        new = new[~present]
+        positions = positions[~present]
+        # Each new ID goes before the old IDs at and after its search
+        # position, and after the new IDs before it.
+        merged = xp.empty(len(old) + len(new),
+                          dtype=xp.result_type(old, new))
+        is_old = xp.ones(len(merged), dtype=bool)
+        new_positions = positions + xp.arange(len(new))
+        merged[new_positions] = new
+        is_old[new_positions] = False
+        merged[is_old] = old
+        return self.__series_type(merged, name=ids.name)
+
+    def __get_updates(self, dataframe, id_col_name, type_name,
+                      property_columns, default_columns):
+        """
+        Check the arguments of update_vertex_data() or update_edge_data() and
+        return a tuple of a DataFrame of the id_col_name and property_columns
+        columns of dataframe, sorted by ID with only the last row for each ID,
+        and the list of property column names.
+        """
+        if type(dataframe) not in _dataframe_types:
+            raise TypeError("dataframe must be one of the following types: "
+                            f"{_dataframe_types}, got: {type(dataframe)}")
+        if (self.__dataframe_type is not None) and \
+           (type(dataframe) is not self.__dataframe_type):
+            raise TypeError(f"dataframe is type {type(dataframe)} but the "
+                            "PropertyGraph was already initialized using "
+                            f"type {self.__dataframe_type}")
+        if id_col_name not in dataframe.columns:
+            raise ValueError(f"{id_col_name} is not a column in "
+                             f"dataframe: {dataframe.columns}")
+        if (type_name is not None) and not(isinstance(type_name, str)):
+            raise TypeError("type_name must be a string, got: "
+                            f"{type(type_name)}")
+        if property_columns:
+            if type(property_columns) is not list:
+                raise TypeError("property_columns must be a list, got: "
+                                f"{type(property_columns)}")
+            invalid_columns = \
+                set(property_columns).difference(dataframe.columns)
+            if invalid_columns:
+                raise ValueError("property_columns contains column(s) not "
+                                 "found in dataframe: "
+                                 f"{list(invalid_columns)}")
+        else:
+            property_columns = [col for col in dataframe.columns
+                                if col != id_col_name]
+
+        updates = dataframe[[id_col_name] + property_columns]
+        updates = updates.drop_duplicates(subset=[id_col_name], keep="last")
+        updates = updates.sort_values(id_col_name, ignore_index=True)
+        updates = self.__convert_property_dtypes(
+            updates, [id_col_name] + default_columns)
+        return (updates, property_columns)
+
+    def __update_rows(self, df, positions, id_col_name, updates,
+                      updates_id_col_name, columns):
+        """
+        Set the columns of the rows of df at positions, in place, to the
+        values in the row of updates with the same ID, where id_col_name is
+        the ID column of df and updates_id_col_name is the ID column of
+        updates, which must be sorted and unique. Columns that are not in df
+        are added with NA values for the other rows.
+        """
+        if len(positions) == 0:
+            return
+        # Categorical columns need the categories of both to set the values
+        cat_columns = [col for col in columns
+                       if (col in df.columns) and
+                       ("category" in [str(df[col].dtype),
+                                       str(updates[col].dtype)])]
+        if cat_columns:
+            cat_df = df[cat_columns]
+            (new_cat_df, updates) = \
+                self.__unify_categorical_columns([cat_df, updates])
+            if new_cat_df is not cat_df:
+                for col in cat_columns:
+                    df[col] = new_cat_df[col]
+
+        update_positions = updates[updates_id_col_name].searchsorted(
+            df[id_col_name].take(positions))
+        for col in columns:
+            values = updates[col].take(update_positions)
+            if col not in df.columns:
+                df[col] = updates[col].iloc[:0].reindex(df.index)
+            if self.__dataframe_type is not cudf.DataFrame:
+                # Pandas aligns Series values by row label, not position
+                values = values.array
+            df.iloc[positions, df.columns.get_loc(col)] = values
+
+    def __remove_rows(self, df, positions):
+        """
+        Return a DataFrame of the rows of df, except the rows at positions,
+        with the row labels reset to the row positions.
+        """
+        xp = cp if self.__series_type is cudf.Series else np
+        keep = xp.ones(len(df), dtype=bool)
+        keep[positions] = False
+        return df[keep].reset_index(drop=True)
+
+    def __remove_edges(self, get_positions):
+        """
+        Remove the rows at the positions returned by get_positions(df) from
+        each edge property DataFrame df.
+        """
+        self.__append_edge_prop_chunks()
+        if self.__per_type_storage:
+            for (t, df) in list(self.__edge_prop_dataframes.items()):
+                positions = get_positions(df)
+                if len(positions) == 0:
+                    continue
+                df = self.__remove_rows(df, positions)
+                if len(df) > 0:
+                    self.__edge_prop_dataframes[t] = df
+                else:
+                    del self.__edge_prop_dataframes[t]
+            self.__edge_prop_dataframe = None
+            self.__edge_prop_eval_dict = {}
+            self.__edge_type_index = None
+        elif self.__edge_prop_dataframe is not None:
+            positions = get_positions(self.__edge_prop_dataframe)
+            if len(positions) == 0:
+                return
+            df = self.__remove_rows(self.__edge_prop_dataframe, positions)
+            self.__edge_prop_dataframe = df
+            self.__edge_prop_eval_dict = dict([(n, df[n])
+                                               for n in df.columns])
+            self.__edge_type_index = None
+        self.__edge_type_value_counts = None
+
+    def __data_removed(self):
+        """
+        Reset the cached values that depend on the vertex or edge data after
+        data was removed.
+        """
+        # The distinct vertex IDs are found again from the remaining data
+        self.__vertex_ids = None
+        self.__new_vertex_id_sers = self.__get_all_vertices_series()
+        self.__data_version += 1
+        self.__remove_cached_subgraphs()
+
+    def __remove_cached_subgraphs(self):
+        """
+        Remove all Graphs cached by extract_subgraph(), which is done when
+        data is added, updated, or removed.
+        """
+        with self.__subgraph_cache_lock:
+            self.__subgraph_cache.clear()
+
+    def __get_subgraph_cache_key(self, create_using, selection,
+                                 edge_weight_property, default_edge_weight,
+                                 allow_multi_edges, renumber_graph,
+                                 add_edge_data):
+        """
+        Return the key used for caching the Graph returned by
+        extract_subgraph() called with the arguments passed in, or None if
+        the Graph cannot be cached.
+        """
+        if self.__subgraph_cache_size <= 0:
+            return None
+
+        if selection is None:
+            selection_key = (None, None)
+        else:
+            # Selections not created from expressions (or created from
+            # selections that were not), or created prior to the most recent
+            # data being added, cannot be compared and are not cached. The
+            # first item of each selection key is the data version at the time
+            # the selection was made.
+            for (selected, key) in [
+                    (selection.vertex_selections,
+                     selection.vertex_selection_key),
+                    (selection.edge_selections,
+                     selection.edge_selection_key)]:
+                if (selected is not None) and \
+                   ((key is None) or (key[0] != self.__data_version)):
+                    return None
+            selection_key = (selection.vertex_selection_key,
+                             selection.edge_selection_key)
+
+        if create_using is None:
+            create_using_key = None
+        elif isinstance(create_using, type):
+            create_using_key = (create_using,)
+        elif hasattr(create_using, "is_directed"):
+            create_using_key = (type(create_using),
+                                create_using.is_directed())
+        else:
+            return None
+
+        try:
+            key = (self.__data_version, selection_key, create_using_key,
+                   edge_weight_property, default_edge_weight,
+                   allow_multi_edges, renumber_graph, add_edge_data)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __get_vertex_prop_dataframe(self):
+        """
+        Return the DataFrame containing the properties for all vertices,
+        creating it from the per-type DataFrames if necessary.
+        """
+        if self.__per_type_storage and \
+           (self.__vertex_prop_dataframe is None) and \
+           self.__vertex_prop_dataframes:
+            self.__vertex_prop_dataframe = self.__concat_type_dataframes(
+                self.__vertex_prop_dataframes,
+                [self.vertex_col_name, self.type_col_name])
+            self.__vertex_prop_eval_dict = dict(
+                [(n, self.__vertex_prop_dataframe[n])
+                 for n in self.__vertex_prop_dataframe.columns])
+        return self.__vertex_prop_dataframe
+
+    def __get_edge_prop_dataframe(self):
+        """
+        Return the DataFrame containing the properties for all edges, creating
+        it from the per-type DataFrames if necessary.
+        """
+        self.__append_edge_prop_chunks()
+        if self.__per_type_storage and \
+           (self.__edge_prop_dataframe is None) and \
+           self.__edge_prop_dataframes:
+            df = self.__concat_type_dataframes(
+                self.__edge_prop_dataframes,
+                [self.src_col_name, self.dst_col_name,
+                 self.edge_id_col_name, self.type_col_name])
+            self.__edge_prop_dataframe = df.sort_values(
+                self.edge_id_col_name, ignore_index=True)
+            self.__edge_prop_eval_dict = dict(
+                [(n, self.__edge_prop_dataframe[n])
+                 for n in self.__edge_prop_dataframe.columns])
+        return self.__edge_prop_dataframe
+
+    def __evaluate_selection(self, expr, columns, df=None, type_index=None):
+        """
+        Evaluate the selection expression expr using the name:Series
+        dictionary columns and return a tuple of the resulting boolean Series
+        and the normalized expression.
+
+        If expr only selects rows of specific types and the DataFrame df
+        containing the columns and its type_index are specified, only the rows
+        of those types are evaluated and the returned Series only contains
+        those rows.
+        """
+        # The expression is parsed and validated once for the current set of
+        # column names, which also ensures only the allowed operations on
+        # property columns can be evaluated.
+        expression = compile_selection_expression(
+            expr, tuple(columns), self.type_col_name)
+        if (expression.type_names is None) or (type_index is None):
+            return (expression.evaluate(columns), expression.normalized_expr)
+
+        row_labels = [type_index[t] for t in expression.type_names
+                      if t in type_index]
+        if not row_labels:
+            selected = df[self.type_col_name].isin(expression.type_names)
+            return (selected, expression.normalized_expr)
+        if len(row_labels) > 1:
+            row_labels = row_labels[0].append(row_labels[1:])
+        else:
+            row_labels = row_labels[0]
+
+        if not expression.has_filter:
+            selected = self.__series_type(True, index=row_labels)
+        else:
+            rows = df.loc[row_labels, expression.names]
+            selected = expression.evaluate_filter(
+                dict([(n, rows[n]) for n in expression.names]))
+        return (selected, expression.normalized_expr)
+
+    def __create_type_index(self, df):
+        """
+        Return a dictionary of type_name:row labels of the rows for each type
+        in df.
+        """
+        if self.__dataframe_type is cudf.DataFrame:
+            return df.groupby(self.type_col_name, sort=False).groups
+        # Only include the types present in df, not all type names
+        return df.groupby(self.type_col_name, sort=False,
+                          observed=True).groups
+
+    def __get_type_value_counts(self, df):
+        """
+        Return a Series of the number of rows of each type present in df.
+        """
+        value_counts = df[self.type_col_name].value_counts(sort=False,
+                                                           dropna=False)
+        # Type names with no rows in df are also included since they are
+        # categories of the type column.
+        return value_counts[value_counts > 0]
+
+    def __get_type_dtype(self):
+        """
+        Return the categorical dtype of the type column, which has the type
+        names as its categories.
+        """
+        return self.__get_categorical_dtype(self.__type_names)
+
+    def __update_type_dtype(self, df):
+        """
+        Return df with the categories of its type column updated to include
+        type names added since it was last updated.
+        """
+        type_col = df[self.type_col_name]
+        if (str(type_col.dtype) == "category") and \
+           (len(type_col.cat.categories) == len(self.__type_names)):
+            return df
+        return df.assign(**{self.type_col_name:
+                            type_col.astype(self.__get_type_dtype())})
+
+    def __get_categorical_dtype(self, categories):
+        """
+        Return a categorical dtype with categories, for the Series type used
+        by this PropertyGraph.
+        """
+        if self.__series_type is cudf.Series:
+            return cudf.CategoricalDtype(categories=categories)
+        return pd.CategoricalDtype(categories=categories)
+
+    def __get_categories(self, ser):
+        """
+        Return a pandas Index of the categories of ser if ser is categorical,
+        or of the unique values in ser otherwise.
+        """
+        if str(ser.dtype) == "category":
+            categories = ser.cat.categories
+        else:
+            categories = ser.dropna().unique()
+        if hasattr(categories, "to_pandas"):
+            # cuDF categories or unique values
+            categories = categories.to_pandas()
+        return pd.Index(categories)
+
+    def __convert_property_dtypes(self, df, default_columns):
+        """
+        Return df with the dtypes of its property columns converted for
+        storage: integer and boolean columns of Pandas DataFrames are
+        converted to the corresponding nullable dtypes (eg. Int64 and
+        boolean), and string columns are converted to categorical columns if
+        categorical_string_properties is set. Missing values in nullable
+        columns are NA, as in cuDF, so comparisons using them are NA instead
+        of (for NaN values) True for "!=".
+        """
+        update_cols = {}
+        for col in df.columns:
+            if col in default_columns:
+                continue
+            dtype = df[col].dtype
+            if self.__categorical_string_properties and (dtype == "object"):
+                update_cols[col] = df[col].astype("category")
+            # cuDF columns can contain nulls without changing their dtype,
+            # but Pandas int and bool columns would be converted to float64
+            # and object columns when merges or concats add NA values.
+            elif (self.__dataframe_type is not cudf.DataFrame) and \
+                    isinstance(dtype, np.dtype) and (dtype.kind in "iub"):
+                update_cols[col] = df[col].convert_dtypes(
+                    infer_objects=False, convert_string=False,
+                    convert_floating=False)
+        if not update_cols:
+            return df
+        return df.assign(**update_cols)
+
+    def __unify_categorical_columns(self, dfs):
+        """
+        Return a list of the DataFrames in dfs with each column that is
+        categorical in any of them converted to the same categorical dtype in
+        all of them, so the column remains categorical when they are
+        concatenated or merged. The categories of the first DataFrame keep
+        their codes, and the other values are added as categories after them.
+        """
+        columns = []
+        for df in dfs:
+            columns += [col for col in df.columns
+                        if (str(df[col].dtype) == "category") and
+                        (col not in columns)]
+        if not columns:
+            return dfs
+
+        update_cols = [{} for _ in dfs]
+        for col in columns:
+            if col == self.type_col_name:
+                # All type names are already categories of the type column
+                categories = pd.Index(self.__type_names)
+            else:
+                categories = pd.Index([])
+                for df in dfs:
+                    if col in df.columns:
+                        new = self.__get_categories(df[col])
+                        categories = categories.append(
+                            new[~new.isin(categories)])
+            dtype = self.__get_categorical_dtype(categories)
+            for (df, updates) in zip(dfs, update_cols):
+                if col not in df.columns:
+                    continue
+                if (str(df[col].dtype) != "category") or \
+                   not self.__get_categories(df[col]).equals(categories):
+                    updates[col] = df[col].astype(dtype)
+        return [df.assign(**updates) if updates else df
+                for (df, updates) in zip(dfs, update_cols)]
+
+    def __append_edge_prop_chunks(self):
+        """
+        Append the edge data added since the last call to the edge property
+        DataFrame, or to the DataFrame for each type if per_type_storage is
+        True.
+        """
+        if not self.__edge_prop_chunks:
+            return
+
+        if self.__per_type_storage:
+            chunks_by_type = {}
+            for (type_name, df) in self.__edge_prop_chunks:
+                chunks_by_type.setdefault(type_name, []).append(df)
+            for (type_name, dfs) in chunks_by_type.items():
+                if type_name in self.__edge_prop_dataframes:
+                    dfs.insert(0, self.__edge_prop_dataframes[type_name])
+                if len(dfs) > 1:
+                    self.__edge_prop_dataframes[type_name] = self.__concat(
+                        self.__unify_categorical_columns(dfs),
+                        ignore_index=True)
+                else:
+                    self.__edge_prop_dataframes[type_name] = dfs[0]
+        else:
+            dfs = [df for (_, df) in self.__edge_prop_chunks]
+            if self.__edge_prop_dataframe is not None:
+                dfs.insert(0, self.__edge_prop_dataframe)
+            df = self.__concat(self.__unify_categorical_columns(dfs),
+                               ignore_index=True)
+            if self.__edge_prop_dataframe is None:
+                # Order the "internal" columns first
+                default_edge_columns = [self.src_col_name,
+                                        self.dst_col_name,
+                                        self.edge_id_col_name,
+                                        self.type_col_name]
+                df = df[default_edge_columns +
+                        [col for col in df.columns
+                         if col not in default_edge_columns]]
+            self.__edge_prop_dataframe = df
+
+            # Update the edge eval dict with the latest column instances
+            latest = dict([(n, self.__edge_prop_dataframe[n])
+                           for n in self.__edge_prop_dataframe.columns])
+            self.__edge_prop_eval_dict.update(latest)
+
+        self.__edge_prop_chunks = []
+
+    def __read_parquet(self, file_name, columns):
+        """
+        Return a DataFrame of the type used by this PropertyGraph containing
+        only columns read from the Parquet file file_name.
+        """
+        if self.__dataframe_type is cudf.DataFrame:
+            return cudf.read_parquet(file_name, columns=columns)
+        # Memory-map the file so only the data for columns is read from disk
+        return pq.read_table(file_name, columns=columns,
+                             memory_map=True).to_pandas()
+
+    def __concat(self, objs, **kwargs):
+        """
+        Concatenate objs using the concat function for the DataFrame type used
+        by this PropertyGraph.
+        """
+        if self.__dataframe_type is cudf.DataFrame:
+            return cudf.concat(objs, **kwargs)
+        return pd.concat(objs, **kwargs)
+
+    def __concat_type_dataframes(self, type_dataframes, default_columns):
+        """
+        Return a single DataFrame containing the rows of all DataFrames in the
+        type_dataframes dictionary, with a type column added and the columns in
+        default_columns first.
+        """
+        dfs = [df.assign(**{self.type_col_name: type_name})
+               for (type_name, df) in type_dataframes.items()]
+        df = self.__concat(self.__unify_categorical_columns(dfs),
+                           ignore_index=True)
+        df[self.type_col_name] = \
+            df[self.type_col_name].astype(self.__get_type_dtype())
+        prop_columns = [col for col in df.columns
+                        if col not in default_columns]
+        return df[default_columns + prop_columns]
+
+    def __create_id_index(self, ids):
+        """
+        Return a Series of the values in the ids Series sorted, with the row
+        position of each value in ids as the index, for use with
+        __find_id_positions().
+        """
+        return ids.reset_index(drop=True).sort_values()
+
+    def __get_type_vertex_id_index(self, type_name):
+        """
+        Return the vertex ID index for the DataFrame for type_name, creating
+        it if necessary.
+        """
+        id_index = self.__vertex_id_indices.get(type_name)
+        if id_index is None:
+            id_index = self.__create_id_index(
+                self.__vertex_prop_dataframes[type_name][self.vertex_col_name])
+            self.__vertex_id_indices[type_name] = id_index
+        return id_index
+
+    def __get_type_edge_id_index(self, type_name):
+        """
+        Return the edge ID index for the DataFrame for type_name. Edges of
+        each type are stored in the order they were added, so the edge ID
+        column is already sorted and can be used as the index.
+        """
+        return self.__edge_prop_dataframes[type_name][self.edge_id_col_name]
+
+    def __find_id_positions(self, id_index, ids):
+        """
+        Return an array of the row positions, in ascending order, of all rows
+        containing any of the IDs in ids, using binary searches of the id_index
+        Series of sorted IDs (see __create_id_index()). IDs that are not
+        present are ignored.
+        """
+        xp = cp if self.__series_type is cudf.Series else np
+        if id_index.dtype.kind not in "iuf":
+            # FIXME: support binary searches for non-numeric IDs
+            positions = xp.flatnonzero(xp.asarray(id_index.isin(ids).values))
+        else:
+            ids = xp.unique(xp.asarray(ids))
+            # Each ID can be present in the index more than once, in the range
+            # of positions [start, stop) of the sorted index.
+            starts = xp.asarray(id_index.searchsorted(ids, side="left"))
+            stops = xp.asarray(id_index.searchsorted(ids, side="right"))
+            counts = stops - starts
+            # Expand each [start, stop) range into the positions in the range
+            # without a Python loop: repeat each start once for each position
+            # in its range, then add the offset of each position in the range.
+            offsets = xp.cumsum(counts) - counts
+            positions = xp.repeat(starts - offsets, counts.tolist()) + \
+                xp.arange(int(counts.sum()))
+
+        # The index of id_index maps positions in id_index to row positions,
+        # unless id_index is the (sorted) ID column itself.
+        row_index = id_index.index
+        if not(isinstance(row_index, (cudf.RangeIndex, pd.RangeIndex)) and
+               (row_index.start == 0) and (row_index.step == 1)):
+            positions = xp.asarray(row_index.values)[positions]
+        return xp.sort(positions)
+
+    @staticmethod
+    def __get_type_rows(type_index, types):
+        """
+        Return the row labels, in ascending order, of the rows for types
+        using type_index (see __create_type_index()).
+        """
+        # FIXME: coerce types to a list-like if not?
+        row_labels = [type_index[t] for t in set(types) if t in type_index]
+        if not row_labels:
+            return []
+        if len(row_labels) > 1:
+            row_labels = row_labels[0].append(row_labels[1:])
+        else:
+            row_labels = row_labels[0]
+        return row_labels.sort_values()
+
+    def __get_type_dataframes_data(self,
+                                   type_dataframes,
+                                   get_id_index,
+                                   ids,
+                                   types,
+                                   default_columns,
+                                   columns):
+        """
+        Return a DataFrame containing the default_columns and columns for only
+        the rows in type_dataframes for the specified ids and types. All ids
+        and types are included if ids or types is None, respectively.
+        get_id_index is called with a type name to get the ID index for the
+        DataFrame for the type.
+        """
+        # FIXME: invalid columns will result in a KeyError, should a more
+        # PG-specific error be raised?
+        all_columns = set()
+        for df in type_dataframes.values():
+            all_columns.update(df.columns)
+        invalid_columns = set(columns).difference(all_columns)
+        if invalid_columns:
+            raise KeyError(f"{list(invalid_columns)} not in columns")
+
+        if types is None:
+            type_names = list(type_dataframes.keys())
+        else:
+            # FIXME: coerce types to a list-like if not?
+            types = set(types)
+            type_names = [t for t in type_dataframes.keys() if t in types]
+
+        dfs = []
+        for type_name in type_names:
+            df = type_dataframes[type_name]
+            if ids is not None:
+                df = df.take(self.__find_id_positions(
+                    get_id_index(type_name), ids))
+            df = df[[col for col in default_columns + columns
+                     if col in df.columns]]
+            dfs.append(df.assign(**{self.type_col_name: type_name}))
+
+        # The "internal" ID and type columns are also included/added since they
+        # are assumed to be needed by the caller. Columns that are not present
+        # for any of the selected types are included with NA values.
+        if not dfs:
+            return self.__dataframe_type(columns=default_columns + columns)
+        df = self.__concat(self.__unify_categorical_columns(dfs),
+                           ignore_index=True)
+        df[self.type_col_name] = \
+            df[self.type_col_name].astype(self.__get_type_dtype())
+        return df.reindex(columns=default_columns + columns)
+
+    @staticmethod
+    def __get_type_dataframes_columns(type_dataframes):
+        """
+        Return a list of the unique column names in all DataFrames in the
+        type_dataframes dictionary, in the order they were added.
+        """
+        columns = {}
+        for df in type_dataframes.values():
+            columns.update(dict.fromkeys(df.columns))
+        return list(columns)
+
+    def __get_type_dataframes_lengths(self, type_dataframes):
+        """
+        Return a Series of the number of rows in each DataFrame in the
+        type_dataframes dictionary, indexed by type name.
+        """
+        return self.__series_type(
+            [len(df) for df in type_dataframes.values()],
+            index=list(type_dataframes.keys()),
+            dtype="int64")
+
+    @staticmethod
+    def __get_new_prop_column_dtypes(df, column_dtype_dict, default_columns):
+        """
+        Returns a list containing tuples of (column name, dtype) for each
+        column in df that is not in column_dtype_dict or default_columns.
+        """
+        return [(col, df[col].dtype) for col in df.columns
+                if (col not in column_dtype_dict) and
+                (col not in default_columns)]
+
     @staticmethod
     def __get_new_column_dtypes(from_df, to_df):
         """
@@ -0,0 +1,212 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parsing, validation, and evaluation of the selection expressions passed to
+the PropertyGraph select_vertices() and select_edges() methods.
+"""
+
+import ast
+from functools import lru_cache
+
+
+# The AST node types allowed in a selection expression. Names can only refer
+# to property columns, and calls are further restricted to the Series methods
+# in _allowed_methods.
+_allowed_nodes = (
+    ast.Expression,
+    ast.BoolOp, ast.And, ast.Or,
+    ast.BinOp, ast.BitAnd, ast.BitOr, ast.BitXor,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+    ast.UnaryOp, ast.Invert, ast.Not, ast.USub, ast.UAdd,
+    ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    ast.Name, ast.Constant, ast.List, ast.Tuple, ast.Load,
+    ast.Call, ast.Attribute,
+)
+_allowed_methods = {"isin", "isna", "notna", "isnull", "notnull", "between"}
+
+
+class SelectionExpression:
+    """
+    A selection expression that has been parsed, validated against the
+    property names of a PropertyGraph, and compiled.
+
+    If the expression is a conjunction (using "&") containing one or more
+    terms comparing the type column to string constants (eg.
+    "_TYPE_ == 'users'" or "_TYPE_.isin(['users', 'merchants'])"), type_names
+    is set to the list of type names the expression is restricted to, and
+    evaluate_filter() evaluates only the remaining terms. This allows callers
+    to evaluate the remaining terms for only the rows of those types.
+    Otherwise, type_names is None and evaluate_filter() evaluates the entire
+    expression. names is the list of names used by the terms evaluated by
+    evaluate_filter(). normalized_expr is a dump of the parsed expression,
+    which does not include whitespace or redundant parentheses, so equivalent
+    expression strings have the same normalized_expr.
+
+    Parameters
+    ----------
+    expr : string
+        The selection expression.
+    names : iterable of strings
+        The names that can be referenced in expr, typically the property
+        column names.
+    type_col_name : string
+        The name of the type column.
+    """
+    def __init__(self, expr, names, type_col_name):
+        self.expr = expr
+        tree = ast.parse(expr.strip(), mode="eval")
+        self.__validate(tree, set(names))
+        # ast.unparse() is not available in Python 3.8
+        self.normalized_expr = ast.dump(tree)
+
+        self.type_names = None
+        filter_terms = []
+        for term in self.__get_conjunction_terms(tree.body):
+            term_type_names = self.__get_type_names(term, type_col_name)
+            if term_type_names is None:
+                filter_terms.append(term)
+            elif self.type_names is None:
+                self.type_names = term_type_names
+            else:
+                self.type_names = [t for t in self.type_names
+                                   if t in term_type_names]
+
+        self.__code = compile(tree, "<selection>", "eval")
+        if self.type_names is None:
+            filter_tree = tree
+            self.__filter_code = self.__code
+        elif filter_terms:
+            filter_expr = filter_terms[0]
+            for term in filter_terms[1:]:
+                filter_expr = ast.BinOp(left=filter_expr, op=ast.BitAnd(),
+                                        right=term)
+            filter_tree = ast.fix_missing_locations(
+                ast.Expression(body=filter_expr))
+            self.__filter_code = compile(filter_tree, "<selection>", "eval")
+        else:
+            filter_tree = None
+            self.__filter_code = None
+
+        self.names = []
+        if filter_tree is not None:
+            self.names = sorted(set([node.id for node in ast.walk(filter_tree)
+                                     if isinstance(node, ast.Name)]))
+
+    @property
+    def has_filter(self):
+        """
+        True if the expression has terms other than the type_names terms.
+        """
+        return self.__filter_code is not None
+
+    def evaluate(self, columns):
+        """
+        Evaluate the entire expression using the name:Series dictionary
+        columns and return the resulting boolean Series.
+        """
+        return eval(self.__code, {"__builtins__": {}}, columns)
+
+    def evaluate_filter(self, columns):
+        """
+        Evaluate only the terms of the expression not covered by type_names
+        using the name:Series dictionary columns and return the resulting
+        boolean Series.
+        """
+        if self.__filter_code is None:
+            raise RuntimeError("the expression has no terms other than the "
+                               "type_names terms")
+        return eval(self.__filter_code, {"__builtins__": {}}, columns)
+
+    @staticmethod
+    def __validate(tree, names):
+        """
+        Raise an exception if tree contains nodes that are not allowed in a
+        selection expression, or names that are not in names.
+        """
+        called_attrs = set([id(node.func) for node in ast.walk(tree)
+                            if isinstance(node, ast.Call)])
+        for node in ast.walk(tree):
+            if not isinstance(node, _allowed_nodes):
+                raise ValueError(f"{type(node).__name__} is not supported in "
+                                 "selection expressions")
+            if isinstance(node, ast.Name) and (node.id not in names):
+                # Raise the same exception as eval() would
+                raise NameError(f"name '{node.id}' is not defined")
+            if isinstance(node, ast.Attribute) and \
+               ((node.attr not in _allowed_methods) or
+                    (id(node) not in called_attrs)):
+                raise ValueError(f"'{node.attr}' is not supported in "
+                                 "selection expressions, only calls to "
+                                 f"{sorted(_allowed_methods)} are supported")
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Attribute):
+                    raise ValueError("only calls to "
+                                     f"{sorted(_allowed_methods)} are "
+                                     "supported in selection expressions")
+                if node.keywords:
+                    raise ValueError("keyword arguments are not supported in "
+                                     "selection expressions")
+
+    @classmethod
+    def __get_conjunction_terms(cls, node):
+        """
+        Return the list of terms in node if it is a conjunction, otherwise a
+        list containing only node.
+        """
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+            return (cls.__get_conjunction_terms(node.left) +
+                    cls.__get_conjunction_terms(node.right))
+        return [node]
+
+    @staticmethod
+    def __get_type_names(node, type_col_name):
+        """
+        Return the list of type names if node is a comparison of the type
+        column to a string constant or a list of string constants using ==
+        or isin(), otherwise return None.
+        """
+        def is_type_col(n):
+            return isinstance(n, ast.Name) and (n.id == type_col_name)
+
+        def is_str(n):
+            return isinstance(n, ast.Constant) and isinstance(n.value, str)
+
+        if isinstance(node, ast.Compare) and (len(node.ops) == 1) and \
+           isinstance(node.ops[0], ast.Eq):
+            (left, right) = (node.left, node.comparators[0])
+            if is_type_col(left) and is_str(right):
+                return [right.value]
+            if is_str(left) and is_type_col(right):
+                return [left.value]
+
+        if isinstance(node, ast.Call) and \
+           is_type_col(node.func.value) and (node.func.attr == "isin") and \
+           (len(node.args) == 1) and \
+           isinstance(node.args[0], (ast.List, ast.Tuple)) and \
+           all(is_str(n) for n in node.args[0].elts):
+            return [n.value for n in node.args[0].elts]
+
+        return None
+
+
+@lru_cache(maxsize=256)
+def compile_selection_expression(expr, names, type_col_name):
+    """
+    Return a SelectionExpression for expr, reusing the SelectionExpression
+    from a prior call with the same expr, names, and type_col_name. names
+    must be hashable (eg. a tuple), and is typically the tuple of property
+    column names at the time of the call, so that changes to the columns
+    result in the expression being validated again.
+    """
+    return SelectionExpression(expr, names, type_col_name)
@@ -13,6 +13,7 @@
 
 import time
 import gc
+import resource
 
 import pytest
 import pandas as pd
@@ -161,21 +162,23 @@ def df_type_id(dataframe_type):
 
 
 df_types_fixture_params = utils.genFixtureParamsProduct((df_types, df_type_id))
+df_types_per_type_storage_fixture_params = utils.genFixtureParamsProduct(
+    (df_types, df_type_id), ([False, True], "per_type_storage"))
 
 
-@pytest.fixture(scope="module", params=df_types_fixture_params)
-def dataset1_PropertyGraph(request):
+def create_dataset1_PropertyGraph(dataframe_type, per_type_storage,
+                                  subgraph_cache_size=0):
     """
-    Fixture which returns an instance of a PropertyGraph with vertex and edge
-    data added from dataset1, parameterized for different DataFrame types.
+    Return an instance of a PropertyGraph with vertex and edge data added from
+    dataset1, using dataframe_type for the data.
     """
-    dataframe_type = request.param[0]
     from cugraph.experimental import PropertyGraph
 
     (merchants, users, taxpayers,
      transactions, relationships, referrals) = dataset1.values()
 
-    pG = PropertyGraph()
+    pG = PropertyGraph(subgraph_cache_size=subgraph_cache_size,
+                       per_type_storage=per_type_storage)
 
     # Vertex and edge data is added as one or more DataFrames; either a Pandas
     # DataFrame to keep data on the CPU, a cuDF DataFrame to keep data on GPU,
@@ -227,7 +230,33 @@ def dataset1_PropertyGraph(request):
                                        "user_id_2"),
                      property_columns=None)
 
-    return (pG, dataset1)
+    return pG
+
+
+@pytest.fixture(scope="module",
+                params=df_types_per_type_storage_fixture_params)
+def dataset1_PropertyGraph(request):
+    """
+    Fixture which returns an instance of a PropertyGraph with vertex and edge
+    data added from dataset1, parameterized for different DataFrame types and
+    for storing properties in a single DataFrame or per-type DataFrames.
+    """
+    (dataframe_type, per_type_storage) = request.param
+    return (create_dataset1_PropertyGraph(dataframe_type, per_type_storage),
+            dataset1)
+
+
+@pytest.fixture(scope="module",
+                params=df_types_per_type_storage_fixture_params)
+def dataset1_cached_PropertyGraph(request):
+    """
+    Fixture which returns the same PropertyGraph as dataset1_PropertyGraph,
+    but with caching of the Graphs returned by extract_subgraph() enabled.
+    """
+    (dataframe_type, per_type_storage) = request.param
+    return (create_dataset1_PropertyGraph(dataframe_type, per_type_storage,
+                                          subgraph_cache_size=8),
+            dataset1)
 
 
 @pytest.fixture(scope="module", params=df_types_fixture_params)
@@ -978,6 +1007,93 @@ def test_select_vertices_from_previous_selection(dataset1_PropertyGraph):
     assert_frame_equal(expected_edgelist, actual_edgelist, check_like=True)
 
 
+def test_select_type_pushdown(dataset1_PropertyGraph):
+    """
+    Ensure selections restricted to specific types return the same rows as
+    evaluating the expression for all rows.
+    """
+    (pG, data) = dataset1_PropertyGraph
+    tcn = pG.type_col_name
+
+    def selected_ids(selection, df, id_col_name):
+        if isinstance(selection, cudf.Series):
+            selection = selection.to_pandas()
+            df = df.to_pandas()
+        return sorted(df[selection.values][id_col_name])
+
+    edge_df = pG._edge_prop_dataframe
+    for (expr, expected) in [
+            (f"{tcn} == 'transactions'",
+             edge_df[tcn] == "transactions"),
+            (f"({tcn} == 'transactions') & (volume > 100)",
+             (edge_df[tcn] == "transactions") & (edge_df["volume"] > 100)),
+            (f"{tcn}.isin(['referrals', 'relationships']) & "
+             f"({pG.src_col_name} == 89216)",
+             edge_df[tcn].isin(["referrals", "relationships"])
+             & (edge_df[pG.src_col_name] == 89216)),
+            (f"({tcn} == 'referrals') & ({tcn} == 'transactions')",
+             edge_df[tcn].isin([])),
+            (f"{tcn} == 'nonexistent'",
+             edge_df[tcn].isin([])),
+    ]:
+        selection = pG.select_edges(expr)
+        assert len(selection.edge_selections) == len(edge_df)
+        assert selected_ids(selection.edge_selections,
+                            edge_df, pG.edge_id_col_name) == \
+            selected_ids(expected, edge_df, pG.edge_id_col_name)
+
+    vertex_df = pG._vertex_prop_dataframe
+    selection = pG.select_vertices(f"({tcn} == 'users') & "
+                                   "(user_location > 47906)")
+    expected = (vertex_df[tcn] == "users") & \
+        (vertex_df["user_location"] > 47906)
+    assert selected_ids(selection.vertex_selections,
+                        vertex_df, pG.vertex_col_name) == \
+        selected_ids(expected, vertex_df, pG.vertex_col_name)
+
+
+def test_select_normalized_expressions(dataset1_PropertyGraph, monkeypatch):
+    """
+    Ensure equivalent selection expressions result in the same selection key,
+    without relying on ast.unparse(), which is not available in Python 3.8.
+    """
+    import ast
+
+    (pG, data) = dataset1_PropertyGraph
+    monkeypatch.delattr(ast, "unparse", raising=False)
+
+    key = pG.select_edges("(volume > 77) & (card_num != 2)").edge_selection_key
+    assert pG.select_edges(" ((volume>77)) &(card_num != 2)") \
+        .edge_selection_key == key
+    assert pG.select_edges("(volume > 78) & (card_num != 2)") \
+        .edge_selection_key != key
+
+    key = pG.select_vertices("user_location >= 47906").vertex_selection_key
+    assert pG.select_vertices("(user_location>=47906)") \
+        .vertex_selection_key == key
+
+
+def test_select_bad_expressions(dataset1_PropertyGraph):
+    """
+    Ensure selection expressions can only use property names and the
+    supported operators and methods.
+    """
+    (pG, data) = dataset1_PropertyGraph
+
+    with pytest.raises(NameError, match="not_a_property"):
+        pG.select_edges("not_a_property == 1")
+    with pytest.raises(ValueError):
+        pG.select_edges("__import__('os')")
+    with pytest.raises(ValueError):
+        pG.select_edges("_SRC_.__class__")
+    with pytest.raises(ValueError):
+        pG.select_edges("_SRC_.to_csv('edges.csv')")
+    with pytest.raises(ValueError):
+        pG.select_vertices("[v for v in _VERTEX_]")
+    with pytest.raises(SyntaxError):
+        pG.select_vertices("_VERTEX_ ==")
+
+
 def test_extract_subgraph_graph_without_vert_props():
     """
     Ensure a subgraph can be extracted from a PropertyGraph that does not have
@@ -1056,6 +1172,121 @@ def test_extract_subgraph_no_query(dataset1_PropertyGraph):
     assert len(G.edgelist.edgelist_df) == num_edges
 
 
+def test_extract_subgraph_cache(dataset1_cached_PropertyGraph):
+    """
+    Ensure extract_subgraph() returns cached Graphs for equivalent selections
+    and arguments, and that the cache is invalidated when data is added.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    (pG, data) = dataset1_cached_PropertyGraph
+    tcn = PropertyGraph.type_col_name
+    pG.clear_subgraph_cache()
+
+    selection = pG.select_edges(f"{tcn}=='transactions'")
+    G1 = pG.extract_subgraph(selection=selection,
+                             create_using=DiGraph_inst)
+    assert pG.subgraph_cache_info()["misses"] == 1
+    assert pG.subgraph_cache_info()["hits"] == 0
+
+    # Same expression with different whitespace and parentheses
+    selection = pG.select_edges(f"({tcn} == 'transactions')")
+    G2 = pG.extract_subgraph(selection=selection,
+                             create_using=DiGraph_inst)
+    assert G2 is G1
+    assert pG.subgraph_cache_info()["hits"] == 1
+
+    # Different arguments result in a different Graph
+    G3 = pG.extract_subgraph(selection=selection,
+                             create_using=DiGraph_inst,
+                             edge_weight_property="volume",
+                             default_edge_weight=0.0)
+    assert G3 is not G1
+    assert pG.subgraph_cache_info() == \
+        {"hits": 1, "misses": 2, "maxsize": 8, "currsize": 2}
+
+    # Selections made from previous selections are also cached
+    vert_selection = pG.select_vertices(f"{tcn}=='users'")
+    vert_selection = pG.select_vertices("user_location==47906",
+                                        from_previous_selection=vert_selection)
+    G4 = pG.extract_subgraph(selection=vert_selection,
+                             create_using=DiGraph_inst,
+                             allow_multi_edges=True)
+    vert_selection = pG.select_vertices(f"{tcn} == 'users'")
+    vert_selection = pG.select_vertices("user_location == 47906",
+                                        from_previous_selection=vert_selection)
+    assert pG.extract_subgraph(selection=vert_selection,
+                               create_using=DiGraph_inst,
+                               allow_multi_edges=True) is G4
+    assert pG.subgraph_cache_info()["hits"] == 2
+
+    pG.clear_subgraph_cache()
+    assert pG.subgraph_cache_info() == \
+        {"hits": 0, "misses": 0, "maxsize": 8, "currsize": 0}
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_extract_subgraph_cache_invalidation(df_type):
+    """
+    Ensure adding data invalidates Graphs cached by extract_subgraph(), and
+    that caching is disabled by default.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph(subgraph_cache_size=8)
+    pG.add_edge_data(df_type(columns=["src", "dst"], data=[(0, 1), (1, 2)]),
+                     type_name="e",
+                     vertex_col_names=("src", "dst"))
+    selection = pG.select_edges("_TYPE_ == 'e'")
+    G1 = pG.extract_subgraph(selection=selection)
+    assert G1.number_of_edges() == 2
+
+    pG.add_edge_data(df_type(columns=["src", "dst"], data=[(2, 3)]),
+                     type_name="e",
+                     vertex_col_names=("src", "dst"))
+    assert pG.subgraph_cache_info()["currsize"] == 0
+
+    selection = pG.select_edges("_TYPE_ == 'e'")
+    G3 = pG.extract_subgraph(selection=selection)
+    assert G3.number_of_edges() == 3
+    assert pG.extract_subgraph(selection=selection) is G3
+
+    pG = PropertyGraph()
+    pG.add_edge_data(df_type(columns=["src", "dst"], data=[(0, 1), (1, 2)]),
+                     type_name="e",
+                     vertex_col_names=("src", "dst"))
+    assert pG.extract_subgraph() is not pG.extract_subgraph()
+    assert pG.subgraph_cache_info() == \
+        {"hits": 0, "misses": 0, "maxsize": 0, "currsize": 0}
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_extract_subgraph_cache_concurrent(df_type):
+    """
+    Ensure cached Graphs can be returned by extract_subgraph() called from
+    multiple threads, while other Graphs are being added and removed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph(subgraph_cache_size=2)
+    pG.add_edge_data(df_type({"src": [0, 1, 2], "dst": [1, 2, 0],
+                              "w": [1, 2, 3]}),
+                     vertex_col_names=("src", "dst"))
+    exprs = ["w > 0", "w > 1", "w > 2"]
+
+    def extract(i):
+        selection = pG.select_edges(exprs[i % len(exprs)])
+        return pG.extract_subgraph(selection=selection).number_of_edges()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        num_edges = list(executor.map(extract, range(60)))
+    assert num_edges == [3, 2, 1] * 20
+    info = pG.subgraph_cache_info()
+    assert info["hits"] + info["misses"] == 60
+    assert info["currsize"] == 2
+
+
 def test_extract_subgraph_multi_edges(dataset1_PropertyGraph):
     """
     Ensure an exception is thrown if a graph is attempted to be extracted with
@@ -1191,6 +1422,51 @@ def test_extract_subgraph_nonrenumbered_noedgedata():
     assert hasattr(G, "edge_data") is False
 
 
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_extract_subgraph_edge_columns(df_type):
+    """
+    Ensures the subgraph returned from extract_subgraph() only contains the
+    edge columns it needs when selecting by other properties, and that the
+    edge properties are not changed.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    eicn = PropertyGraph.edge_id_col_name
+    pG = PropertyGraph()
+    pG.add_vertex_data(df_type({"v": [0, 1, 2, 3],
+                                "keep": [True, True, True, False]}),
+                       vertex_col_name="v")
+    pG.add_edge_data(df_type({"src": [0, 1, 2, 3],
+                              "dst": [1, 2, 3, 0],
+                              "w": [0.5, 1.5, 2.5, 3.5],
+                              "count": [1, 2, 3, 4],
+                              "name": ["a", "b", "c", "d"]}),
+                     vertex_col_names=("src", "dst"))
+    edge_df = pG.get_edge_data()
+
+    selection = pG.select_edges("count > 1")
+    selection += pG.select_vertices("keep")
+    G = pG.extract_subgraph(selection=selection, edge_weight_property="w",
+                            renumber_graph=False)
+    assert list(G.edge_data.columns) == [pG.src_col_name, pG.dst_col_name,
+                                         eicn]
+    assert list(G.edge_data[eicn].values) == [1]
+    edgelist_df = G.edgelist.edgelist_df
+    if isinstance(edgelist_df, cudf.DataFrame):
+        edgelist_df = edgelist_df.to_pandas()
+    assert edgelist_df.shape[0] == 1
+    assert 1.5 in edgelist_df.values
+
+    G = pG.extract_subgraph(selection=selection, renumber_graph=False,
+                            add_edge_data=False)
+    assert hasattr(G, "edge_data") is False
+    if df_type is cudf.DataFrame:
+        afe = assert_frame_equal
+    else:
+        afe = pd.testing.assert_frame_equal
+    afe(edge_df, pG.get_edge_data())
+
+
 def test_graph_edge_data_added(dataset1_PropertyGraph):
     """
     Ensures the subgraph returned from extract_subgraph() has the edge_data
@@ -1335,6 +1611,333 @@ def test_get_vertices(dataset1_PropertyGraph):
     assert sorted(pG.get_vertices().values) == sorted(expected_vertices)
 
 
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("per_type_storage", [False, True])
+def test_get_vertices_after_adding_data(df_type, per_type_storage):
+    """
+    Test that get_num_vertices() and get_vertices() include the vertices in
+    data added after they were last called.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph(per_type_storage=per_type_storage)
+    assert pG.get_num_vertices() == 0
+
+    pG.add_edge_data(df_type({"src": [10, 30, 30], "dst": [30, 50, 10]}),
+                     type_name="e1", vertex_col_names=("src", "dst"))
+    assert pG.get_num_vertices() == 3
+    assert list(pG.get_vertices().values) == [10, 30, 50]
+
+    # New vertices before, between, and after the existing ones, along with
+    # existing vertices
+    pG.add_vertex_data(df_type({"v": [0, 20, 30, 60], "p": range(4)}),
+                       type_name="v1", vertex_col_name="v")
+    pG.add_edge_data(df_type({"src": [40, 10], "dst": [70, 40]}),
+                     type_name="e2", vertex_col_names=("src", "dst"))
+    assert pG.get_num_vertices() == 8
+    assert pG.get_num_vertices(include_edge_data=False) == 4
+    assert list(pG.vertices_ids().values) == [0, 10, 20, 30, 40, 50, 60, 70]
+
+    # Only existing vertices
+    pG.add_vertex_data(df_type({"v": [70, 0], "p": [5, 6]}),
+                       type_name="v1", vertex_col_name="v")
+    assert pG.get_num_vertices() == 8
+    assert list(pG.get_vertices().values) == [0, 10, 20, 30, 40, 50, 60, 70]
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("per_type_storage", [False, True])
+def test_categorical_types(df_type, per_type_storage):
+    """
+    Ensures the type column is categorical, with the type names as the
+    categories in the order they were added and the same code for each type
+    after more types are added.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    tcn = PropertyGraph.type_col_name
+    pG = PropertyGraph(per_type_storage=per_type_storage)
+    pG.add_vertex_data(df_type({"v": [0, 1], "p": [1, 2]}),
+                       type_name="a", vertex_col_name="v")
+    pG.add_edge_data(df_type({"src": [0, 1], "dst": [1, 2]}),
+                     type_name="x", vertex_col_names=("src", "dst"))
+    pG.add_vertex_data(df_type({"v": [2], "p": [3]}),
+                       type_name="b", vertex_col_name="v")
+
+    def get_types(df):
+        types = df[tcn]
+        assert str(types.dtype) == "category"
+        if isinstance(types, cudf.Series):
+            types = types.to_pandas()
+        return (list(types.cat.categories), list(types.cat.codes),
+                list(types.astype(str)))
+
+    vertex_df = pG.get_vertex_data().sort_values(pG.vertex_col_name)
+    assert get_types(vertex_df) == (["a", "x", "b"], [0, 0, 2],
+                                    ["a", "a", "b"])
+    pG.add_edge_data(df_type({"src": [2], "dst": [0]}),
+                     type_name="y", vertex_col_names=("src", "dst"))
+    edge_df = pG.get_edge_data()
+    assert get_types(edge_df) == (["a", "x", "b", "y"], [1, 1, 3],
+                                  ["x", "x", "y"])
+    vertex_df = pG.get_vertex_data().sort_values(pG.vertex_col_name)
+    assert get_types(vertex_df)[1] == [0, 0, 2]
+
+    assert pG.vertex_types == {"a", "b"}
+    assert pG.edge_types == {"x", "y"}
+    assert pG.get_num_vertices("x") == 0
+    assert pG.get_num_edges("x") == 2
+    assert get_types(pG.get_vertex_data(types=["b"]))[2] == ["b"]
+    assert get_types(pG.get_edge_data(types=["y"]))[2] == ["y"]
+    selection = pG.select_edges(f"{tcn} == 'y'")
+    G = pG.extract_subgraph(selection=selection, renumber_graph=False)
+    assert len(G.edgelist.edgelist_df) == 1
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("per_type_storage", [False, True])
+def test_categorical_string_properties(df_type, per_type_storage):
+    """
+    Ensures string properties are stored as categorical columns if
+    categorical_string_properties is set, and can still be compared to
+    strings.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph(per_type_storage=per_type_storage,
+                       categorical_string_properties=True)
+    pG.add_edge_data(df_type({"src": [0, 1], "dst": [1, 2],
+                              "color": ["red", "blue"], "w": [1.0, 2.0]}),
+                     type_name="x", vertex_col_names=("src", "dst"))
+    pG.add_edge_data(df_type({"src": [2, 3], "dst": [3, 0],
+                              "color": ["green", "red"], "w": [3.0, 4.0]}),
+                     type_name="x", vertex_col_names=("src", "dst"))
+
+    colors = pG.get_edge_data()["color"]
+    assert str(colors.dtype) == "category"
+    if isinstance(colors, cudf.Series):
+        colors = colors.to_pandas()
+    assert list(colors.cat.categories) == ["blue", "red", "green"]
+    assert list(colors.astype(str)) == ["red", "blue", "green", "red"]
+    assert str(pG.get_edge_data()["w"].dtype) == "float64"
+
+    selection = pG.select_edges("color == 'red'")
+    G = pG.extract_subgraph(selection=selection, renumber_graph=False)
+    assert len(G.edgelist.edgelist_df) == 2
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("per_type_storage", [False, True])
+def test_property_dtypes_with_nulls(df_type, per_type_storage):
+    """
+    Ensures integer and boolean properties keep their values and are not
+    converted to floats or objects when other types do not have them.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    big = 2**60 + 1
+    pG = PropertyGraph(per_type_storage=per_type_storage)
+    pG.add_vertex_data(df_type({"v": [0, 1], "i": [big, 2],
+                                "b": [True, False]}),
+                       type_name="a", vertex_col_name="v")
+    pG.add_vertex_data(df_type({"v": [2], "f": [1.5]}),
+                       type_name="b", vertex_col_name="v")
+    pG.add_edge_data(df_type({"src": [0], "dst": [1], "i": [big]}),
+                     type_name="x", vertex_col_names=("src", "dst"))
+    pG.add_edge_data(df_type({"src": [1], "dst": [2], "w": [3.5]}),
+                     type_name="y", vertex_col_names=("src", "dst"))
+
+    if df_type is cudf.DataFrame:
+        expected_dtypes = {"i": "int64", "b": "bool"}
+    else:
+        expected_dtypes = {"i": "Int64", "b": "boolean"}
+    vertex_df = pG.get_vertex_data().sort_values(pG.vertex_col_name)
+    edge_df = pG.get_edge_data()
+    assert str(vertex_df["i"].dtype) == expected_dtypes["i"]
+    assert str(vertex_df["b"].dtype) == expected_dtypes["b"]
+    assert str(edge_df["i"].dtype) == expected_dtypes["i"]
+    assert str(vertex_df["f"].dtype) == "float64"
+    if df_type is cudf.DataFrame:
+        vertex_df = vertex_df.to_pandas()
+        edge_df = edge_df.to_pandas()
+    assert vertex_df["i"].tolist()[:2] == [big, 2]
+    assert vertex_df["b"].tolist()[:2] == [True, False]
+    assert vertex_df["i"].isna().tolist() == [False, False, True]
+    assert edge_df["i"].tolist()[0] == big
+    assert edge_df["i"].isna().tolist() == [False, True]
+
+    G = pG.extract_subgraph(selection=pG.select_edges(f"i == {big}"),
+                            renumber_graph=False)
+    assert len(G.edgelist.edgelist_df) == 1
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_select_missing_property_values(df_type):
+    """
+    Ensures edges without a value for an integer or boolean property are not
+    selected by comparisons using that property, including negated ones.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph()
+    pG.add_edge_data(df_type({"src": [0, 1], "dst": [1, 2],
+                              "count": [1, 2], "flag": [True, False]}),
+                     type_name="a", vertex_col_names=("src", "dst"))
+    pG.add_edge_data(df_type({"src": [2, 3], "dst": [3, 0]}),
+                     type_name="b", vertex_col_names=("src", "dst"))
+
+    def get_selected_edge_ids(expr):
+        G = pG.extract_subgraph(selection=pG.select_edges(expr),
+                                allow_multi_edges=True)
+        edge_ids = G.edge_data[pG.edge_id_col_name]
+        if isinstance(edge_ids, cudf.Series):
+            edge_ids = edge_ids.to_pandas()
+        return sorted(edge_ids.tolist())
+
+    assert get_selected_edge_ids("count != 1") == [1]
+    assert get_selected_edge_ids("~(count == 1)") == [1]
+    assert get_selected_edge_ids("~flag") == [1]
+    assert get_selected_edge_ids("(count != 1) | count.isna()") == [1, 2, 3]
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("per_type_storage", [False, True])
+def test_update_data(df_type, per_type_storage):
+    """
+    Ensures update_vertex_data() and update_edge_data() set the properties of
+    existing vertices and edges without adding rows, add new properties and
+    vertices, and that the new values are used by selections.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    vcn = PropertyGraph.vertex_col_name
+    tcn = PropertyGraph.type_col_name
+    pG = PropertyGraph(per_type_storage=per_type_storage)
+    pG.add_vertex_data(df_type({"v": [0, 1, 2], "score": [1.0, 2.0, 3.0]}),
+                       type_name="a", vertex_col_name="v")
+    pG.add_vertex_data(df_type({"v": [2, 3], "score": [4.0, 5.0]}),
+                       type_name="b", vertex_col_name="v")
+    pG.add_edge_data(df_type({"src": [0, 1, 2], "dst": [1, 2, 3],
+                              "w": [1, 2, 3]}),
+                     type_name="x", vertex_col_names=("src", "dst"))
+
+    def get_values(df, sort_cols, col):
+        if isinstance(df, cudf.DataFrame):
+            df = df.to_pandas()
+        df = df.sort_values(sort_cols)
+        return [None if pd.isna(v) else v for v in df[col].tolist()]
+
+    # Only the rows of type "a" are set, and vertex 9 is added
+    pG.update_vertex_data(df_type({"v": [2, 9, 0], "score": [20.0, 90.0,
+                                                             10.0]}),
+                          type_name="a", vertex_col_name="v")
+    vertex_df = pG.get_vertex_data()
+    assert get_values(vertex_df, [vcn, tcn], vcn) == [0, 1, 2, 2, 3, 9]
+    assert get_values(vertex_df, [vcn, tcn], "score") == \
+        [10.0, 2.0, 20.0, 4.0, 5.0, 90.0]
+    assert pG.get_num_vertices() == 5
+    assert pG.get_num_vertices("a") == 4
+
+    # All rows of vertex 2 are set, and a new property is added
+    pG.update_vertex_data(df_type({"v": [2], "rank": [7]}),
+                          vertex_col_name="v")
+    vertex_df = pG.get_vertex_data()
+    assert get_values(vertex_df, [vcn, tcn], "rank") == \
+        [None, None, 7, 7, None, None]
+    assert get_values(vertex_df, [vcn, tcn], "score")[2:4] == [20.0, 4.0]
+    selection = pG.select_vertices("score > 3")
+    G = pG.extract_subgraph(selection=selection, renumber_graph=False)
+    assert len(G.edgelist.edgelist_df) == 1
+
+    pG.update_edge_data(df_type({"eid": [2, 0], "w": [30, 10]}),
+                        edge_id_col_name="eid")
+    edge_df = pG.get_edge_data()
+    assert get_values(edge_df, [pG.edge_id_col_name], "w") == [10, 2, 30]
+    assert pG.get_num_edges() == 3
+    with pytest.raises(ValueError):
+        pG.update_edge_data(df_type({"eid": [5], "w": [50]}),
+                            edge_id_col_name="eid")
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("per_type_storage", [False, True])
+def test_remove_data(df_type, per_type_storage):
+    """
+    Ensures remove_vertices() and remove_edges() remove the data for the
+    vertices and edges, and the counts, types, and IDs are updated.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    vcn = PropertyGraph.vertex_col_name
+    ecn = PropertyGraph.edge_id_col_name
+    pG = PropertyGraph(per_type_storage=per_type_storage)
+    pG.add_vertex_data(df_type({"v": [0, 1, 2], "p": [1, 2, 3]}),
+                       type_name="a", vertex_col_name="v")
+    pG.add_vertex_data(df_type({"v": [2, 3], "p": [4, 5]}),
+                       type_name="b", vertex_col_name="v")
+    pG.add_edge_data(df_type({"src": [0, 1, 2, 4], "dst": [1, 2, 3, 5]}),
+                     type_name="x", vertex_col_names=("src", "dst"))
+    pG.add_edge_data(df_type({"src": [3], "dst": [0]}),
+                     type_name="y", vertex_col_names=("src", "dst"))
+    assert pG.get_num_vertices() == 6
+
+    def get_ids(df, col):
+        if df is None:
+            return []
+        if isinstance(df, cudf.DataFrame):
+            df = df.to_pandas()
+        return sorted(df[col].tolist())
+
+    def num_selected(selections):
+        return int(selections.sum())
+
+    # Selecting by type creates the type indices, which must not be reused
+    # for the rows that remain after the removals below.
+    assert num_selected(
+        pG.select_vertices("_TYPE_ == 'a'").vertex_selections) == 3
+    assert num_selected(
+        pG.select_edges("_TYPE_ == 'x'").edge_selections) == 4
+
+    # Only the vertex data of type "b" is removed
+    pG.remove_vertices([2], types=["b"])
+    assert get_ids(pG.get_vertex_data(), vcn) == [0, 1, 2, 3]
+    assert pG.get_num_edges() == 5
+    assert pG.get_num_vertices() == 6
+
+    # The vertex data and the edges of vertex 0 are removed
+    pG.remove_vertices([0])
+    assert get_ids(pG.get_vertex_data(), vcn) == [1, 2, 3]
+    assert get_ids(pG.get_edge_data(), ecn) == [1, 2, 3]
+    assert pG.get_num_vertices() == 5
+    assert pG.get_num_vertices("a") == 2
+    assert pG.edge_types == {"x"}
+    assert num_selected(
+        pG.select_vertices("_TYPE_ == 'a'").vertex_selections) == 2
+    assert num_selected(
+        pG.select_edges("(_TYPE_ == 'x') & (_SRC_ > 1)").edge_selections) == 2
+
+    # Vertices 4 and 5 are no longer in any data
+    pG.remove_edges([3, 4])
+    assert get_ids(pG.get_edge_data(), ecn) == [1, 2]
+    assert pG.get_num_edges() == 2
+    assert pG.get_num_vertices() == 3
+    assert list(pG.get_vertices().values) == [1, 2, 3]
+
+    pG.remove_vertices([3])
+    assert pG.vertex_types == {"a"}
+    assert pG.get_num_vertices("b") == 0
+    assert num_selected(
+        pG.select_vertices("_TYPE_ == 'a'").vertex_selections) == 2
+    assert num_selected(
+        pG.select_edges("_TYPE_ == 'x'").edge_selections) == 1
+
+    # New edges get new edge IDs
+    pG.add_edge_data(df_type({"src": [7], "dst": [8]}),
+                     type_name="x", vertex_col_names=("src", "dst"))
+    assert get_ids(pG.get_edge_data(), ecn) == [1, 5]
+    assert pG.get_num_vertices() == 4
+
+
 def test_get_edges(dataset1_PropertyGraph):
     """
     Test that get_edges() returns the correct set of edges (as src/dst
@@ -1413,6 +2016,199 @@ def test_get_data_empty_graphs():
     assert pG.get_edge_data() is None
     assert pG.get_edge_data([0, 1, 2]) is None
 
+    pG = PropertyGraph(per_type_storage=True)
+
+    assert pG.get_vertex_data() is None
+    assert pG.get_vertex_data([0, 1, 2]) is None
+    assert pG.get_edge_data() is None
+    assert pG.get_edge_data([0, 1, 2]) is None
+    assert pG.edges is None
+    assert pG.get_num_vertices() == 0
+    assert pG.get_num_edges() == 0
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+@pytest.mark.parametrize("per_type_storage", [False, True])
+def test_get_data_id_lookups(df_type, per_type_storage):
+    """
+    Ensures get_vertex_data() and get_edge_data() return all rows for IDs
+    present more than once, once each for IDs requested more than once, and
+    ignore IDs that are not present.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pG = PropertyGraph(per_type_storage=per_type_storage)
+    pG.add_vertex_data(df_type({"vid": [5, 1, 3, 9], "a": [50, 10, 30, 90]}),
+                       vertex_col_name="vid", type_name="A")
+    pG.add_vertex_data(df_type({"vid": [3, 7, 1], "b": [0.3, 0.7, 0.1]}),
+                       vertex_col_name="vid", type_name="B")
+    for i in range(3):
+        pG.add_edge_data(df_type({"src": [1, 3, 5], "dst": [3, 5, 7],
+                                  "w": [i, i, i]}),
+                         vertex_col_names=("src", "dst"),
+                         type_name="C" if i == 1 else "D")
+
+    def ids(df, col_name):
+        if isinstance(df, cudf.DataFrame):
+            df = df.to_pandas()
+        return sorted(df[col_name].tolist())
+
+    vcn = pG.vertex_col_name
+    assert ids(pG.get_vertex_data([1, 3, 3, 4]), vcn) == [1, 1, 3, 3]
+    assert ids(pG.get_vertex_data([9, 100, 7]), vcn) == [7, 9]
+    assert ids(pG.get_vertex_data([1, 3, 9], types=["B"]), vcn) == [1, 3]
+    assert ids(pG.get_vertex_data(types=["A"]), vcn) == [1, 3, 5, 9]
+    assert len(pG.get_vertex_data([100])) == 0
+
+    ecn = pG.edge_id_col_name
+    assert ids(pG.get_edge_data([8, 0, 4, 4, 20]), ecn) == [0, 4, 8]
+    assert ids(pG.get_edge_data([0, 4, 8], types=["D"]), ecn) == [0, 8]
+    assert ids(pG.get_edge_data(types=["C"]), ecn) == [3, 4, 5]
+    assert ids(pG.get_edge_data(types=["C", "D"]), ecn) == list(range(9))
+    assert len(pG.get_edge_data([100])) == 0
+
+    # Ensure lookups use the data added after prior lookups
+    pG.add_vertex_data(df_type({"vid": [100], "a": [1000]}),
+                       vertex_col_name="vid", type_name="A")
+    pG.add_edge_data(df_type({"src": [100], "dst": [1], "w": [3]}),
+                     vertex_col_names=("src", "dst"), type_name="D")
+    assert ids(pG.get_vertex_data([100]), vcn) == [100]
+    assert ids(pG.get_edge_data([9]), ecn) == [9]
+
+
+def test_save_load(dataset1_PropertyGraph, tmp_path):
+    """
+    Ensures a PropertyGraph saved using save() can be loaded using load(),
+    with all or only some of the properties.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    (pG, data) = dataset1_PropertyGraph
+    pG.save(tmp_path)
+    loaded_pG = PropertyGraph.load(tmp_path)
+
+    def to_sorted_pandas(df, by):
+        if isinstance(df, cudf.DataFrame):
+            df = df.to_pandas()
+        return df[sorted(df.columns)].sort_values(by=by, ignore_index=True)
+
+    vertex_sort_cols = [pG.vertex_col_name, pG.type_col_name]
+    assert_frame_equal(
+        to_sorted_pandas(loaded_pG.get_vertex_data(), vertex_sort_cols),
+        to_sorted_pandas(pG.get_vertex_data(), vertex_sort_cols))
+    assert_frame_equal(
+        to_sorted_pandas(loaded_pG.get_edge_data(), [pG.edge_id_col_name]),
+        to_sorted_pandas(pG.get_edge_data(), [pG.edge_id_col_name]))
+    assert loaded_pG.get_num_vertices() == pG.get_num_vertices()
+    assert loaded_pG.vertex_types == pG.vertex_types
+    assert loaded_pG.edge_types == pG.edge_types
+
+    # Ensure the loaded PropertyGraph can be used for selections and new data
+    selection = loaded_pG.select_edges(
+        f"{pG.type_col_name} == 'transactions'")
+    G = loaded_pG.extract_subgraph(selection=selection,
+                                   create_using=DiGraph_inst)
+    assert G.number_of_edges() == len(data["transactions"][1])
+    df_type = type(pG.get_vertex_data())
+    loaded_pG.add_edge_data(df_type({"src": [89021], "dst": [4]}),
+                            vertex_col_names=("src", "dst"))
+    new_edge = loaded_pG.get_edge_data([pG.get_num_edges()])
+    assert len(new_edge) == 1
+    assert new_edge[pG.src_col_name].iloc[0] == 89021
+
+    # Load only some properties
+    loaded_pG = PropertyGraph.load(tmp_path,
+                                   vertex_property_columns=["merchant_size"],
+                                   edge_property_columns=["volume"])
+    assert loaded_pG.vertex_property_names == ["merchant_size"]
+    assert loaded_pG.edge_property_names == ["volume"]
+    assert loaded_pG.get_num_vertices() == pG.get_num_vertices()
+    assert loaded_pG.get_num_edges() == pG.get_num_edges()
+
+    with pytest.raises(ValueError):
+        PropertyGraph.load(tmp_path, vertex_property_columns=["bad_name"])
+
+
+@pytest.mark.parametrize("df_type", df_types, ids=df_type_id)
+def test_per_type_storage(df_type):
+    """
+    Ensures a PropertyGraph using per-type storage returns the same data as one
+    storing all properties in a single DataFrame, including when data for a
+    type is added more than once.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    pGs = [PropertyGraph(), PropertyGraph(per_type_storage=True)]
+    for pG in pGs:
+        for (name, vertex_col_name) in [("merchants", "merchant_id"),
+                                        ("users", "user_id")]:
+            pG.add_vertex_data(df_type(columns=dataset1[name][0],
+                                       data=dataset1[name][1]),
+                               type_name=name,
+                               vertex_col_name=vertex_col_name)
+        for (name, vertex_col_names) in [
+                ("transactions", ("user_id", "merchant_id")),
+                ("relationships", ("user_id_1", "user_id_2")),
+                ("referrals", ("user_id_1", "user_id_2"))]:
+            pG.add_edge_data(df_type(columns=dataset1[name][0],
+                                     data=dataset1[name][1]),
+                             type_name=name,
+                             vertex_col_names=vertex_col_names)
+        # Add more edges of an existing type after edges of other types
+        pG.add_edge_data(df_type(columns=["user_id", "merchant_id", "volume"],
+                                 data=[(89021, 4, 12.5)]),
+                         type_name="transactions",
+                         vertex_col_names=("user_id", "merchant_id"))
+    (pG, pG_per_type) = pGs
+
+    assert pG_per_type.vertex_types == pG.vertex_types
+    assert pG_per_type.edge_types == pG.edge_types
+    assert sorted(pG_per_type.vertex_property_names) == \
+        sorted(pG.vertex_property_names)
+    assert sorted(pG_per_type.edge_property_names) == \
+        sorted(pG.edge_property_names)
+    assert pG_per_type.get_num_vertices() == pG.get_num_vertices()
+    assert pG_per_type.get_num_edges() == pG.get_num_edges()
+    for type_name in pG.vertex_types:
+        assert pG_per_type.get_num_vertices(type_name) == \
+            pG.get_num_vertices(type_name)
+    for type_name in pG.edge_types:
+        assert pG_per_type.get_num_edges(type_name) == \
+            pG.get_num_edges(type_name)
+
+    def to_sorted_pandas(df, by):
+        if isinstance(df, cudf.DataFrame):
+            df = df.to_pandas()
+        return df[sorted(df.columns)].sort_values(by=by, ignore_index=True)
+
+    vertex_sort_cols = [pG.vertex_col_name, pG.type_col_name]
+    for kwargs in [{},
+                   {"vertex_ids": [11, 4, 89021]},
+                   {"types": ["users"], "columns": ["user_location"]}]:
+        assert_frame_equal(
+            to_sorted_pandas(pG_per_type.get_vertex_data(**kwargs),
+                             vertex_sort_cols),
+            to_sorted_pandas(pG.get_vertex_data(**kwargs), vertex_sort_cols),
+            check_dtype=False)
+
+    for kwargs in [{},
+                   {"edge_ids": [0, 5, 11, 13]},
+                   {"types": ["transactions"], "columns": ["volume"]}]:
+        assert_frame_equal(
+            to_sorted_pandas(pG_per_type.get_edge_data(**kwargs),
+                             [pG.edge_id_col_name]),
+            to_sorted_pandas(pG.get_edge_data(**kwargs),
+                             [pG.edge_id_col_name]),
+            check_dtype=False)
+
+    selection = pG_per_type.select_edges("(_TYPE_ == 'transactions') & "
+                                         "(volume > 100)")
+    G = pG_per_type.extract_subgraph(selection=selection,
+                                     create_using=DiGraph_inst)
+    expected_edges = pG.get_edge_data(types=["transactions"])
+    expected_edges = expected_edges[expected_edges["volume"] > 100]
+    assert G.number_of_edges() == len(expected_edges)
+
 
 # =============================================================================
 # Benchmarks
@@ -1517,3 +2313,172 @@ def bench_extract_subgraph_for_rmat_detect_duplicate_edges(
                                 allow_multi_edges=False)
 
     gpubenchmark(func)
+
+
+def bench_extract_subgraph_with_int_properties(gpubenchmark):
+    """
+    Benchmark extract_subgraph() for a Pandas-backed PropertyGraph with 1M
+    edges of each of 2 types, each type with 10 integer properties that the
+    other type does not have.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    num_edges = 1000000
+    num_props = 10
+    rng = np.random.default_rng(seed=42)
+    pG = PropertyGraph()
+    for type_name in ["a", "b"]:
+        df = pd.DataFrame({"src": rng.integers(0, num_edges, num_edges),
+                           "dst": rng.integers(0, num_edges, num_edges)})
+        for i in range(num_props):
+            df[f"{type_name}{i}"] = rng.integers(0, 2**62, num_edges)
+        pG.add_edge_data(df, type_name=type_name,
+                         vertex_col_names=("src", "dst"))
+
+    G = gpubenchmark(pG.extract_subgraph, allow_multi_edges=True)
+    assert len(G.edge_data) == 2 * num_edges
+
+
+@pytest.mark.slow
+def bench_add_edge_data_chunks(gpubenchmark):
+    """
+    Benchmark adding edge data as 100 DataFrames of 1M edges each to a
+    Pandas-backed PropertyGraph, as is done when loading a large edge list in
+    chunks. The peak RSS of the process is added to the benchmark extra_info.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    num_chunks = 100
+    chunk_size = 1000000
+    rng = np.random.default_rng(seed=42)
+    chunk = pd.DataFrame({"src": rng.integers(0, chunk_size, chunk_size),
+                          "dst": rng.integers(0, chunk_size, chunk_size),
+                          "weight": rng.random(chunk_size)})
+
+    def func():
+        pG = PropertyGraph()
+        for _ in range(num_chunks):
+            pG.add_edge_data(chunk, vertex_col_names=("src", "dst"))
+        # Accessing the edge data includes the cost of consolidating it
+        assert pG.get_num_edges() == num_chunks * chunk_size
+        return pG
+
+    gpubenchmark.pedantic(func, rounds=1, iterations=1)
+    # ru_maxrss is in KiB on Linux
+    gpubenchmark.extra_info["peak_rss_MiB"] = \
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+
+@pytest.mark.slow
+def bench_num_vertices_after_adding_data(gpubenchmark):
+    """
+    Benchmark getting the number of vertices of a Pandas-backed PropertyGraph
+    after adding each of 100 DataFrames of 100K edges, each with mostly new
+    vertices.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    num_chunks = 100
+    chunk_size = 100000
+    rng = np.random.default_rng(seed=42)
+    chunks = [pd.DataFrame({"src": rng.integers(0, 10 * chunk_size,
+                                                chunk_size) + i * chunk_size,
+                            "dst": rng.integers(0, 10 * chunk_size,
+                                                chunk_size) + i * chunk_size})
+              for i in range(num_chunks)]
+
+    def func():
+        pG = PropertyGraph()
+        for chunk in chunks:
+            pG.add_edge_data(chunk, vertex_col_names=("src", "dst"))
+            num_vertices = pG.get_num_vertices()
+        return num_vertices
+
+    num_vertices = gpubenchmark.pedantic(func, rounds=1, iterations=1)
+    assert num_vertices == len(np.unique(np.concatenate(
+        [chunk.values.ravel() for chunk in chunks])))
+
+
+@pytest.fixture(scope="module")
+def large_pandas_PropertyGraph():
+    """
+    Fixture which returns a Pandas-backed PropertyGraph with 50M vertices and
+    50M edges, each with a single property, for benchmarking lookups.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    num_rows = 50000000
+    rng = np.random.default_rng(seed=42)
+    pG = PropertyGraph()
+    pG.add_vertex_data(pd.DataFrame({"vertex": rng.permutation(num_rows),
+                                     "prop": rng.random(num_rows)}),
+                       vertex_col_name="vertex")
+    pG.add_edge_data(pd.DataFrame({"src": rng.integers(0, num_rows, num_rows),
+                                   "dst": rng.integers(0, num_rows, num_rows),
+                                   "prop": rng.random(num_rows)}),
+                     vertex_col_names=("src", "dst"))
+    return (pG, num_rows)
+
+
+@pytest.mark.slow
+def bench_get_vertex_data_lookups(gpubenchmark, large_pandas_PropertyGraph):
+    (pG, num_rows) = large_pandas_PropertyGraph
+    vertex_ids = np.random.default_rng(seed=0).integers(0, num_rows, 10000)
+    # Ensure the vertex ID index is created before benchmarking lookups
+    pG.get_vertex_data(vertex_ids[:1])
+
+    df = gpubenchmark(pG.get_vertex_data, vertex_ids)
+    assert len(df) == len(np.unique(vertex_ids))
+
+
+@pytest.mark.slow
+def bench_get_edge_data_lookups(gpubenchmark, large_pandas_PropertyGraph):
+    (pG, num_rows) = large_pandas_PropertyGraph
+    edge_ids = np.random.default_rng(seed=0).integers(0, num_rows, 10000)
+
+    df = gpubenchmark(pG.get_edge_data, edge_ids)
+    assert len(df) == len(np.unique(edge_ids))
+
+
+@pytest.mark.slow
+def bench_update_vertex_data(gpubenchmark, large_pandas_PropertyGraph):
+    """
+    Benchmark updating a property of 1M of the vertices of a large
+    Pandas-backed PropertyGraph.
+    """
+    (pG, num_rows) = large_pandas_PropertyGraph
+    num_updates = 1000000
+    rng = np.random.default_rng(seed=0)
+    updates = pd.DataFrame({"vertex": rng.choice(num_rows, num_updates,
+                                                 replace=False),
+                            "prop": rng.random(num_updates)})
+    # Ensure the vertex ID index is created before benchmarking updates
+    pG.get_vertex_data(updates["vertex"].iloc[:1])
+
+    gpubenchmark(pG.update_vertex_data, updates, vertex_col_name="vertex")
+    assert pG.get_num_vertices() == num_rows
+    df = pG.get_vertex_data(updates["vertex"].iloc[:10])
+    assert set(df["prop"]) == set(updates["prop"].iloc[:10])
+
+
+def bench_extract_subgraph_with_wide_edge_data(gpubenchmark):
+    """
+    Benchmark extract_subgraph() with a selection for a Pandas-backed
+    PropertyGraph with 1M edges, each with 60 properties.
+    """
+    from cugraph.experimental import PropertyGraph
+
+    num_edges = 1000000
+    num_props = 60
+    rng = np.random.default_rng(seed=42)
+    df = pd.DataFrame({"src": rng.integers(0, num_edges, num_edges),
+                       "dst": rng.integers(0, num_edges, num_edges)})
+    for i in range(num_props):
+        df[f"p{i}"] = rng.random(num_edges)
+    pG = PropertyGraph()
+    pG.add_edge_data(df, vertex_col_names=("src", "dst"))
+    selection = pG.select_edges("p0 < 0.5")
+
+    G = gpubenchmark(pG.extract_subgraph, selection=selection,
+                     edge_weight_property="p1", allow_multi_edges=True)
+    assert len(G.edge_data) == (df["p0"] < 0.5).sum()
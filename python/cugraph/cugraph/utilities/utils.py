@@ -12,13 +12,17 @@
 # limitations under the License.
 
 import importlib
+import importlib.util
 
-from numba import cuda
+# See cugraph/__init__.py. import_optional() and MissingModule are also used
+# by modules which only need host memory, and can be imported without cuDF.
+if importlib.util.find_spec("cudf") is not None:
+    from numba import cuda
 
-import cudf
+    import cudf
 
-from cuda.cudart import cudaDeviceAttr
-from rmm._cuda.gpu import getDeviceAttribute
+    from cuda.cudart import cudaDeviceAttr
+    from rmm._cuda.gpu import getDeviceAttribute
 
 
 # optional dependencies
@@ -13,3 +13,4 @@
 # limitations under the License.
 
 from cugraph_service_client.client import CugraphServiceClient
+from cugraph_service_client.async_client import AsyncCugraphServiceClient
@@ -0,0 +1,204 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+
+from cugraph_service_client import defaults
+from cugraph_service_client.client import CugraphServiceClient
+
+
+class AsyncCugraphServiceClient:
+    """
+    asyncio client object for cugraph_service, which defines the same API as
+    CugraphServiceClient, with each server API call as a coroutine.
+
+    Up to max_in_flight calls can be in progress at once, each using its own
+    connection from a pool of connections to the server, so a caller can
+    start a call (for example, uniform_neighbor_sample() for the next batch of
+    a training loop) and do other work while the server handles it. Calls
+    made while max_in_flight calls are in progress wait for one of them to
+    complete.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from cugraph_service_client import AsyncCugraphServiceClient
+    >>> async def sample(start_lists):
+    ...     async with AsyncCugraphServiceClient(max_in_flight=4) as client:
+    ...         return await asyncio.gather(
+    ...             *[client.uniform_neighbor_sample(start_list, [10, 10])
+    ...               for start_list in start_lists])
+    >>> results = asyncio.run(sample([[0, 1], [2, 3], [4, 5]]))
+    """
+    def __init__(self, host=defaults.host, port=defaults.port,
+                 result_format=defaults.result_format,
+                 max_in_flight=defaults.async_client_max_in_flight,
+                 pool_health_check_interval=30):
+        """
+        Creates a client for a cugraph_service server running on host/port.
+
+        Parameters
+        ----------
+        host : string, defaults to 127.0.0.1
+            Hostname where the cugraph_service server is running
+
+        port : int, defaults to 9090
+            Port number where the cugraph_service server is listening
+
+        result_format : string, defaults to "legacy"
+            The encoding the server should use for array results, see
+            CugraphServiceClient.
+
+        max_in_flight : int, defaults to 4
+            The maximum number of calls in progress at once, which is also
+            the maximum number of connections to the server. Since each open
+            connection uses a server worker, this cannot be more than the
+            number of workers the server was started with (see the server
+            --num-workers option), and CugraphServiceError is raised by the
+            first call if it is.
+
+        pool_health_check_interval : number, defaults to 30
+            Connections that have not been used for this many seconds are
+            checked before being used, see CugraphServiceClient.
+
+        Returns
+        -------
+        AsyncCugraphServiceClient object
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1, got "
+                             f"{max_in_flight}")
+        self.max_in_flight = max_in_flight
+        # The blocking calls are made by the executor threads using the pool
+        # of connections of the CugraphServiceClient, which each thread
+        # acquires for the duration of a call.
+        self.__client = CugraphServiceClient(
+            host, port,
+            result_format=result_format,
+            pool_size=max_in_flight,
+            pool_health_check_interval=pool_health_check_interval)
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_in_flight,
+            thread_name_prefix="AsyncCugraphServiceClient")
+
+    @property
+    def host(self):
+        return self.__client.host
+
+    @property
+    def port(self):
+        return self.__client.port
+
+    @property
+    def result_format(self):
+        return self.__client.result_format
+
+    async def close(self):
+        """
+        Wait for the calls in progress to complete, then close all
+        connections to the server. The client cannot be used after this.
+        """
+        if self.__client is None:
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.__executor.shutdown)
+        # Close the pool explicitly rather than when the CugraphServiceClient
+        # is deleted, since CallBatches returned by batch() may still
+        # reference it.
+        self.__client.close_pool()
+        self.__client = None
+
+    def batch(self):
+        """
+        Return a new, empty CallBatch for making multiple calls in a single
+        request to the server using call_batch(). Calls are added to the batch
+        the same way as for CugraphServiceClient.batch().
+        """
+        if self.__client is None:
+            raise RuntimeError("the client has been closed")
+        return self.__client.batch()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __call_in_executor(method_name):
+        """
+        Return a coroutine function that calls the CugraphServiceClient method
+        named method_name using one of the executor threads, with the
+        signature and docstring of that method.
+        """
+        @wraps(getattr(CugraphServiceClient, method_name))
+        async def coroutine_method(self, *args, **kwargs):
+            if self.__client is None:
+                raise RuntimeError("the client has been closed")
+            method = getattr(self.__client, method_name)
+            return await asyncio.get_running_loop().run_in_executor(
+                self.__executor, partial(method, *args, **kwargs))
+        return coroutine_method
+
+    ###########################################################################
+    # Environment management
+    uptime = __call_in_executor("uptime")
+    get_server_info = __call_in_executor("get_server_info")
+    get_server_stats = __call_in_executor("get_server_stats")
+    load_graph_creation_extensions = \
+        __call_in_executor("load_graph_creation_extensions")
+    unload_graph_creation_extensions = \
+        __call_in_executor("unload_graph_creation_extensions")
+    call_graph_creation_extension = \
+        __call_in_executor("call_graph_creation_extension")
+
+    ###########################################################################
+    # Graph management
+    create_graph = __call_in_executor("create_graph")
+    delete_graph = __call_in_executor("delete_graph")
+    get_graph_ids = __call_in_executor("get_graph_ids")
+    get_graph_info = __call_in_executor("get_graph_info")
+    load_csv_as_vertex_data = __call_in_executor("load_csv_as_vertex_data")
+    load_csv_as_edge_data = __call_in_executor("load_csv_as_edge_data")
+    load_parquet_as_vertex_data = \
+        __call_in_executor("load_parquet_as_vertex_data")
+    load_parquet_as_edge_data = \
+        __call_in_executor("load_parquet_as_edge_data")
+    get_edge_IDs_for_vertices = \
+        __call_in_executor("get_edge_IDs_for_vertices")
+    extract_subgraph = __call_in_executor("extract_subgraph")
+    get_graph_vertex_data = __call_in_executor("get_graph_vertex_data")
+    get_graph_edge_data = __call_in_executor("get_graph_edge_data")
+    is_vertex_property = __call_in_executor("is_vertex_property")
+    is_edge_property = __call_in_executor("is_edge_property")
+
+    ###########################################################################
+    # Algos
+    batched_ego_graphs = __call_in_executor("batched_ego_graphs")
+    node2vec = __call_in_executor("node2vec")
+    uniform_neighbor_sample = __call_in_executor("uniform_neighbor_sample")
+    run_algo = __call_in_executor("run_algo")
+    get_algo_names = __call_in_executor("get_algo_names")
+    pagerank = __call_in_executor("pagerank")
+    bfs = __call_in_executor("bfs")
+    sssp = __call_in_executor("sssp")
+    louvain = __call_in_executor("louvain")
+    weakly_connected_components = \
+        __call_in_executor("weakly_connected_components")
+    katz_centrality = __call_in_executor("katz_centrality")
+
+    ###########################################################################
+    # Batches
+    call_batch = __call_in_executor("call_batch")
@@ -13,12 +13,249 @@
 # limitations under the License.
 
 from functools import wraps
+from collections import deque
 from collections.abc import Sequence
+import json
 import pickle
+import threading
+import time
 
 from cugraph_service_client import defaults
-from cugraph_service_client.types import ValueWrapper, GraphVertexEdgeID
-from cugraph_service_client.cugraph_service_thrift import create_client
+from cugraph_service_client.types import (
+    ValueWrapper,
+    GraphVertexEdgeID,
+    ResultFormat,
+    decode_ndarray,
+    is_ndarray_buffer,
+)
+from cugraph_service_client.cugraph_service_thrift import (
+    spec,
+    create_client,
+    deserialize_call_result,
+    get_call_arg_names,
+    is_connection_error,
+    serialize_call_args,
+)
+
+
+class _ConnectionPool:
+    """
+    A pool of up to size open connections to the server at host/port, shared
+    by the threads using a CugraphServiceClient.
+
+    Connections are created as needed, and returned to the pool instead of
+    being closed when released. A connection that has been idle for longer
+    than health_check_interval seconds is checked by calling uptime() before
+    being reused, and is replaced with a new connection if the check fails.
+    If all size connections are in use, acquire() blocks until one is
+    released.
+
+    When the first connection is created, CugraphServiceError is raised if the
+    server reports handling fewer than size connections concurrently, since
+    the pool would then wait on connections that the server is not reading
+    from.
+    """
+    def __init__(self, host, port, size, call_timeout,
+                 health_check_interval):
+        self.host = host
+        self.port = port
+        self.size = size
+        self.call_timeout = call_timeout
+        self.health_check_interval = health_check_interval
+        # (connection, time released) tuples, most recently released last
+        self.__idle = deque()
+        self.__idle_lock = threading.Lock()
+        self.__available = threading.BoundedSemaphore(size)
+        # Set once the server has been checked by __check_server()
+        self.__server_checked = False
+
+    def acquire(self):
+        """
+        Return an open connection for the exclusive use of the caller until
+        it is passed to release().
+        """
+        self.__available.acquire()
+        try:
+            while True:
+                with self.__idle_lock:
+                    if not self.__idle:
+                        break
+                    (client, released_time) = self.__idle.pop()
+                if (time.monotonic() - released_time) < \
+                   self.health_check_interval:
+                    return client
+                try:
+                    client.uptime()
+                    return client
+                except Exception as e:
+                    client.close()
+                    if not is_connection_error(e):
+                        raise
+
+            client = create_client(self.host, self.port,
+                                   call_timeout=self.call_timeout)
+            if not self.__server_checked:
+                try:
+                    self.__check_server(client)
+                except BaseException:
+                    client.close()
+                    raise
+            return client
+        except BaseException:
+            self.__available.release()
+            raise
+
+    def release(self, client, discard=False):
+        """
+        Return client, acquired from acquire(), to the pool. If discard is
+        True, client is closed instead, for example when its connection is no
+        longer usable.
+        """
+        if discard:
+            client.close()
+        else:
+            with self.__idle_lock:
+                self.__idle.append((client, time.monotonic()))
+        self.__available.release()
+
+    def close(self):
+        """
+        Close all idle connections in the pool.
+        """
+        with self.__idle_lock:
+            while self.__idle:
+                (client, _) = self.__idle.pop()
+                client.close()
+
+    def __check_server(self, client):
+        """
+        Raise CugraphServiceError if the server connected to by client handles
+        fewer than size connections concurrently. Servers that do not report
+        this are assumed to handle enough.
+        """
+        server_info = client.get_server_info()
+        if "num_workers" in server_info:
+            num_workers = \
+                ValueWrapper(server_info["num_workers"]).get_py_obj()
+            if num_workers < self.size:
+                raise spec.CugraphServiceError(
+                    f"the server at {self.host}:{self.port} handles "
+                    f"{num_workers} connection(s) concurrently, which is "
+                    f"fewer than the {self.size} connections this client "
+                    "pools, restart the server with --num-workers "
+                    f"{self.size} or more, or use a smaller pool")
+        self.__server_checked = True
+
+
+class BatchResultRef:
+    """
+    Placeholder for the result of a call in a CallBatch, returned when the
+    call is added to the batch. It can be passed as an argument to later calls
+    in the same batch, for example to use the graph ID returned by
+    create_graph() or extract_subgraph().
+    """
+    def __init__(self, batch, index):
+        self.batch = batch
+        self.index = index
+
+    def __repr__(self):
+        return f"BatchResultRef(index={self.index})"
+
+
+class CallBatch:
+    """
+    An ordered list of calls to CugraphServiceClient methods, which are sent
+    to the server and made in a single request by
+    CugraphServiceClient.call_batch(). Calls are added to the batch by calling
+    the CugraphServiceClient method of the same name on the CallBatch, which
+    returns a BatchResultRef for the result of the call.
+
+    Examples
+    --------
+    >>> from cugraph_service_client import CugraphServiceClient
+    >>> client = CugraphServiceClient()
+    >>> batch = client.batch()
+    >>> graph_id = batch.create_graph()
+    >>> batch.load_csv_as_edge_data("/server/path/to/edge_data.csv",
+    ...                             dtypes=["int32", "int32", "float32"],
+    ...                             vertex_col_names=["src", "dst"],
+    ...                             graph_id=graph_id)
+    >>> subgraph_id = batch.extract_subgraph(graph_id=graph_id)
+    >>> batch.uniform_neighbor_sample([1, 2], [10], graph_id=subgraph_id)
+    >>> results = batch.execute()
+    """
+    def __init__(self, client):
+        self.client = client
+        # (method name, args, kwargs) of each call, in order
+        self.calls = []
+
+    def __len__(self):
+        return len(self.calls)
+
+    def __getattr__(self, name):
+        method = getattr(CugraphServiceClient, name, None)
+        # Only the public methods that make a single server call (those using
+        # the __server_connection decorator) can be batched.
+        if name.startswith("_") or not hasattr(method, "__wrapped__"):
+            raise AttributeError(f"{name} cannot be called in a batch")
+
+        @wraps(method)
+        def add_call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return BatchResultRef(self, len(self.calls) - 1)
+        return add_call
+
+    def execute(self):
+        """
+        Make the calls in the batch, see CugraphServiceClient.call_batch().
+        """
+        return self.client.call_batch(self)
+
+
+class _BatchCallRecorded(Exception):
+    pass
+
+
+class _BatchCallRecorder:
+    """
+    Stands in for the Thrift client object while a CugraphServiceClient
+    method is called for a CallBatch, recording the server call it makes
+    instead of making it.
+    """
+    def __init__(self):
+        self.method_name = None
+        self.args = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*args):
+            self.method_name = name
+            self.args = args
+            raise _BatchCallRecorded
+        return record
+
+
+class _BatchCallReplayer:
+    """
+    Stands in for the Thrift client object while a CugraphServiceClient
+    method is called again for a CallBatch, returning the result of (or
+    raising the error from) the call made by the server for the batch.
+    """
+    def __init__(self, value, error):
+        self.value = value
+        self.error = error
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def replay(*args):
+            if self.error is not None:
+                raise self.error
+            return self.value
+        return replay
 
 
 class CugraphServiceClient:
@@ -26,7 +263,13 @@ class CugraphServiceClient:
     Client object for cugraph_service, which defines the API that clients can
     use to access the cugraph_service server.
     """
-    def __init__(self, host=defaults.host, port=defaults.port):
+    __result_formats = {"binary": ResultFormat.BINARY,
+                        "legacy": ResultFormat.LEGACY}
+
+    def __init__(self, host=defaults.host, port=defaults.port,
+                 result_format=defaults.result_format,
+                 pool_size=defaults.client_pool_size,
+                 pool_health_check_interval=30):
         """
         Creates a connection to a cugraph_service server running on host/port.
 
@@ -38,6 +281,29 @@ class CugraphServiceClient:
         port : int, defaults to 9090
             Port number where the cugraph_service server is listening
 
+        result_format : string, defaults to "legacy"
+            The encoding the server should use for array results. "legacy"
+            transfers arrays as lists of individually encoded values (and
+            graph data as pickled numpy arrays), and returns lists. "binary"
+            transfers each array as a single buffer, which is much faster for
+            large results, and returns numpy arrays. Servers that do not
+            support "binary" return "legacy" results.
+
+        pool_size : int, defaults to 0
+            The maximum number of connections to the server to keep open and
+            reuse for subsequent calls, shared by all threads using this
+            client. If 0, a new connection is opened and closed for each call
+            (unless hold_open is True). Since each open connection uses a
+            server worker, this cannot be more than the number of workers the
+            server was started with (see the server --num-workers option), and
+            CugraphServiceError is raised by the first call if it is.
+
+        pool_health_check_interval : number, defaults to 30
+            Connections from the pool that have not been used for this many
+            seconds are checked by calling uptime() before being used, and are
+            replaced by a new connection if the server cannot be reached using
+            them.
+
         Returns
         -------
         CugraphServiceClient object
@@ -47,17 +313,44 @@ class CugraphServiceClient:
         >>> from cugraph_service_client import CugraphServiceClient
         >>> client = CugraphServiceClient()
         """
+        # The connection used by each thread, from the pool if enabled
+        self.__thread_local = threading.local()
+        self.__pool = None
+
+        if result_format not in self.__result_formats:
+            raise ValueError("result_format must be one of "
+                             f"{list(self.__result_formats)}, got "
+                             f"{result_format!r}")
         self.host = host
         self.port = port
-        self.__client = None
+        self.result_format = result_format
 
         # If True, do not automatically close a server connection upon
         # completion or error of a server API call. This requires the caller to
-        # manually call close() when done.
+        # manually call close() when done. Each thread uses its own connection.
         self.hold_open = False
 
+        if pool_size > 0:
+            self.__pool = _ConnectionPool(
+                host, port, pool_size,
+                call_timeout=900000,
+                health_check_interval=pool_health_check_interval)
+
     def __del__(self):
         self.close()
+        self.close_pool()
+
+    @property
+    def __client(self):
+        """
+        The connection to the server used by the current thread, or None if
+        not open.
+        """
+        return getattr(self.__thread_local, "client", None)
+
+    @__client.setter
+    def __client(self, client):
+        self.__thread_local.client = client
 
     def __server_connection(method):
         """
@@ -67,13 +360,21 @@ class CugraphServiceClient:
         not take place, allowing for multiple subsequent server calls to be
         made using the same connection. self.hold_open therefore requires the
         caller to manually call close() in order to allow other clients to
-        connect.
+        connect. A server started with more than one worker (see the server
+        --num-workers option) can have that many connections open at once.
+        If a connection pool is used, "closing" a connection returns it to the
+        pool instead, unless the call failed due to a connection error.
         """
         @wraps(method)
         def wrapped_method(self, *args, **kwargs):
             self.open()
             try:
                 ret_val = method(self, *args, **kwargs)
+            except Exception as e:
+                # Do not reuse a connection that failed
+                if is_connection_error(e):
+                    self.__close_connection(discard=True)
+                raise
             finally:
                 if not self.hold_open:
                     self.close()
@@ -114,14 +415,19 @@ class CugraphServiceClient:
 
         """
         if self.__client is None:
-            self.__client = create_client(self.host, self.port,
-                                          call_timeout=call_timeout)
+            if self.__pool is not None:
+                self.__client = self.__pool.acquire()
+            else:
+                self.__client = create_client(self.host, self.port,
+                                              call_timeout=call_timeout)
 
     def close(self):
         """
         Closes a connection to the server if one has been established, allowing
         other clients to access the server. This method is called automatically
-        for all APIs that access the server if self.hold_open is False.
+        for all APIs that access the server if self.hold_open is False. If the
+        client was created with a pool_size greater than 0, the connection is
+        returned to the pool to be reused instead of being closed.
 
         Parameters
         ----------
@@ -145,9 +451,34 @@ class CugraphServiceClient:
         >>> # go back to automatic open/close mode (safer)
         >>> client.hold_open = False
         """
-        if self.__client is not None:
-            self.__client.close()
-            self.__client = None
+        self.__close_connection()
+
+    def close_pool(self):
+        """
+        Closes the idle connections in the pool of connections, if the client
+        was created with a pool_size greater than 0, allowing the server
+        workers they use to handle other clients. Connections in use by calls
+        in progress are returned to the pool when the calls complete, so this
+        should be called after all calls have completed. The pool opens new
+        connections if the client is used again.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient(pool_size=4)
+        >>> client.uptime()
+        >>> client.close_pool()
+        """
+        if self.__pool is not None:
+            self.__pool.close()
 
     ###########################################################################
     # Environment management
@@ -195,7 +526,7 @@ class CugraphServiceClient:
         >>> from cugraph_service_client import CugraphServiceClient
         >>> client = CugraphServiceClient()
         >>> client.get_server_info()
-        >>> {'num_gpus': 2}
+        >>> {'num_gpus': 2, 'backend': 'gpu'}
         """
         server_info = self.__client.get_server_info()
         # server_info is a dictionary of Value objects ("union" types returned
@@ -203,6 +534,46 @@ class CugraphServiceClient:
         return dict((k, ValueWrapper(server_info[k]).get_py_obj())
                     for k in server_info)
 
+    @__server_connection
+    def get_server_stats(self, format="json"):
+        """
+        Return statistics about the calls handled by the server, per method.
+
+        Parameters
+        ----------
+        format : string, defaults to "json"
+            If "json", the statistics are returned as a dictionary. If
+            "prometheus", they are returned as text in the Prometheus
+            exposition format.
+
+        Returns
+        -------
+        server_stats : dict or string
+
+            If a dictionary, it contains the server "uptime", the
+            "window_seconds" the histograms cover, and the statistics of each
+            method called in "methods", keyed by method name. Each method has
+            the cumulative number of "calls" and "errors", total
+            "request_bytes" and "response_bytes", and the
+            "queue_wait_seconds", "execution_seconds",
+            "serialization_seconds", and "response_size_bytes" histograms of
+            the calls made in the last window_seconds. A histogram has the
+            "count" and "sum" of values, counts for each bucket ("buckets"),
+            and the estimated "p50", "p90", and "p99" percentiles.
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> stats = client.get_server_stats()
+        >>> stats["methods"]["uniform_neighbor_sample"]["execution_seconds"]
+        {'count': 12, 'sum': 0.43, 'buckets': [...], 'p50': 0.05, ...}
+        """
+        server_stats = self.__client.get_server_stats(format)
+        if format == "json":
+            return json.loads(server_stats)
+        return server_stats
+
     @__server_connection
     def load_graph_creation_extensions(self, extension_dir_path):
         """
@@ -458,7 +829,8 @@ class CugraphServiceClient:
         Parameters
         ----------
         csv_file_name : string
-            Path to CSV file on the server
+            Path to CSV file on the server, or a glob pattern matching
+            multiple CSV files with the same columns
 
         dtypes : list of strings
             Types for the columns in the CSV file
@@ -542,7 +914,8 @@ class CugraphServiceClient:
         Parameters
         ----------
         csv_file_name : string
-            Path to CSV file on the server
+            Path to CSV file on the server, or a glob pattern matching
+            multiple CSV files with the same columns
 
         dtypes : list of strings
             Types for the columns in the CSV file
@@ -608,6 +981,122 @@ class CugraphServiceClient:
                                                    graph_id,
                                                    names or [])
 
+    @__server_connection
+    def load_parquet_as_vertex_data(self,
+                                    parquet_path,
+                                    vertex_col_name,
+                                    type_name="",
+                                    property_columns=None,
+                                    graph_id=defaults.graph_id,
+                                    ):
+        """
+        Reads the Parquet data at parquet_path and applies it as vertex data
+        to the graph identified as graph_id (or the default graph if not
+        specified). The files are read in parallel, and by the dask workers
+        if the server uses a dask cluster.
+
+        Parameters
+        ----------
+        parquet_path : string
+            Path on the server to a Parquet file, a directory of Parquet files
+            (such as a partitioned dataset), or a glob pattern matching
+            either.
+
+        vertex_col_name : string
+            Name of the column to use as the vertex ID
+
+        type_name : string, default is ""
+            The vertex property "type" the Parquet data is describing.
+
+        property_columns : list of strings, default is None
+            The column names in the Parquet data to add as vertex properties.
+            If None, all columns will be added as properties. Only the
+            vertex_col_name and property_columns columns are read.
+
+        graph_id : int, default is defaults.graph_id
+            The graph ID to apply the properties to. If not provided the
+            default graph ID is used.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> client.load_parquet_as_vertex_data(
+        ... "/server/path/to/users_parquet_dir",
+        ... vertex_col_name="user_id",
+        ... type_name="users",
+        ... property_columns=["zipcode"])
+        >>>
+        """
+        return self.__client.load_parquet_as_vertex_data(
+            parquet_path,
+            vertex_col_name,
+            type_name,
+            property_columns or [],
+            graph_id)
+
+    @__server_connection
+    def load_parquet_as_edge_data(self,
+                                  parquet_path,
+                                  vertex_col_names,
+                                  type_name="",
+                                  property_columns=None,
+                                  graph_id=defaults.graph_id,
+                                  ):
+        """
+        Reads the Parquet data at parquet_path and applies it as edge data to
+        the graph identified as graph_id (or the default graph if not
+        specified). The files are read in parallel, and by the dask workers if
+        the server uses a dask cluster.
+
+        Parameters
+        ----------
+        parquet_path : string
+            Path on the server to a Parquet file, a directory of Parquet files
+            (such as a partitioned dataset), or a glob pattern matching
+            either.
+
+        vertex_col_names : tuple of strings
+            Names of the columns to use as the source and destination vertex
+            IDs defining the edges
+
+        type_name : string, default is ""
+            The edge property "type" the Parquet data is describing.
+
+        property_columns : list of strings, default is None
+            The column names in the Parquet data to add as edge properties. If
+            None, all columns will be added as properties. Only the
+            vertex_col_names and property_columns columns are read.
+
+        graph_id : int, default is defaults.graph_id
+            The graph ID to apply the properties to. If not provided the
+            default graph ID is used.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> client.load_parquet_as_edge_data(
+        ... "/server/path/to/transactions_parquet_dir",
+        ... vertex_col_names=("user_id", "merchant_id"),
+        ... type_name="transactions")
+        >>>
+        """
+        return self.__client.load_parquet_as_edge_data(
+            parquet_path,
+            list(vertex_col_names),
+            type_name,
+            property_columns or [],
+            graph_id)
+
     @__server_connection
     def get_edge_IDs_for_vertices(self, src_vert_IDs, dst_vert_IDs,
                                   graph_id=defaults.graph_id):
@@ -628,7 +1117,8 @@ class CugraphServiceClient:
                          allow_multi_edges=False,
                          renumber_graph=True,
                          add_edge_data=True,
-                         graph_id=defaults.graph_id
+                         graph_id=defaults.graph_id,
+                         auto_refresh=False
                          ):
         """
         Return a graph ID for a subgraph of the graph referenced by graph_id
@@ -641,13 +1131,13 @@ class CugraphServiceClient:
             selected subgraph of vertices and edges. The default (None) results
             in a cugraph.Graph object.
 
-        selection : int, default is None
-            A PropertySelection ID returned from one or more calls to
-            select_vertices() and/or select_edges(), used for creating a Graph
-            with only the selected properties. If not speciied the resulting
-            Graph will have all properties. Note, this could result in a Graph
-            with multiple edges, which may not be supported based on the value
-            of create_using.
+        selection : string, default is None
+            An edge selection expression (see PropertyGraph.select_edges()),
+            used for creating a Graph with only the selected edges, for
+            example "_TYPE_ == 'transactions' & volume > 100". If not
+            specified the resulting Graph will have all edges. Note, this
+            could result in a Graph with multiple edges, which may not be
+            supported based on the value of create_using.
 
         edge_weight_property : string, default is ""
             The name of the property whose values will be used as weights on
@@ -667,6 +1157,13 @@ class CugraphServiceClient:
            The graph ID to extract the subgraph from. If the ID passed is not
            valid on the server, CugraphServiceError is raised.
 
+        auto_refresh : bool, default is False
+            If True, edges added to the graph referenced by graph_id after the
+            subgraph is extracted are added to the subgraph by the server the
+            next time the subgraph is used, so it does not need to be
+            extracted again. Only the new edges are read from the graph and
+            filtered using the selection.
+
         Returns
         -------
         A graph ID for a new Graph instance of the same type as create_using
@@ -691,7 +1188,8 @@ class CugraphServiceClient:
                                               allow_multi_edges,
                                               renumber_graph,
                                               add_edge_data,
-                                              graph_id)
+                                              graph_id,
+                                              auto_refresh)
 
     @__server_connection
     def get_graph_vertex_data(self,
@@ -736,10 +1234,11 @@ class CugraphServiceClient:
                 vertex_edge_id_obj,
                 null_replacement_value_obj,
                 graph_id,
-                property_keys or []
+                property_keys or [],
+                self.__result_formats[self.result_format]
             )
 
-        return pickle.loads(ndarray_bytes)
+        return self.__decode_graph_data(ndarray_bytes)
 
     @__server_connection
     def get_graph_edge_data(self,
@@ -784,10 +1283,127 @@ class CugraphServiceClient:
                 vertex_edge_id_obj,
                 null_replacement_value_obj,
                 graph_id,
-                property_keys or []
+                property_keys or [],
+                self.__result_formats[self.result_format]
             )
 
-        return pickle.loads(ndarray_bytes)
+        return self.__decode_graph_data(ndarray_bytes)
+
+    def get_graph_vertex_data_batches(self,
+                                      id_or_ids=-1,
+                                      null_replacement_value=0,
+                                      graph_id=defaults.graph_id,
+                                      property_keys=None,
+                                      batch_size=defaults.graph_data_batch_size
+                                      ):
+        """
+        Returns an iterator of the same vertex data as get_graph_vertex_data()
+        as numpy arrays of at most batch_size rows each. Only one batch is
+        transferred at a time, so the memory used by both the client and the
+        server depends on batch_size instead of the size of the data.
+
+        Parameters
+        ----------
+        id_or_ids : int or list of ints (default -1)
+
+        null_replacement_value : number or string (default 0)
+
+        graph_id : int, default is defaults.graph_id
+           The graph ID to get the vertex data from. If the ID passed is not
+           valid on the server, CugraphServiceError is raised.
+
+        property_keys : list of strings (default [])
+            The keys (names) of properties to retrieve.  If omitted, returns
+            all properties.
+
+        batch_size : int (default 1000000)
+            The maximum number of rows in each array.
+
+        Returns
+        -------
+        An iterator of numpy arrays
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> for batch in client.get_graph_vertex_data_batches(
+        ...         property_keys=["user_location"], batch_size=1000):
+        ...     process(batch)
+        """
+        vertex_edge_id_obj = self.__get_vertex_edge_id_obj(id_or_ids)
+        null_replacement_value_obj = ValueWrapper(
+            null_replacement_value,
+            val_name="null_replacement_value").union
+
+        cursor_id = self.__open_graph_data_cursor(
+            "open_graph_vertex_data_cursor",
+            vertex_edge_id_obj,
+            null_replacement_value_obj,
+            graph_id,
+            property_keys or [],
+            self.__result_formats[self.result_format],
+            batch_size
+        )
+        return self.__iter_graph_data_cursor(cursor_id)
+
+    def get_graph_edge_data_batches(self,
+                                    id_or_ids=-1,
+                                    null_replacement_value=0,
+                                    graph_id=defaults.graph_id,
+                                    property_keys=None,
+                                    batch_size=defaults.graph_data_batch_size
+                                    ):
+        """
+        Returns an iterator of the same edge data as get_graph_edge_data() as
+        numpy arrays of at most batch_size rows each. Only one batch is
+        transferred at a time, so the memory used by both the client and the
+        server depends on batch_size instead of the size of the data.
+
+        Parameters
+        ----------
+        id_or_ids : int or list of ints (default -1)
+
+        null_replacement_value : number or string (default 0)
+
+        graph_id : int, default is defaults.graph_id
+           The graph ID to get the edge data from. If the ID passed is not
+           valid on the server, CugraphServiceError is raised.
+
+        property_keys : list of strings (default [])
+            The keys (names) of properties to retrieve.  If omitted, returns
+            all properties.
+
+        batch_size : int (default 1000000)
+            The maximum number of rows in each array.
+
+        Returns
+        -------
+        An iterator of numpy arrays
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> for batch in client.get_graph_edge_data_batches(
+        ...         property_keys=["volume"], batch_size=1000):
+        ...     process(batch)
+        """
+        vertex_edge_id_obj = self.__get_vertex_edge_id_obj(id_or_ids)
+        null_replacement_value_obj = ValueWrapper(
+            null_replacement_value,
+            val_name="null_replacement_value").union
+
+        cursor_id = self.__open_graph_data_cursor(
+            "open_graph_edge_data_cursor",
+            vertex_edge_id_obj,
+            null_replacement_value_obj,
+            graph_id,
+            property_keys or [],
+            self.__result_formats[self.result_format],
+            batch_size
+        )
+        return self.__iter_graph_data_cursor(cursor_id)
 
     @__server_connection
     def is_vertex_property(self, property_key, graph_id=defaults.graph_id):
@@ -838,20 +1454,15 @@ class CugraphServiceClient:
 
         if not isinstance(seeds, list):
             seeds = [seeds]
-        batched_ego_graphs_result = self.__client.batched_ego_graphs(seeds,
-                                                                     radius,
-                                                                     graph_id)
-
-        # FIXME: ensure dtypes are correct for values returned from
-        # cugraph.batched_ego_graphs() in cugraph_handler.py
-        # return (numpy.frombuffer(batched_ego_graphs_result.src_verts,
-        #         dtype="int32"),
-        #         numpy.frombuffer(batched_ego_graphs_result.dst_verts,
-        #         dtype="int32"),
-        #         numpy.frombuffer(batched_ego_graphs_result.edge_weights,
-        #         dtype="float64"),
-        #         numpy.frombuffer(batched_ego_graphs_result.seeds_offsets,
-        #         dtype="int64"))
+        batched_ego_graphs_result = self.__client.batched_ego_graphs(
+            seeds,
+            radius,
+            graph_id,
+            self.__result_formats[self.result_format])
+        self.__decode_array_result(batched_ego_graphs_result,
+                                   ["src_verts", "dst_verts", "edge_weights",
+                                    "seeds_offsets"])
+
         return (batched_ego_graphs_result.src_verts,
                 batched_ego_graphs_result.dst_verts,
                 batched_ego_graphs_result.edge_weights,
@@ -888,9 +1499,15 @@ class CugraphServiceClient:
             start_vertices = [start_vertices]
         # FIXME: ensure list is a list of int32, since Thrift interface
         # specifies that?
-        node2vec_result = self.__client.node2vec(start_vertices,
-                                                 max_depth,
-                                                 graph_id)
+        node2vec_result = self.__client.node2vec(
+            start_vertices,
+            max_depth,
+            graph_id,
+            self.__result_formats[self.result_format])
+        self.__decode_array_result(node2vec_result,
+                                   ["vertex_paths", "edge_weights",
+                                    "path_sizes"])
+
         return (node2vec_result.vertex_paths,
                 node2vec_result.edge_weights,
                 node2vec_result.path_sizes)
@@ -920,19 +1537,243 @@ class CugraphServiceClient:
 
         """
 
-        return self.__client.uniform_neighbor_sample(
+        result = self.__client.uniform_neighbor_sample(
             start_list,
             fanout_vals,
             with_replacement,
             graph_id,
+            self.__result_formats[self.result_format]
         )
+        return self.__decode_array_result(result,
+                                          ["sources", "destinations",
+                                           "indices"])
 
     @__server_connection
-    def pagerank(self, graph_id=defaults.graph_id):
+    def run_algo(self, algo_name, graph_id=defaults.graph_id, **params):
         """
-        pagerank
+        Run the algo named algo_name on the graph identified by graph_id on
+        the server, passing it params, and return its results.
+
+        Parameters
+        ----------
+        algo_name : string
+            The name of the algo to run, one of the names returned by
+            get_algo_names().
+
+        graph_id : int, default is defaults.graph_id
+            The graph to run the algo on, which must not be a graph with
+            properties (see extract_subgraph()).
+
+        **params
+            The parameters of the algo, each an int, float, bool, or string.
+
+        Returns
+        -------
+        results : dict
+            Dictionary of numpy arrays keyed by result name. Scalar results
+            are returned as 0-d arrays.
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> client.load_csv_as_edge_data(...)
+        >>> G = client.extract_subgraph(...)
+        >>> client.run_algo("pagerank", G, alpha=0.9)
+        {'vertex': array([0, 1, 2], dtype=int32),
+         'pagerank': array([0.26, 0.48, 0.26], dtype=float32)}
         """
-        raise NotImplementedError
+        return self.__run_algo(algo_name, graph_id, params)
+
+    @__server_connection
+    def get_algo_names(self):
+        """
+        Return the names of the algos that can be run on the graphs of the
+        server using run_algo().
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        algo_names : list of strings
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> client.get_algo_names()
+        ['pagerank', 'bfs', 'sssp', 'louvain', ...]
+        """
+        return self.__client.get_algo_names()
+
+    @__server_connection
+    def pagerank(self, alpha=0.85, max_iter=100, tol=1.0e-5,
+                 graph_id=defaults.graph_id):
+        """
+        Run PageRank on the graph identified by graph_id on the server, see
+        cugraph.pagerank().
+
+        Returns
+        -------
+        results : dict
+            Dictionary of the numpy arrays "vertex" and "pagerank".
+        """
+        return self.__run_algo("pagerank", graph_id,
+                               dict(alpha=alpha, max_iter=max_iter, tol=tol))
+
+    @__server_connection
+    def bfs(self, start, depth_limit=None, graph_id=defaults.graph_id):
+        """
+        Run a breadth-first search from the vertex start on the graph
+        identified by graph_id on the server, see cugraph.bfs().
+
+        Returns
+        -------
+        results : dict
+            Dictionary of the numpy arrays "vertex", "distance", and
+            "predecessor".
+        """
+        params = dict(start=start)
+        if depth_limit is not None:
+            params["depth_limit"] = depth_limit
+        return self.__run_algo("bfs", graph_id, params)
+
+    @__server_connection
+    def sssp(self, source, cutoff=None, graph_id=defaults.graph_id):
+        """
+        Compute the shortest paths from the vertex source on the graph
+        identified by graph_id on the server, see cugraph.sssp().
+
+        Returns
+        -------
+        results : dict
+            Dictionary of the numpy arrays "vertex", "distance", and
+            "predecessor".
+        """
+        params = dict(source=source)
+        if cutoff is not None:
+            params["cutoff"] = cutoff
+        return self.__run_algo("sssp", graph_id, params)
+
+    @__server_connection
+    def louvain(self, max_iter=100, resolution=1.0,
+                graph_id=defaults.graph_id):
+        """
+        Partition the graph identified by graph_id on the server using the
+        Louvain method, see cugraph.louvain().
+
+        Returns
+        -------
+        parts : dict
+            Dictionary of the numpy arrays "vertex" and "partition".
+
+        modularity : float
+            The modularity score of the partitioning.
+        """
+        results = self.__run_algo("louvain", graph_id,
+                                  dict(max_iter=max_iter,
+                                       resolution=resolution))
+        modularity = float(results.pop("modularity"))
+        return (results, modularity)
+
+    @__server_connection
+    def weakly_connected_components(self, graph_id=defaults.graph_id):
+        """
+        Label the weakly connected components of the graph identified by
+        graph_id on the server, see cugraph.weakly_connected_components().
+
+        Returns
+        -------
+        results : dict
+            Dictionary of the numpy arrays "labels" and "vertex".
+        """
+        return self.__run_algo("weakly_connected_components", graph_id, {})
+
+    @__server_connection
+    def katz_centrality(self, alpha=None, beta=1.0, max_iter=100,
+                        tol=1.0e-6, normalized=True,
+                        graph_id=defaults.graph_id):
+        """
+        Compute the Katz centrality of the vertices of the graph identified
+        by graph_id on the server, see cugraph.katz_centrality().
+
+        Returns
+        -------
+        results : dict
+            Dictionary of the numpy arrays "vertex" and "katz_centrality".
+        """
+        params = dict(beta=beta, max_iter=max_iter, tol=tol,
+                      normalized=normalized)
+        if alpha is not None:
+            params["alpha"] = alpha
+        return self.__run_algo("katz_centrality", graph_id, params)
+
+    ###########################################################################
+    # Batches
+    def batch(self):
+        """
+        Return a new, empty CallBatch for making multiple calls in a single
+        request to the server using call_batch().
+        """
+        return CallBatch(self)
+
+    def call_batch(self, batch):
+        """
+        Make the calls added to the CallBatch batch in a single request to the
+        server, which makes them in order, and return a list of the result of
+        each call, the same as the one returned by calling the method
+        directly. Each BatchResultRef passed as an argument is replaced by the
+        result of the call it refers to. This saves a round trip to the server
+        (and by default, a connection) per call, for example when loading
+        data into a new graph and extracting a subgraph from it.
+
+        A BatchResultRef can only be passed as an argument which is passed
+        unchanged to the server, such as graph_id. The calls are not made as
+        a transaction: if a call raises an error, the calls before it are not
+        undone, the calls after it are not made, and a CugraphServiceError
+        for the error is raised.
+
+        Parameters
+        ----------
+        batch : CallBatch
+            The calls to make, created using batch().
+
+        Returns
+        -------
+        A list of the results of the calls in batch, in order.
+
+        Examples
+        --------
+        >>> from cugraph_service_client import CugraphServiceClient
+        >>> client = CugraphServiceClient()
+        >>> batch = client.batch()
+        >>> graph_id = batch.create_graph()
+        >>> batch.load_csv_as_edge_data("/server/path/to/edge_data.csv",
+        ...                             dtypes=["int32", "int32", "float32"],
+        ...                             vertex_col_names=["src", "dst"],
+        ...                             graph_id=graph_id)
+        >>> batch.get_graph_info(["num_edges"], graph_id=graph_id)
+        >>> client.call_batch(batch)
+        [1, None, 99]
+        """
+        batch_calls = [self.__get_batch_call(batch, i, *call)
+                       for (i, call) in enumerate(batch.calls)]
+        serialized_results = self.__call_batch(batch_calls)
+
+        results = []
+        for ((method_name, args, kwargs), batch_call, serialized_result) in \
+                zip(batch.calls, batch_calls, serialized_results):
+            (value, error) = deserialize_call_result(batch_call.method_name,
+                                                     serialized_result)
+            if error is not None:
+                raise spec.CugraphServiceError(
+                    f"call {len(results)} of the batch ({method_name}) "
+                    f"failed: {error.message}")
+            results.append(self.__call_unwrapped(
+                _BatchCallReplayer(value, error), method_name, args, kwargs))
+        return results
 
     ###########################################################################
     # Test/Debug
@@ -945,6 +1786,152 @@ class CugraphServiceClient:
 
     ###########################################################################
     # Private
+    @__server_connection
+    def __open_graph_data_cursor(self, open_method_name, *args):
+        return getattr(self.__client, open_method_name)(*args)
+
+    @__server_connection
+    def __get_next_graph_data_batch(self, cursor_id):
+        return self.__client.get_next_graph_data_batch(cursor_id)
+
+    @__server_connection
+    def __close_graph_data_cursor(self, cursor_id):
+        self.__client.close_graph_data_cursor(cursor_id)
+
+    def __iter_graph_data_cursor(self, cursor_id):
+        """
+        Yield the numpy array decoded from each batch of the server cursor
+        identified by cursor_id, closing the cursor if the caller stops
+        iterating before all batches are read.
+        """
+        while True:
+            ndarray_bytes = self.__get_next_graph_data_batch(cursor_id)
+            if not ndarray_bytes:
+                return
+            try:
+                yield self.__decode_graph_data(ndarray_bytes)
+            except GeneratorExit:
+                self.__close_graph_data_cursor(cursor_id)
+                raise
+
+    def __run_algo(self, algo_name, graph_id, params):
+        """
+        Call run_algo on the server and return the results as a dictionary of
+        numpy arrays keyed by result name.
+        """
+        params = {name: ValueWrapper(value, name).union
+                  for (name, value) in params.items()}
+        result = self.__client.run_algo(algo_name, params, graph_id)
+        return dict((name, self.__decode_ndarray(buffer))
+                    for (name, buffer) in zip(result.column_names,
+                                              result.column_buffers))
+
+    @__server_connection
+    def __call_batch(self, batch_calls):
+        return self.__client.call_batch(batch_calls)
+
+    def __call_unwrapped(self, thrift_client, method_name, args, kwargs):
+        """
+        Call the method method_name with args and kwargs without the
+        __server_connection decorator, using thrift_client in place of the
+        connection to the server, and return the result.
+        """
+        method = getattr(CugraphServiceClient, method_name).__wrapped__
+        previous_client = self.__client
+        self.__client = thrift_client
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.__client = previous_client
+
+    def __get_batch_call(self, batch, index, method_name, args, kwargs):
+        """
+        Return the BatchCall for the server call made by the method
+        method_name when called with args and kwargs, as the call at index in
+        batch.
+        """
+        recorder = _BatchCallRecorder()
+        try:
+            self.__call_unwrapped(recorder, method_name, args, kwargs)
+        except _BatchCallRecorded:
+            pass
+        if recorder.method_name is None:
+            raise ValueError(f"{method_name} does not make a server call and "
+                             "cannot be called in a batch")
+
+        arg_values = []
+        result_refs = {}
+        for (arg_name, value) in zip(get_call_arg_names(recorder.method_name),
+                                     recorder.args):
+            if isinstance(value, BatchResultRef):
+                if (value.batch is not batch) or (value.index >= index):
+                    raise ValueError(
+                        f"{arg_name} of call {index} ({method_name}) must "
+                        "refer to an earlier call in the same batch")
+                result_refs[arg_name] = value.index
+                value = None
+            elif isinstance(value, list) and \
+                    any(isinstance(v, BatchResultRef) for v in value):
+                raise TypeError(
+                    f"{arg_name} of call {index} ({method_name}) contains a "
+                    "BatchResultRef, which can only be passed as an argument "
+                    "by itself")
+            arg_values.append(value)
+
+        return spec.BatchCall(
+            method_name=recorder.method_name,
+            serialized_args=serialize_call_args(recorder.method_name,
+                                                arg_values),
+            result_refs=result_refs)
+
+    def __close_connection(self, discard=False):
+        """
+        Close the connection used by the current thread, or return it to the
+        pool if enabled and discard is False.
+        """
+        client = self.__client
+        if client is not None:
+            self.__client = None
+            if self.__pool is not None:
+                self.__pool.release(client, discard=discard)
+            else:
+                client.close()
+
+    @staticmethod
+    def __decode_ndarray(buffer):
+        """
+        Return the numpy array encoded in buffer by the server. The received
+        bytes are copied to a bytearray so the array is writable, as callers
+        (eg. torch.from_numpy()) may expect.
+        """
+        return decode_ndarray(bytearray(buffer))
+
+    @staticmethod
+    def __decode_graph_data(ndarray_bytes):
+        """
+        Return the numpy array in the bytes returned by get_graph_*_data(),
+        which is either encoded using encode_ndarray() or pickled.
+        """
+        if is_ndarray_buffer(ndarray_bytes):
+            return CugraphServiceClient.__decode_ndarray(ndarray_bytes)
+        return pickle.loads(ndarray_bytes)
+
+    @staticmethod
+    def __decode_array_result(result, field_names):
+        """
+        Replace the value of each field in field_names of the Thrift struct
+        result with the numpy array decoded from the corresponding
+        "<field name>_buffer" field, if set, and return result.
+        """
+        for name in field_names:
+            buffer_name = f"{name}_buffer"
+            buffer = getattr(result, buffer_name)
+            if buffer is not None:
+                setattr(result, name,
+                        CugraphServiceClient.__decode_ndarray(buffer))
+                setattr(result, buffer_name, None)
+        return result
+
     @staticmethod
     def __get_vertex_edge_id_obj(id_or_ids):
         # FIXME: do not assume all values are int32
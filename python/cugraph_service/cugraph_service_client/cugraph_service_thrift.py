@@ -13,17 +13,26 @@
 # limitations under the License.
 
 import io
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import thriftpy2
 from thriftpy2.rpc import make_client
 from thriftpy2.protocol import TBinaryProtocolFactory
-from thriftpy2.server import TSimpleServer
-from thriftpy2.thrift import TProcessor
+from thriftpy2.server import TSimpleServer, TThreadedServer
+from thriftpy2.thrift import (
+    TApplicationException,
+    TProcessor,
+    TType,
+)
 from thriftpy2.transport import (
     TBufferedTransportFactory,
     TServerSocket,
     TTransportException,
 )
+from thriftpy2.utils import deserialize, serialize
 
 
 # This is the Thrift input file as a string rather than a separate file. This
@@ -44,17 +53,35 @@ exception CugraphServiceError {
   1:string message
 }
 
+# The encoding used for array-valued results. LEGACY encodes arrays as Thrift
+# lists, and graph data as pickled numpy arrays. BINARY encodes each array as a
+# single buffer containing a small dtype/shape header followed by the raw
+# little-endian array data, which clients decode without copying (see
+# cugraph_service_client.types.decode_ndarray). The *_buffer fields of result
+# structs are set instead of the list fields when BINARY is used.
+enum ResultFormat {
+  LEGACY = 0,
+  BINARY = 1
+}
+
 struct BatchedEgoGraphsResult {
   1:list<i32> src_verts
   2:list<i32> dst_verts
   3:list<double> edge_weights
   4:list<i32> seeds_offsets
+  5:binary src_verts_buffer
+  6:binary dst_verts_buffer
+  7:binary edge_weights_buffer
+  8:binary seeds_offsets_buffer
 }
 
 struct Node2vecResult {
   1:list<i32> vertex_paths
   2:list<double> edge_weights
   3:list<i32> path_sizes
+  4:binary vertex_paths_buffer
+  5:binary edge_weights_buffer
+  6:binary path_sizes_buffer
 }
 
 # FIXME: uniform_neighbor_sample may need to return indices as ints
@@ -63,6 +90,28 @@ struct UniformNeighborSampleResult {
   1:list<i32> sources
   2:list<i32> destinations
   3:list<double> indices
+  4:binary sources_buffer
+  5:binary destinations_buffer
+  6:binary indices_buffer
+}
+
+# The result of run_algo(). column_buffers contains each result, in the order
+# of column_names, as an array encoded using encode_ndarray(). Scalar results
+# (such as the modularity computed by louvain) are encoded as 0-d arrays.
+struct AlgoResult {
+  1:list<string> column_names
+  2:list<binary> column_buffers
+}
+
+# A call in a call_batch() request. serialized_args is the Thrift arguments
+# struct of the method named method_name, serialized using the binary protocol
+# (see serialize_call_args()). result_refs maps the names of arguments to the
+# indices of earlier calls in the same batch, whose results are passed as
+# those arguments in place of the values in serialized_args.
+struct BatchCall {
+  1:string method_name
+  2:binary serialized_args
+  3:map<string, i32> result_refs
 }
 
 union GraphVertexEdgeID {
@@ -77,6 +126,7 @@ union Value {
   2:i64 int64_value
   3:string string_value
   4:bool bool_value
+  5:double double_value
 }
 
 service CugraphService {
@@ -87,6 +137,10 @@ service CugraphService {
 
   map<string, Value> get_server_info() throws (1:CugraphServiceError e),
 
+  # Per-method call statistics, as JSON if format is "json" or text in the
+  # Prometheus exposition format if format is "prometheus".
+  string get_server_stats(1:string format) throws (1:CugraphServiceError e),
+
   i32 load_graph_creation_extensions(1:string extension_dir_path
                                      ) throws (1:CugraphServiceError e),
 
@@ -132,6 +186,23 @@ service CugraphService {
                              9:list<string> names
                              ) throws (1:CugraphServiceError e),
 
+  # parquet_path is a Parquet file, a directory of Parquet files, or a glob
+  # pattern matching either. Only the vertex column(s) and property_columns
+  # (if not empty) are read.
+  void load_parquet_as_vertex_data(1:string parquet_path,
+                                   2:string vertex_col_name,
+                                   3:string type_name,
+                                   4:list<string> property_columns,
+                                   5:i32 graph_id
+                                   ) throws (1:CugraphServiceError e),
+
+  void load_parquet_as_edge_data(1:string parquet_path,
+                                 2:list<string> vertex_col_names,
+                                 3:string type_name,
+                                 4:list<string> property_columns,
+                                 5:i32 graph_id
+                                 ) throws (1:CugraphServiceError e),
+
   list<i32> get_edge_IDs_for_vertices(1:list<i32> src_vert_IDs,
                                       2:list<i32> dst_vert_IDs,
                                       3:i32 graph_id
@@ -144,21 +215,50 @@ service CugraphService {
                        5:bool allow_multi_edges,
                        6:bool renumber_graph,
                        7:bool add_edge_data,
-                       8:i32 graph_id
+                       8:i32 graph_id,
+                       9:bool auto_refresh
                        ) throws (1:CugraphServiceError e),
 
   binary get_graph_vertex_data(1:GraphVertexEdgeID vertex_id,
                                2:Value null_replacement_value,
                                3:i32 graph_id,
-                               4:list<string> property_keys
+                               4:list<string> property_keys,
+                               5:ResultFormat result_format
                                ) throws (1:CugraphServiceError e),
 
   binary get_graph_edge_data(1:GraphVertexEdgeID edge_id,
                              2:Value null_replacement_value
                              3:i32 graph_id,
-                             4:list<string> property_keys
+                             4:list<string> property_keys,
+                             5:ResultFormat result_format
                              ) throws (1:CugraphServiceError e),
 
+  # Cursors for reading vertex or edge data in batches of at most batch_size
+  # rows. get_next_graph_data_batch() returns each batch serialized the same
+  # way as get_graph_vertex_data(), then empty binary once all rows have been
+  # returned, at which point the cursor is closed.
+  i32 open_graph_vertex_data_cursor(1:GraphVertexEdgeID vertex_id,
+                                    2:Value null_replacement_value,
+                                    3:i32 graph_id,
+                                    4:list<string> property_keys,
+                                    5:ResultFormat result_format,
+                                    6:i64 batch_size
+                                    ) throws (1:CugraphServiceError e),
+
+  i32 open_graph_edge_data_cursor(1:GraphVertexEdgeID edge_id,
+                                  2:Value null_replacement_value,
+                                  3:i32 graph_id,
+                                  4:list<string> property_keys,
+                                  5:ResultFormat result_format,
+                                  6:i64 batch_size
+                                  ) throws (1:CugraphServiceError e),
+
+  binary get_next_graph_data_batch(1:i32 cursor_id
+                                   ) throws (1:CugraphServiceError e),
+
+  void close_graph_data_cursor(1:i32 cursor_id
+                               ) throws (1:CugraphServiceError e),
+
   bool is_vertex_property(1:string property_key,
                           2:i32 graph_id) throws (1:CugraphServiceError e),
 
@@ -170,22 +270,43 @@ service CugraphService {
   BatchedEgoGraphsResult
   batched_ego_graphs(1:list<i32> seeds,
                      2:i32 radius,
-                     3:i32 graph_id
+                     3:i32 graph_id,
+                     4:ResultFormat result_format
                      ) throws (1:CugraphServiceError e),
 
   Node2vecResult
   node2vec(1:list<i32> start_vertices,
            2:i32 max_depth,
-           3:i32 graph_id
+           3:i32 graph_id,
+           4:ResultFormat result_format
            ) throws (1:CugraphServiceError e),
 
   UniformNeighborSampleResult
   uniform_neighbor_sample(1:list<i32> start_list,
                               2:list<i32> fanout_vals,
                               3:bool with_replacement,
-                              4:i32 graph_id
+                              4:i32 graph_id,
+                              5:ResultFormat result_format
                               ) throws (1:CugraphServiceError e),
 
+  # Runs the algo named algo_name (one of the names returned by
+  # get_algo_names()) on the graph identified by graph_id, passing it params.
+  AlgoResult run_algo(1:string algo_name,
+                      2:map<string, Value> params,
+                      3:i32 graph_id
+                      ) throws (1:CugraphServiceError e),
+
+  list<string> get_algo_names() throws (1:CugraphServiceError e),
+
+  ##############################################################################
+  # Batches
+  # Calls the methods in calls in order, in a single request, and returns the
+  # Thrift result struct of each call, serialized using the binary protocol
+  # (see deserialize_call_result()). If a call raises an error, the calls
+  # after it are not made, and the last result returned contains the error.
+  list<binary> call_batch(1:list<BatchCall> calls
+                          ) throws (1:CugraphServiceError e),
+
   ##############################################################################
   # Test/Debug
   string get_graph_type(1:i32 graph_id) throws(1:CugraphServiceError e),
@@ -200,31 +321,260 @@ spec = thriftpy2.load_fp(io.StringIO(cugraph_thrift_spec),
                          module_name="cugraph_thrift")
 
 
-def create_server(handler, host, port, client_timeout=90000):
+class _TThreadPoolServer(TThreadedServer):
+    """
+    Server that handles each client connection using a thread from a pool of
+    num_workers threads. Connections accepted while all threads are handling
+    other connections wait for a thread to become available.
+    """
+    def __init__(self, *args, num_workers, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__executor = ThreadPoolExecutor(
+            max_workers=num_workers,
+            thread_name_prefix="cugraph_service_worker")
+
+    def serve(self):
+        self.trans.listen()
+        while not self.closed:
+            try:
+                client = self.trans.accept()
+                self.__executor.submit(self.handle, client)
+            except KeyboardInterrupt:
+                raise
+            except Exception:
+                logging.getLogger(__name__).exception(
+                    "error accepting client connection")
+
+    def close(self):
+        super().close()
+        self.__executor.shutdown(wait=False)
+
+
+class _ByteCounts(threading.local):
+    """
+    The number of bytes read from and written to the client connection being
+    handled by the current thread. Each connection is handled by a single
+    thread at a time.
+    """
+    num_bytes_read = 0
+    num_bytes_written = 0
+
+
+_byte_counts = _ByteCounts()
+
+
+class _TCountingTransport:
+    """
+    Transport that wraps a client connection transport, adding the number of
+    bytes read and written to _byte_counts.
+    """
+    def __init__(self, trans):
+        self.__trans = trans
+
+    def read(self, sz):
+        buf = self.__trans.read(sz)
+        _byte_counts.num_bytes_read += len(buf)
+        return buf
+
+    def write(self, buf):
+        self.__trans.write(buf)
+        _byte_counts.num_bytes_written += len(buf)
+
+    def __getattr__(self, name):
+        return getattr(self.__trans, name)
+
+
+class _TCountingTransportFactory(TBufferedTransportFactory):
+    def get_transport(self, trans):
+        return super().get_transport(_TCountingTransport(trans))
+
+
+class _TInstrumentedProcessor(TProcessor):
+    """
+    Processor that records the time, request and response sizes, and
+    outcome of each call in call_stats, which must have the interface of
+    cugraph_service_server.call_stats.CallStats.
+    """
+    def __init__(self, service, handler, call_stats):
+        super().__init__(service, handler)
+        self.__call_stats = call_stats
+
+    def process(self, iprot, oprot):
+        # Based on TProcessor.process() and process_in(), with the time spent
+        # waiting for the next call excluded. Clients wait for the response
+        # before sending another call, so all bytes read after this point
+        # are part of this call.
+        start_bytes_read = _byte_counts.num_bytes_read
+        start_bytes_written = _byte_counts.num_bytes_written
+        api, _, seqid = iprot.read_message_begin()
+        start_time = time.perf_counter()
+
+        if api not in self._service.thrift_services:
+            iprot.skip(TType.STRUCT)
+            iprot.read_message_end()
+            return self.send_exception(
+                oprot, api,
+                TApplicationException(TApplicationException.UNKNOWN_METHOD),
+                seqid)
+
+        args = getattr(self._service, api + "_args")()
+        args.read(iprot)
+        iprot.read_message_end()
+        result = getattr(self._service, api + "_result")()
+        api_args = [args.__dict__[item[1]]
+                    for item in args.thrift_spec.values()]
+
+        self.__call_stats.start_call()
+        call_start_time = time.perf_counter()
+        error = True
+        try:
+            try:
+                result.success = getattr(self._handler, api)(*api_args)
+                error = False
+            except TApplicationException as e:
+                return self.send_exception(oprot, api, e, seqid)
+            except Exception as e:
+                # Exceptions declared in the spec are sent to the client
+                if not self.handle_exception(e, result):
+                    raise
+            finally:
+                call_end_time = time.perf_counter()
+
+            if not result.oneway:
+                self.send_result(oprot, api, result, seqid)
+        finally:
+            self.__record_call(api, start_time, call_start_time,
+                               call_end_time, start_bytes_read,
+                               start_bytes_written, error)
+
+    def __record_call(self, api, start_time, call_start_time, call_end_time,
+                      start_bytes_read, start_bytes_written, error):
+        end_time = time.perf_counter()
+        self.__call_stats.record_call(
+            api,
+            call_seconds=call_end_time - call_start_time,
+            serialization_seconds=((call_start_time - start_time) +
+                                   (end_time - call_end_time)),
+            request_bytes=_byte_counts.num_bytes_read - start_bytes_read,
+            response_bytes=(_byte_counts.num_bytes_written -
+                            start_bytes_written),
+            error=error)
+
+
+def get_call_arg_names(method_name):
+    """
+    Return the names of the arguments of the service method method_name, in
+    order.
+    """
+    args_cls = getattr(spec.CugraphService, method_name + "_args")
+    return [item[1] for item in args_cls.thrift_spec.values()]
+
+
+def serialize_call_args(method_name, args):
+    """
+    Return the list of arguments args to the service method method_name as
+    bytes, which can be converted back to arguments using
+    deserialize_call_args().
+    """
+    args_cls = getattr(spec.CugraphService, method_name + "_args")
+    return serialize(args_cls(*args))
+
+
+def deserialize_call_args(method_name, buf):
+    """
+    Return a dictionary of the arguments to the service method method_name
+    contained in buf, created by serialize_call_args(), keyed by argument name
+    in argument order.
+    """
+    args_cls = getattr(spec.CugraphService, method_name + "_args")
+    args = deserialize(args_cls(), buf)
+    return {name: getattr(args, name)
+            for name in get_call_arg_names(method_name)}
+
+
+def serialize_call_result(method_name, value=None, error=None):
+    """
+    Return the value returned by the service method method_name, or the
+    CugraphServiceError error raised by it if not None, as bytes, which can be
+    converted back using deserialize_call_result().
+    """
+    result = getattr(spec.CugraphService, method_name + "_result")()
+    if error is not None:
+        result.e = error
+    else:
+        result.success = value
+    return serialize(result)
+
+
+def deserialize_call_result(method_name, buf):
+    """
+    Return a tuple of the value returned by the service method method_name
+    and the CugraphServiceError raised by it (or None) contained in buf,
+    created by serialize_call_result().
+    """
+    result = deserialize(
+        getattr(spec.CugraphService, method_name + "_result")(), buf)
+    return (getattr(result, "success", None), getattr(result, "e", None))
+
+
+def create_server(handler, host, port, client_timeout=90000, num_workers=1,
+                  call_stats=None):
     """
     Return a server object configured to listen on host/port and use the
     handler object to handle calls from clients. The handler object must have
     an interface compatible with the CugraphService service defined in the
     Thrift specification.
 
+    If num_workers is 1 (the default), the server handles one client
+    connection at a time. If num_workers is greater than 1, up to num_workers
+    client connections are handled concurrently by separate threads, so the
+    handler must be thread-safe.
+
+    If call_stats is specified, the time and request and response sizes of
+    each call are recorded using it (see
+    cugraph_service_server.call_stats.CallStats).
+
     Note: This function is defined here in order to allow it to have easy
     access to the Thrift spec loaded here on import, and to keep all thriftpy2
     calls in this module. However, this function is likely only called from the
     cugraph_service_server package which depends on the code in this package.
     """
     proto_factory = TBinaryProtocolFactory()
-    trans_factory = TBufferedTransportFactory()
     client_timeout = client_timeout
 
-    processor = TProcessor(spec.CugraphService, handler)
+    if call_stats is None:
+        trans_factory = TBufferedTransportFactory()
+        processor = TProcessor(spec.CugraphService, handler)
+    else:
+        trans_factory = _TCountingTransportFactory()
+        processor = _TInstrumentedProcessor(spec.CugraphService, handler,
+                                            call_stats)
     server_socket = TServerSocket(host=host, port=port,
                                   client_timeout=client_timeout)
-    server = TSimpleServer(processor, server_socket,
-                           iprot_factory=proto_factory,
-                           itrans_factory=trans_factory)
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+    if num_workers == 1:
+        server = TSimpleServer(processor, server_socket,
+                               iprot_factory=proto_factory,
+                               itrans_factory=trans_factory)
+    else:
+        server = _TThreadPoolServer(processor, server_socket,
+                                    iprot_factory=proto_factory,
+                                    itrans_factory=trans_factory,
+                                    num_workers=num_workers,
+                                    daemon=True)
     return server
 
 
+def is_connection_error(exc):
+    """
+    Return True if the exception exc was raised by a client object because of
+    a problem with its connection to the server (eg. the server closed the
+    connection or is no longer running), rather than by the server.
+    """
+    return isinstance(exc, (TTransportException, OSError))
+
+
 def create_client(host, port, call_timeout=90000):
     """
     Return a client object that will make calls on a server listening on
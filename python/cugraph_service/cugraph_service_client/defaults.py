@@ -15,3 +15,8 @@
 host = "localhost"
 port = 9090
 graph_id = 0
+num_workers = 8
+result_format = "legacy"
+client_pool_size = 0
+async_client_max_in_flight = 4
+graph_data_batch_size = 1000000
@@ -12,16 +12,81 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import struct
+
 import numpy
 
 from cugraph_service_client.cugraph_service_thrift import spec
 
 Value = spec.Value
 GraphVertexEdgeID = spec.GraphVertexEdgeID
+ResultFormat = spec.ResultFormat
+AlgoResult = spec.AlgoResult
 BatchedEgoGraphsResult = spec.BatchedEgoGraphsResult
 Node2vecResult = spec.Node2vecResult
 UniformNeighborSampleResult = spec.UniformNeighborSampleResult
 
+# Buffers created by encode_ndarray() start with this, followed by the length
+# of the header as a little-endian uint32, the JSON header containing the dtype
+# and shape, then the array data starting at a multiple of
+# _ndarray_buffer_alignment bytes.
+_ndarray_buffer_magic = b"\x93CGSNDA\x01"
+_ndarray_buffer_alignment = 16
+
+
+def encode_ndarray(array):
+    """
+    Return a bytes object containing the numpy array, which can be converted
+    back to an array using decode_ndarray(). The array data is stored as raw
+    little-endian values, so arrays with an object dtype cannot be encoded.
+    """
+    array = numpy.asarray(array)
+    if not array.flags.c_contiguous:
+        array = array.copy(order="C")
+    if array.dtype.hasobject:
+        raise TypeError("arrays with an object dtype cannot be encoded")
+    if array.dtype.byteorder == ">":
+        array = array.astype(array.dtype.newbyteorder("<"))
+
+    header = json.dumps({"dtype": array.dtype.str,
+                         "shape": array.shape}).encode()
+    prefix_len = len(_ndarray_buffer_magic) + 4 + len(header)
+    header += b" " * (-prefix_len % _ndarray_buffer_alignment)
+
+    return b"".join([_ndarray_buffer_magic,
+                     struct.pack("<I", len(header)),
+                     header,
+                     array.reshape(-1).view(numpy.uint8)])
+
+
+def is_ndarray_buffer(buffer):
+    """
+    Return True if buffer was created by encode_ndarray().
+    """
+    return buffer[:len(_ndarray_buffer_magic)] == _ndarray_buffer_magic
+
+
+def decode_ndarray(buffer):
+    """
+    Return the numpy array contained in buffer, which must have been created
+    by encode_ndarray(). The returned array uses the memory of buffer instead
+    of a copy, so it is read-only if buffer is a bytes object.
+    """
+    if not is_ndarray_buffer(buffer):
+        raise ValueError("buffer does not contain an encoded array")
+
+    header_start = len(_ndarray_buffer_magic) + 4
+    (header_len,) = struct.unpack_from("<I", buffer,
+                                       len(_ndarray_buffer_magic))
+    header = json.loads(bytes(buffer[header_start:header_start + header_len]))
+    shape = tuple(header["shape"])
+
+    return numpy.frombuffer(buffer,
+                            dtype=numpy.dtype(header["dtype"]),
+                            count=int(numpy.prod(shape)),
+                            offset=header_start + header_len).reshape(shape)
+
 
 class UnionWrapper:
     """
@@ -43,6 +108,9 @@ class ValueWrapper(UnionWrapper):
     def __init__(self, val, val_name="value"):
         if isinstance(val, Value):
             self.union = val
+        # bool is a subclass of int, so check for it first
+        elif isinstance(val, bool):
+            self.union = Value(bool_value=val)
         elif isinstance(val, int):
             if val < 4294967296:
                 self.union = Value(int32_value=val)
@@ -52,13 +120,13 @@ class ValueWrapper(UnionWrapper):
             self.union = Value(int32_value=int(val))
         elif isinstance(val, numpy.int64):
             self.union = Value(int64_value=int(val))
+        elif isinstance(val, (float, numpy.floating)):
+            self.union = Value(double_value=float(val))
         elif isinstance(val, str):
             self.union = Value(string_value=val)
-        elif isinstance(val, bool):
-            self.union = Value(bool_value=val)
         else:
             raise TypeError(f"{val_name} must be one of the "
-                            "following types: [int, str, bool], got "
+                            "following types: [int, float, str, bool], got "
                             f"{type(val)}")
 
 
@@ -0,0 +1,329 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Registry of the graph algorithms a CugraphHandler can run, mapping each
+algorithm to its SG (cugraph), MG (cugraph.dask), and host (host_graph)
+versions.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import cugraph
+from cugraph.utilities.utils import import_optional, MissingModule
+
+from cugraph_service_server import host_graph
+from cugraph_service_server.host_graph import HostGraph
+
+# The SG and MG versions of the algorithms are not available if cuDF is not
+# installed, in which case only HostGraphs can be used (see
+# cugraph/__init__.py).
+cudf = import_optional("cudf")
+if not(isinstance(cudf, MissingModule)):
+    import cugraph.dask
+    from cugraph.structure.graph_implementation.simpleDistributedGraph import (
+        simpleDistributedGraphImpl,
+    )
+
+
+# The default value of params which must be passed.
+REQUIRED = object()
+
+
+class Algo:
+    """
+    A graph algorithm that can be run on SG, MG, and/or host graphs.
+
+    params is a list of (name, type, default) tuples describing the
+    parameters of the algorithm, where type is int, float, bool, str, or list,
+    and default is REQUIRED for params which must be passed. sg_func,
+    mg_func, and host_func are the versions of the algorithm for cugraph SG
+    Graphs, cugraph MG Graphs, and HostGraphs, or None if the algorithm is not
+    supported for that kind of graph. Each is called with the graph and the
+    params as keyword args, and returns a DataFrame (cuDF, dask_cudf, or
+    pandas), or a dict of arrays, Series, or scalars, keyed by result name.
+    """
+    def __init__(self, name, params, sg_func=None, mg_func=None,
+                 host_func=None):
+        self.name = name
+        self.params = params
+        self.sg_func = sg_func
+        self.mg_func = mg_func
+        self.host_func = host_func
+
+    def has_scalar_params(self):
+        """
+        Return True if none of the params of the algorithm are lists.
+        """
+        return all(param_type is not list
+                   for (_, param_type, _) in self.params)
+
+    def get_func(self, graph_kind):
+        """
+        Return the version of the algorithm for graph_kind, which is one of
+        "sg", "mg", or "host", or None if it is not supported.
+        """
+        return getattr(self, f"{graph_kind}_func")
+
+    def convert_params(self, params):
+        """
+        Return an OrderedDict of the values of all params of the algorithm,
+        converted to their types, using the default values for params not in
+        the dict params. Raises ValueError if params contains an unknown
+        param or is missing a required param, or if a value cannot be
+        converted.
+        """
+        param_names = [name for (name, _, _) in self.params]
+        unknown = sorted(set(params) - set(param_names))
+        if unknown:
+            raise ValueError(f"{self.name} has no parameter(s) {unknown}, "
+                             f"expected one of {param_names}")
+
+        converted = OrderedDict()
+        for (name, param_type, default) in self.params:
+            if name not in params:
+                if default is REQUIRED:
+                    raise ValueError(f"{self.name} requires the parameter "
+                                     f"{name!r}")
+                converted[name] = default
+            elif param_type is list:
+                value = params[name]
+                converted[name] = list(value) \
+                    if isinstance(value, (list, tuple, np.ndarray)) \
+                    else [value]
+            elif (param_type is not bool) and isinstance(params[name], bool):
+                raise ValueError(f"parameter {name!r} of {self.name} must be "
+                                 f"a {param_type.__name__}, got a bool")
+            else:
+                try:
+                    converted[name] = param_type(params[name])
+                except (TypeError, ValueError):
+                    raise ValueError(f"parameter {name!r} of {self.name} "
+                                     f"must be a {param_type.__name__}, got "
+                                     f"{params[name]!r}")
+        return converted
+
+    def run(self, G, **params):
+        """
+        Run the algorithm on the graph G using the version for the kind of
+        graph G is, passing params after converting them using
+        convert_params(). Returns an OrderedDict of the results as numpy
+        arrays (with scalar results as 0-d arrays), keyed by result name.
+        """
+        graph_kind = get_graph_kind(G)
+        func = self.get_func(graph_kind)
+        if func is None:
+            raise ValueError(f"{self.name} is not supported for {graph_kind} "
+                             "graphs")
+
+        result = func(G, **self.convert_params(params))
+        if graph_kind == "mg" and hasattr(result, "compute"):
+            result = result.compute()
+        if isinstance(result, dict):
+            items = result.items()
+        else:
+            items = ((name, result[name]) for name in result.columns)
+        return OrderedDict((str(name), to_numpy(values))
+                           for (name, values) in items)
+
+
+def get_graph_kind(G):
+    """
+    Return "host" if G is a HostGraph, "mg" if G is a cugraph MG Graph, or
+    "sg" otherwise.
+    """
+    if isinstance(G, HostGraph):
+        return "host"
+    if isinstance(G._Impl, simpleDistributedGraphImpl):
+        return "mg"
+    return "sg"
+
+
+def to_numpy(values):
+    """
+    Return values, which is a cuDF, dask_cudf, or pandas Series, a numpy
+    array, or a scalar, as a numpy array in host memory.
+    """
+    if hasattr(values, "compute"):
+        values = values.compute()
+    if hasattr(values, "values_host"):
+        return values.values_host
+    if hasattr(values, "to_numpy"):
+        return values.to_numpy()
+    return np.asarray(values)
+
+
+_algos = OrderedDict()
+
+
+def register_algo(name, params, sg_func=None, mg_func=None, host_func=None):
+    """
+    Add an Algo named name to the registry, see Algo for the arguments.
+    """
+    _algos[name] = Algo(name, params, sg_func, mg_func, host_func)
+
+
+def _get_gpu_funcs(func_name):
+    """
+    Return a dict of the cugraph and cugraph.dask functions named func_name
+    as the sg_func and mg_func arguments of register_algo(), which is empty
+    if cuDF is not installed.
+    """
+    if isinstance(cudf, MissingModule):
+        return {}
+    return {"sg_func": getattr(cugraph, func_name),
+            "mg_func": getattr(cugraph.dask, func_name)}
+
+
+def get_algo(name):
+    """
+    Return the registered Algo named name, raising ValueError if there is
+    none.
+    """
+    algo = _algos.get(name)
+    if algo is None:
+        raise ValueError(f"unknown algo {name!r}, expected one of "
+                         f"{list(_algos)}")
+    return algo
+
+
+def get_algo_names():
+    """
+    Return the names of all registered algos, in registration order.
+    """
+    return list(_algos)
+
+
+###############################################################################
+# Sampling
+
+def _sg_batched_ego_graphs(G, seeds, radius):
+    # FIXME: this should not be needed, need to update
+    # cugraph.batched_ego_graphs to also accept a list
+    (ego_edge_list, seeds_offsets) = cugraph.batched_ego_graphs(
+        G, cudf.Series(seeds, dtype="int32"), radius)
+    return _get_batched_ego_graphs_result(ego_edge_list, seeds_offsets)
+
+
+def _host_batched_ego_graphs(G, seeds, radius):
+    return _get_batched_ego_graphs_result(
+        *host_graph.batched_ego_graphs(G, seeds, radius))
+
+
+def _get_batched_ego_graphs_result(ego_edge_list, seeds_offsets):
+    return {"src_verts": ego_edge_list["src"],
+            "dst_verts": ego_edge_list["dst"],
+            "edge_weights": ego_edge_list["weight"],
+            "seeds_offsets": seeds_offsets}
+
+
+def _sg_node2vec(G, start_vertices, max_depth):
+    # FIXME: this should not be needed, need to update cugraph.node2vec to
+    # also accept a list
+    return _get_node2vec_result(*cugraph.node2vec(
+        G, cudf.Series(start_vertices, dtype="int32"), max_depth))
+
+
+def _host_node2vec(G, start_vertices, max_depth):
+    return _get_node2vec_result(*host_graph.node2vec(
+        G, np.array(start_vertices, dtype="int32"), max_depth))
+
+
+def _get_node2vec_result(paths, weights, path_sizes):
+    return {"vertex_paths": paths,
+            "edge_weights": weights,
+            "path_sizes": path_sizes}
+
+
+register_algo("batched_ego_graphs",
+              [("seeds", list, REQUIRED),
+               ("radius", int, 1)],
+              sg_func=_sg_batched_ego_graphs,
+              host_func=_host_batched_ego_graphs)
+
+register_algo("node2vec",
+              [("start_vertices", list, REQUIRED),
+               ("max_depth", int, REQUIRED)],
+              sg_func=_sg_node2vec,
+              host_func=_host_node2vec)
+
+register_algo("uniform_neighbor_sample",
+              [("start_list", list, REQUIRED),
+               ("fanout_vals", list, REQUIRED),
+               ("with_replacement", bool, True)],
+              **_get_gpu_funcs("uniform_neighbor_sample"),
+              host_func=host_graph.uniform_neighbor_sample)
+
+
+###############################################################################
+# Analytics
+
+def _sg_louvain(G, max_iter, resolution):
+    (parts, modularity) = cugraph.louvain(G, max_iter, resolution)
+    return _get_louvain_result(parts, modularity)
+
+
+def _mg_louvain(G, max_iter, resolution):
+    (parts, modularity) = cugraph.dask.louvain(G, max_iter, resolution)
+    return _get_louvain_result(parts, modularity)
+
+
+def _get_louvain_result(parts, modularity):
+    if hasattr(parts, "compute"):
+        parts = parts.compute()
+    return {"vertex": parts["vertex"],
+            "partition": parts["partition"],
+            "modularity": modularity}
+
+
+register_algo("pagerank",
+              [("alpha", float, 0.85),
+               ("max_iter", int, 100),
+               ("tol", float, 1.0e-5)],
+              **_get_gpu_funcs("pagerank"),
+              host_func=host_graph.pagerank)
+
+register_algo("bfs",
+              [("start", int, REQUIRED),
+               ("depth_limit", int, None)],
+              **_get_gpu_funcs("bfs"),
+              host_func=host_graph.bfs)
+
+register_algo("sssp",
+              [("source", int, REQUIRED),
+               ("cutoff", float, None)],
+              **_get_gpu_funcs("sssp"),
+              host_func=host_graph.sssp)
+
+# FIXME: add a host version of louvain
+register_algo("louvain",
+              [("max_iter", int, 100),
+               ("resolution", float, 1.0)],
+              sg_func=_sg_louvain,
+              mg_func=_mg_louvain)
+
+register_algo("weakly_connected_components",
+              [],
+              **_get_gpu_funcs("weakly_connected_components"),
+              host_func=host_graph.weakly_connected_components)
+
+register_algo("katz_centrality",
+              [("alpha", float, None),
+               ("beta", float, 1.0),
+               ("max_iter", int, 100),
+               ("tol", float, 1.0e-6),
+               ("normalized", bool, True)],
+              **_get_gpu_funcs("katz_centrality"),
+              host_func=host_graph.katz_centrality)
@@ -0,0 +1,280 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-method latency and payload statistics for the RPCs handled by a
+cugraph_service server.
+"""
+
+import bisect
+import threading
+import time
+
+
+# Upper bounds of the histogram buckets for durations (in seconds) and payload
+# sizes (in bytes). Each histogram also has a bucket for larger values.
+time_buckets = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+                0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0]
+byte_buckets = [2**n for n in range(8, 32, 2)]
+
+
+class RollingHistogram:
+    """
+    Histogram of values, counted in buckets with the upper bounds in
+    bucket_bounds plus a bucket for larger values. Counts are kept both for
+    all values recorded (cumulative), and for only the values recorded in the
+    last window seconds (rolling). The rolling counts are kept in num_slots
+    slots of window / num_slots seconds each, so values expire from the
+    rolling counts in steps of that size.
+
+    Not thread-safe, callers must serialize access.
+    """
+    def __init__(self, bucket_bounds, window=300, num_slots=10):
+        self.bucket_bounds = bucket_bounds
+        self.window = window
+        self.__slot_duration = window / num_slots
+        self.__cumulative = self.__new_counts()
+        # (slot number, counts) for the slots in the window, oldest first
+        self.__slots = []
+        self.__num_slots = num_slots
+
+    def record(self, value, now=None):
+        """
+        Add value to the histogram. now is the current time.monotonic() value
+        if not specified.
+        """
+        now = time.monotonic() if now is None else now
+        slot_num = int(now // self.__slot_duration)
+        if (not self.__slots) or (self.__slots[-1][0] != slot_num):
+            self.__slots.append((slot_num, self.__new_counts()))
+            self.__expire(slot_num)
+        bucket = bisect.bisect_left(self.bucket_bounds, value)
+        for counts in (self.__cumulative, self.__slots[-1][1]):
+            counts["buckets"][bucket] += 1
+            counts["count"] += 1
+            counts["sum"] += value
+
+    def cumulative(self):
+        """
+        Return a dictionary of the "count", "sum", and per-bucket counts
+        ("buckets") of all recorded values.
+        """
+        return {"count": self.__cumulative["count"],
+                "sum": self.__cumulative["sum"],
+                "buckets": list(self.__cumulative["buckets"])}
+
+    def rolling(self, now=None):
+        """
+        Return a dictionary of the "count", "sum", and per-bucket counts
+        ("buckets") of the values recorded in the last window seconds, and
+        the "p50", "p90", and "p99" percentiles estimated from them. An
+        estimated percentile is the upper bound of the bucket containing it,
+        or None if it is in the bucket for values larger than all bounds or
+        there are no values.
+        """
+        now = time.monotonic() if now is None else now
+        self.__expire(int(now // self.__slot_duration))
+        result = self.__new_counts()
+        for (_, counts) in self.__slots:
+            result["count"] += counts["count"]
+            result["sum"] += counts["sum"]
+            for (i, c) in enumerate(counts["buckets"]):
+                result["buckets"][i] += c
+        for (name, fraction) in [("p50", 0.5), ("p90", 0.9), ("p99", 0.99)]:
+            result[name] = self.__estimate_percentile(result, fraction)
+        return result
+
+    def __new_counts(self):
+        return {"count": 0,
+                "sum": 0,
+                "buckets": [0] * (len(self.bucket_bounds) + 1)}
+
+    def __expire(self, slot_num):
+        """
+        Remove the slots that are no longer in the window ending in slot_num.
+        """
+        while self.__slots and \
+                (self.__slots[0][0] <= (slot_num - self.__num_slots)):
+            self.__slots.pop(0)
+
+    def __estimate_percentile(self, counts, fraction):
+        target = fraction * counts["count"]
+        total = 0
+        for (i, c) in enumerate(counts["buckets"]):
+            total += c
+            if c and (total >= target):
+                if i < len(self.bucket_bounds):
+                    return self.bucket_bounds[i]
+                return None
+        return None
+
+
+class _MethodStats:
+    """
+    The statistics recorded for calls to a single method.
+    """
+    def __init__(self, window):
+        self.num_calls = 0
+        self.num_errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.histograms = {
+            "queue_wait_seconds": RollingHistogram(time_buckets, window),
+            "execution_seconds": RollingHistogram(time_buckets, window),
+            "serialization_seconds": RollingHistogram(time_buckets, window),
+            "response_size_bytes": RollingHistogram(byte_buckets, window),
+        }
+
+
+class CallStats:
+    """
+    Statistics for the calls handled by a cugraph_service server, per method:
+    the number of calls and errors, the total request and response sizes,
+    and histograms of the time calls spent waiting for locks (queue wait),
+    executing, and deserializing arguments and serializing results, and of
+    the response sizes.
+
+    record_call() is called by the server for each call, and
+    add_queue_wait() is called by the handler for the time spent waiting
+    within a call. Thread-safe.
+    """
+    # Descriptions of the histograms, used for the Prometheus HELP text
+    __histogram_descriptions = {
+        "queue_wait_seconds": "Time spent waiting for graph locks",
+        "execution_seconds": "Time spent executing, excluding queue wait",
+        "serialization_seconds": "Time spent deserializing arguments and "
+                                 "serializing results",
+        "response_size_bytes": "Size of the serialized responses",
+    }
+
+    def __init__(self, window=300):
+        self.window = window
+        self.__methods = {}
+        self.__lock = threading.Lock()
+        # The queue wait time of the call being handled by each thread
+        self.__current_call = threading.local()
+
+    def start_call(self):
+        """
+        Reset the queue wait time of the call being handled by the current
+        thread, before it is executed.
+        """
+        self.__current_call.queue_wait = 0.0
+
+    def add_queue_wait(self, seconds):
+        """
+        Add seconds to the queue wait time of the call being handled by the
+        current thread.
+        """
+        self.__current_call.queue_wait = \
+            getattr(self.__current_call, "queue_wait", 0.0) + seconds
+
+    def record_call(self,
+                    method_name,
+                    call_seconds,
+                    serialization_seconds,
+                    request_bytes,
+                    response_bytes,
+                    error):
+        """
+        Record a call to method_name by the current thread that took
+        call_seconds to execute (including any queue wait added by
+        add_queue_wait() since start_call()) and serialization_seconds to
+        deserialize its arguments and serialize its result, and that failed
+        if error is True.
+        """
+        queue_wait = getattr(self.__current_call, "queue_wait", 0.0)
+        self.__current_call.queue_wait = 0.0
+        now = time.monotonic()
+        with self.__lock:
+            stats = self.__methods.get(method_name)
+            if stats is None:
+                stats = _MethodStats(self.window)
+                self.__methods[method_name] = stats
+            stats.num_calls += 1
+            stats.num_errors += int(error)
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            h = stats.histograms
+            h["queue_wait_seconds"].record(queue_wait, now)
+            h["execution_seconds"].record(
+                max(call_seconds - queue_wait, 0.0), now)
+            h["serialization_seconds"].record(serialization_seconds, now)
+            h["response_size_bytes"].record(response_bytes, now)
+
+    def get_stats(self):
+        """
+        Return a dictionary of the statistics of each method called, keyed by
+        method name. The counts and totals are cumulative, and the histograms
+        (see RollingHistogram.rolling()) are for the last self.window
+        seconds.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            return {name: {"calls": stats.num_calls,
+                           "errors": stats.num_errors,
+                           "request_bytes": stats.request_bytes,
+                           "response_bytes": stats.response_bytes,
+                           **{hist_name: hist.rolling(now)
+                              for (hist_name, hist)
+                              in stats.histograms.items()}
+                           }
+                    for (name, stats) in self.__methods.items()}
+
+    def to_prometheus_text(self, prefix="cugraph_service"):
+        """
+        Return the cumulative statistics in the Prometheus text exposition
+        format, with a "method" label for each method.
+        """
+        lines = []
+
+        def add_metric(name, metric_type, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for (suffix, labels, value) in samples:
+                label_str = ",".join(f'{k}="{v}"' for (k, v) in labels)
+                lines.append(f"{prefix}_{name}{suffix}{{{label_str}}} {value}")
+
+        with self.__lock:
+            methods = sorted(self.__methods.items())
+            for (name, attr, help_text) in [
+                    ("calls_total", "num_calls", "Number of calls"),
+                    ("errors_total", "num_errors", "Number of failed calls"),
+                    ("request_bytes_total", "request_bytes",
+                     "Total size of the serialized requests"),
+                    ("response_bytes_total", "response_bytes",
+                     "Total size of the serialized responses")]:
+                add_metric(name, "counter", help_text,
+                           [("", [("method", m)], getattr(stats, attr))
+                            for (m, stats) in methods])
+
+            for (hist_name, help_text) in \
+                    self.__histogram_descriptions.items():
+                samples = []
+                for (m, stats) in methods:
+                    hist = stats.histograms[hist_name]
+                    counts = hist.cumulative()
+                    bounds = [str(b) for b in hist.bucket_bounds] + ["+Inf"]
+                    total = 0
+                    for (bound, c) in zip(bounds, counts["buckets"]):
+                        total += c
+                        samples.append(("_bucket",
+                                        [("method", m), ("le", bound)],
+                                        total))
+                    samples.append(("_sum", [("method", m)], counts["sum"]))
+                    samples.append(("_count", [("method", m)],
+                                    counts["count"]))
+                add_metric(hist_name, "histogram", help_text, samples)
+
+        return "\n".join(lines) + "\n"
@@ -13,66 +13,482 @@
 # limitations under the License.
 
 from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+import glob
 import importlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
 import time
 import traceback
 from inspect import signature
 
 import numpy as np
-import cudf
-import dask_cudf
+import pandas as pd
 import cugraph
-from dask.distributed import Client
-from dask_cuda.initialize import initialize as dask_initialize
-from cugraph.experimental import PropertyGraph, MGPropertyGraph
-from cugraph.dask.comms import comms as Comms
-from cugraph import uniform_neighbor_sample
-from cugraph.dask import uniform_neighbor_sample as mg_uniform_neighbor_sample
-from cugraph.structure.graph_implementation.simpleDistributedGraph import (
-    simpleDistributedGraphImpl,
+from cugraph.experimental import PropertyGraph
+from cugraph.structure.selection_expression import (
+    compile_selection_expression,
 )
+from cugraph.utilities.utils import import_optional, MissingModule
 
 from cugraph_service_client import defaults
+from cugraph_service_client.cugraph_service_thrift import (
+    spec,
+    deserialize_call_args,
+    get_call_arg_names,
+    serialize_call_result,
+)
 from cugraph_service_client.exceptions import CugraphServiceError
 from cugraph_service_client.types import (
+    AlgoResult,
     BatchedEgoGraphsResult,
     Node2vecResult,
+    ResultFormat,
     UniformNeighborSampleResult,
     ValueWrapper,
     GraphVertexEdgeIDWrapper,
+    encode_ndarray,
 )
+from cugraph_service_server import algos
+from cugraph_service_server.call_stats import CallStats
+from cugraph_service_server.host_graph import HostGraph
 
 
-def call_algo(sg_algo_func, G, **kwargs):
+class _MissingType:
     """
-    Calls the appropriate algo function based on the graph G being MG or SG. If
-    G is SG, sg_algo_func will be called and passed kwargs, otherwise the MG
-    version of sg_algo_func will be called with kwargs.
+    Used in place of the types of GPU packages that are not installed, so
+    isinstance() checks using them are always False.
     """
-    is_mg_graph = isinstance(G._Impl, simpleDistributedGraphImpl)
-
-    if sg_algo_func is uniform_neighbor_sample:
-        if is_mg_graph:
-            possible_args = ["start_list", "fanout_vals", "with_replacement"]
-            kwargs_to_pass = {a: kwargs[a] for a in possible_args
-                              if a in kwargs}
-            data = mg_uniform_neighbor_sample(G, **kwargs_to_pass)
-            data = data.compute()
-        else:
-            possible_args = ["start_list", "fanout_vals", "with_replacement",
-                             "is_edge_ids"]
-            kwargs_to_pass = {a: kwargs[a] for a in possible_args
-                              if a in kwargs}
-            data = uniform_neighbor_sample(G, **kwargs_to_pass)
 
-        return UniformNeighborSampleResult(
-            sources=data.sources.values_host,
-            destinations=data.destinations.values_host,
-            indices=data.indices.values_host
-        )
 
-    else:
-        raise RuntimeError(f"internal error: {sg_algo_func} is not supported")
+class _MissingDaskCuDF(MissingModule):
+    """
+    Used in place of the dask_cudf module when it is not installed.
+    """
+    DataFrame = _MissingType
+
+
+# The GPU packages are only used by the "gpu" backend, and do not need to be
+# installed to use the "cpu" backend (see cugraph/__init__.py).
+cudf = import_optional("cudf")
+dask_cudf = import_optional("dask_cudf", default_mod_class=_MissingDaskCuDF)
+dask_distributed = import_optional("dask.distributed")
+dask_cuda_initialize = import_optional("dask_cuda.initialize")
+if isinstance(cudf, MissingModule):
+    MGPropertyGraph = _MissingType
+else:
+    from cugraph.experimental import MGPropertyGraph
+    from cugraph.dask.comms import comms as Comms
+
+
+def make_array_result(result_type, result_format, **arrays):
+    """
+    Return an instance of the Thrift struct result_type containing the numpy
+    arrays in arrays, keyed by field name. If result_format is
+    ResultFormat.BINARY, each array is encoded using encode_ndarray() and set
+    on the corresponding "<field name>_buffer" field, otherwise each array is
+    set on the field as a list.
+    """
+    if result_format == ResultFormat.BINARY:
+        return result_type(**{f"{name}_buffer": encode_ndarray(array)
+                              for (name, array) in arrays.items()})
+    return result_type(**arrays)
+
+
+class ReadWriteLock:
+    """
+    A lock that can be held by any number of readers at the same time, or by a
+    single writer. Readers that request the lock while a writer is waiting for
+    it wait for the writer, so a steady stream of readers cannot starve
+    writers.
+    """
+    def __init__(self):
+        self.__condition = threading.Condition()
+        self.__num_readers = 0
+        self.__num_waiting_writers = 0
+        self.__has_writer = False
+
+    @contextmanager
+    def read_locked(self):
+        """
+        Context manager which holds the lock as a reader.
+        """
+        with self.__condition:
+            while self.__has_writer or self.__num_waiting_writers:
+                self.__condition.wait()
+            self.__num_readers += 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__num_readers -= 1
+                if self.__num_readers == 0:
+                    self.__condition.notify_all()
+
+    @contextmanager
+    def write_locked(self):
+        """
+        Context manager which holds the lock as the only writer.
+        """
+        with self.__condition:
+            self.__num_waiting_writers += 1
+            while self.__has_writer or self.__num_readers:
+                self.__condition.wait()
+            self.__num_waiting_writers -= 1
+            self.__has_writer = True
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__has_writer = False
+                self.__condition.notify_all()
+
+    @contextmanager
+    def try_write_locked(self):
+        """
+        Context manager which holds the lock as the only writer and yields
+        True if no other reader or writer holds or is waiting for the lock,
+        otherwise yields False without waiting for the lock.
+        """
+        with self.__condition:
+            acquired = not (self.__has_writer or self.__num_readers or
+                            self.__num_waiting_writers)
+            if acquired:
+                self.__has_writer = True
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with self.__condition:
+                    self.__has_writer = False
+                    self.__condition.notify_all()
+
+
+def graph_locked(write=False):
+    """
+    Decorator for CugraphHandler methods which have a graph_id param, that
+    holds the lock for the graph identified by graph_id while the method is
+    running. The lock is held as a writer if write is True, otherwise as a
+    reader, allowing methods that only read a graph to run concurrently.
+    Auto-refreshed subgraphs are refreshed before being locked as a reader
+    (see CugraphHandler.extract_subgraph()).
+    """
+    def decorator(method):
+        graph_id_index = list(signature(method).parameters).index("graph_id")
+
+        @wraps(method)
+        def wrapped_method(self, *args, **kwargs):
+            if "graph_id" in kwargs:
+                graph_id = kwargs["graph_id"]
+            else:
+                # args does not include self
+                graph_id = args[graph_id_index - 1]
+            if not write:
+                self._refresh_graph(graph_id)
+            lock = self._get_graph_lock(graph_id)
+            locked = lock.write_locked() if write else lock.read_locked()
+            wait_start_time = time.perf_counter()
+            with locked:
+                self.call_stats.add_queue_wait(time.perf_counter() -
+                                               wait_start_time)
+                return method(self, *args, **kwargs)
+        return wrapped_method
+    return decorator
+
+
+class _GraphDataCursor:
+    """
+    State of a cursor opened by CugraphHandler.open_graph_*_data_cursor():
+    the iterator of serialized batches of rows to return, the graph the rows
+    are from, and the time the cursor was last used. lock must be held when
+    reading from batches.
+    """
+    def __init__(self, batches, graph_id):
+        self.batches = batches
+        self.graph_id = graph_id
+        self.last_used_time = time.monotonic()
+        self.lock = threading.Lock()
+
+
+class _OffloadedGraph:
+    """
+    Placeholder for a graph whose data has been written to the directory path
+    by offload() to free the memory it used, which can be recreated by
+    load(). lock must be held when calling load(), and graph is set to the
+    graph it returned.
+
+    PropertyGraphs are saved using PropertyGraph.save(), SG cuGraph Graphs
+    are saved as their edge list and edge_data (if any), and HostGraphs are
+    pickled. MG graphs cannot be offloaded.
+    """
+    def __init__(self, path, graph_type, attrs):
+        self.path = path
+        self.graph_type = graph_type
+        self.attrs = attrs
+        self.lock = threading.Lock()
+        self.graph = None
+
+    @staticmethod
+    def can_offload(G):
+        if isinstance(G, (PropertyGraph, HostGraph)):
+            return True
+        # cugraph.Graph is not available without cuDF
+        return not(isinstance(cudf, MissingModule)) and \
+            isinstance(G, cugraph.Graph) and \
+            (algos.get_graph_kind(G) == "sg")
+
+    @classmethod
+    def offload(cls, G, dir_path):
+        """
+        Write the data of G to a new directory in dir_path, and return an
+        _OffloadedGraph for it.
+        """
+        path = tempfile.mkdtemp(prefix="graph_", dir=dir_path)
+        try:
+            attrs = {}
+            if isinstance(G, PropertyGraph):
+                G.save(path)
+            elif isinstance(G, HostGraph):
+                with open(os.path.join(path, "graph.pickle"), "wb") as f:
+                    pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+            else:
+                attrs = {"directed": G.is_directed(),
+                         "weighted": G.is_weighted(),
+                         "renumbered": G.is_renumbered(),
+                         "has_edge_data":
+                         getattr(G, "edge_data", None) is not None,
+                         }
+                G.view_edge_list().to_parquet(
+                    os.path.join(path, "edgelist.parquet"))
+                if attrs["has_edge_data"]:
+                    G.edge_data.to_parquet(
+                        os.path.join(path, "edge_data.parquet"))
+        except Exception:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+        return cls(path, type(G), attrs)
+
+    def load(self):
+        """
+        Return a new graph containing the data written by offload().
+        """
+        if issubclass(self.graph_type, PropertyGraph):
+            return self.graph_type.load(self.path)
+        if issubclass(self.graph_type, HostGraph):
+            with open(os.path.join(self.path, "graph.pickle"), "rb") as f:
+                return pickle.load(f)
+
+        G = self.graph_type(directed=self.attrs["directed"])
+        edgelist_df = cudf.read_parquet(
+            os.path.join(self.path, "edgelist.parquet"))
+        G.from_cudf_edgelist(
+            edgelist_df,
+            source="src",
+            destination="dst",
+            edge_attr="weights" if self.attrs["weighted"] else None,
+            renumber=self.attrs["renumbered"])
+        if self.attrs["has_edge_data"]:
+            G.edge_data = cudf.read_parquet(
+                os.path.join(self.path, "edge_data.parquet"))
+        return G
+
+    def remove_files(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class _SubgraphSource:
+    """
+    Source of a subgraph extracted by CugraphHandler.extract_subgraph() with
+    auto_refresh set: the ID of the graph it was extracted from, the number
+    of edges of that graph that have been read, the edge selection expression
+    (or None), the numpy array of the IDs of the edges selected by it (or
+    None if there is no selection, since all edges read are then used), the
+    property columns and args used to create the subgraph from the edges
+    using edge_props_to_graph(). stale is set when the parent graph is
+    modified, and cleared when the subgraph is refreshed.
+    """
+    def __init__(self, parent_graph_id, num_edges_read, selection, edge_ids,
+                 property_columns, graph_args):
+        self.parent_graph_id = parent_graph_id
+        self.num_edges_read = num_edges_read
+        self.selection = selection
+        self.edge_ids = edge_ids
+        self.property_columns = property_columns
+        self.graph_args = graph_args
+        self.stale = False
+
+    @property
+    def num_bytes(self):
+        """
+        The size in bytes of the edge IDs kept in memory.
+        """
+        return 0 if self.edge_ids is None else self.edge_ids.nbytes
+
+
+class ResultCache:
+    """
+    LRU cache of CugraphHandler call results, bounded by max_bytes, the total
+    estimated size in bytes of the cached results. Each result is stored with
+    the IDs of the graphs it depends on (the graph it was computed from, and
+    the graph it created, if any), and is removed when any of those graphs is
+    modified or deleted.
+
+    Results are not copied, so they must not be modified after being cached.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        # key:(result, size, graph_ids), least recently used first
+        self.__entries = OrderedDict()
+        self.__num_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the result cached for key, or default if there is none.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__misses += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[0]
+
+    def put(self, key, result, graph_ids):
+        """
+        Cache result for key, evicting the least recently used results as
+        needed to stay within max_bytes. Results larger than max_bytes are
+        not cached.
+        """
+        size = self.get_result_size(result)
+        if size > self.max_bytes:
+            return
+        with self.__lock:
+            self.__remove(key)
+            self.__entries[key] = (result, size, frozenset(graph_ids))
+            self.__num_bytes += size
+            while self.__num_bytes > self.max_bytes:
+                self.__remove(next(iter(self.__entries)))
+
+    def invalidate(self, graph_id):
+        """
+        Remove all results that depend on the graph identified by graph_id.
+        """
+        with self.__lock:
+            for (key, (_, _, graph_ids)) in list(self.__entries.items()):
+                if graph_id in graph_ids:
+                    self.__remove(key)
+
+    def info(self):
+        """
+        Return a dictionary of the number of hits and misses, and the number
+        of results and bytes currently cached.
+        """
+        with self.__lock:
+            return {"hits": self.__hits,
+                    "misses": self.__misses,
+                    "num_results": len(self.__entries),
+                    "num_bytes": self.__num_bytes,
+                    "max_bytes": self.max_bytes,
+                    }
+
+    @staticmethod
+    def get_result_size(result):
+        """
+        Return the estimated size in bytes of result, which is either bytes,
+        a number, or a Thrift struct containing binary and list (of numbers
+        or binary) fields.
+        """
+        if isinstance(result, (bytes, bytearray)):
+            return len(result)
+        if isinstance(result, (int, float, bool)) or (result is None):
+            return 8
+        size = 0
+        for value in vars(result).values():
+            if isinstance(value, (bytes, bytearray)):
+                size += len(value)
+            elif isinstance(value, list):
+                # The size of each buffer, or of a typical number, ignoring
+                # the list overhead
+                size += sum(len(v) if isinstance(v, (bytes, bytearray))
+                            else 8 for v in value)
+            else:
+                size += 8
+        return size
+
+    def __remove(self, key):
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__num_bytes -= entry[1]
+
+
+def _make_hashable(value):
+    """
+    Return value with lists, tuples, and dicts (recursively) converted to
+    tuples, for use in a ResultCache key.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _make_hashable(v))
+                            for (k, v) in value.items()))
+    return value
+
+
+def result_cached(returns_graph_id=False):
+    """
+    Decorator for CugraphHandler methods which have a graph_id param, whose
+    results only depend on their args and the graph identified by graph_id,
+    that returns results from the handler's ResultCache, if enabled, instead
+    of calling the method again. If returns_graph_id is True, the method
+    returns the ID of a graph it created, and the result is also removed from
+    the cache when that graph is modified or deleted. Since the same graph ID
+    is then returned to each caller, a reference is added to the graph for
+    each cache hit, and the graph is only deleted when delete_graph() has been
+    called for each reference.
+
+    The cache must be checked while the graph is locked, so this decorator
+    must be applied before (below) graph_locked.
+    """
+    def decorator(method):
+        method_sig = signature(method)
+
+        @wraps(method)
+        def wrapped_method(self, *args, **kwargs):
+            cache = self._get_result_cache()
+            if cache is None:
+                return method(self, *args, **kwargs)
+
+            bound_args = method_sig.bind(self, *args, **kwargs)
+            bound_args.apply_defaults()
+            arguments = dict(bound_args.arguments)
+            del arguments["self"]
+            key = (method.__name__, _make_hashable(arguments))
+
+            result = cache.get(key, default=cache)
+            # The graph may have been deleted since it was cached, in which
+            # case it is created again.
+            if (result is not cache) and \
+               ((not returns_graph_id) or self._add_graph_reference(result)):
+                return result
+
+            result = method(self, *args, **kwargs)
+            graph_ids = [arguments["graph_id"]]
+            if returns_graph_id:
+                graph_ids.append(result)
+            cache.put(key, result, graph_ids)
+            return result
+        return wrapped_method
+    return decorator
 
 
 class ExtensionServerFacade:
@@ -107,22 +523,89 @@ class ExtensionServerFacade:
 class CugraphHandler:
     """
     Class which handles RPC requests for a cugraph_service server.
+
+    Calls can be made concurrently from multiple threads. Calls which only read
+    a graph can run at the same time, while calls which modify a graph wait for
+    all other calls using that graph to complete.
     """
 
     # The name of the param that should be set to a ExtensionServerFacade
     # instance for server extension functions.
     __server_facade_extension_param_name = "server"
 
-    def __init__(self):
+    # Graph data cursors that have not been read from in this many seconds
+    # are closed when other cursors are opened.
+    cursor_timeout = 600
+
+    # The backends a CugraphHandler can use. The "gpu" backend uses cuDF,
+    # cuGraph, and (optionally) a dask cluster for MG. The "cpu" backend uses
+    # PropertyGraphs containing pandas DataFrames, HostGraphs for extracted
+    # subgraphs, and the host algorithms in host_graph, and does not use a GPU
+    # or require cuDF to be installed.
+    backends = ["gpu", "cpu"]
+
+    def __init__(self, backend="gpu", result_cache_size=0,
+                 graph_memory_budget=0, graph_offload_dir=None,
+                 num_workers=defaults.num_workers):
+        # Set first since __del__() is called even if __init__() raises
+        self.__dask_client = None
+        self.__dask_cluster = None
+        if backend not in self.backends:
+            raise ValueError(f"backend must be one of {self.backends}, got "
+                             f"{backend!r}")
+        if (backend == "gpu") and isinstance(cudf, MissingModule):
+            raise RuntimeError("the gpu backend requires the cudf "
+                               "package/module, use the cpu backend instead")
+        self.__backend = backend
+        # The number of client connections the server using this handler
+        # handles concurrently, reported by get_server_info() so clients can
+        # check that the server can handle their pool of connections.
+        self.__num_workers = num_workers
+        # Cache of algorithm and extract_subgraph() results, up to
+        # result_cache_size bytes, or None if disabled
+        self.__result_cache = None
+        if result_cache_size > 0:
+            self.__result_cache = ResultCache(result_cache_size)
         self.__next_graph_id = defaults.graph_id + 1
         self.__graph_objs = {}
+        # ReadWriteLocks for each graph, keyed by graph ID. __graph_objs_lock
+        # must be held when accessing __graph_objs, __graph_locks, or
+        # __next_graph_id.
+        self.__graph_locks = {}
+        self.__graph_objs_lock = threading.Lock()
+        # The estimated size in bytes of each graph when in memory, and the
+        # time.monotonic() value when each graph was last used, keyed by graph
+        # ID. __graph_objs_lock must be held when accessing these.
+        self.__graph_num_bytes = {}
+        self.__graph_access_times = {}
+        # The number of references to each graph returned by a result_cached
+        # method more than once, keyed by graph ID. Other graphs have a single
+        # reference. __graph_objs_lock must be held when accessing this.
+        self.__graph_ref_counts = {}
+        # If greater than 0, the least recently used graphs are offloaded to
+        # new directories in __graph_offload_dir (the default temporary
+        # directory if None), and replaced by _OffloadedGraphs in
+        # __graph_objs, when the total size of the graphs in memory exceeds
+        # __graph_memory_budget bytes.
+        self.__graph_memory_budget = graph_memory_budget
+        self.__graph_offload_dir = graph_offload_dir
+        # _SubgraphSources of auto-refreshed subgraphs, keyed by graph ID.
+        # __graph_objs_lock must be held when accessing __subgraph_sources.
+        self.__subgraph_sources = {}
+        # Open _GraphDataCursors, keyed by cursor ID. __cursors_lock must be
+        # held when accessing __cursors or __next_cursor_id.
+        self.__cursors = {}
+        self.__next_cursor_id = 1
+        self.__cursors_lock = threading.Lock()
         self.__graph_creation_extensions = {}
-        self.__dask_client = None
-        self.__dask_cluster = None
         self.__start_time = int(time.time())
+        self.__call_stats = CallStats()
 
     def __del__(self):
         self.shutdown_dask_client()
+        for G in getattr(self, "_CugraphHandler__graph_objs", {}).values():
+            if isinstance(G, _OffloadedGraph):
+                G.remove_files()
 
     ###########################################################################
     # Environment management
@@ -134,6 +617,21 @@ class CugraphHandler:
         """
         return self.__dask_client is not None
 
+    @property
+    def call_stats(self):
+        """
+        The CallStats recording the time and sizes of the calls handled by
+        the CugraphHandler, updated by the server.
+        """
+        return self.__call_stats
+
+    @property
+    def backend(self):
+        """
+        The backend used by the CugraphHandler, either "gpu" or "cpu".
+        """
+        return self.__backend
+
     def uptime(self):
         """
         Return the server uptime in seconds. This is often used as a "ping".
@@ -150,13 +648,53 @@ class CugraphHandler:
         # FIXME: expose self.__dask_client.scheduler_info() as needed
         if self.__dask_client is not None:
             num_gpus = len(self.__dask_client.scheduler_info()["workers"])
+        elif self.__backend == "cpu":
+            num_gpus = 0
         else:
-            # The assumption is that cugraph_service server requires at least 1
-            # GPU (ie.  currently there is no CPU-only version of
-            # cugraph_service server)
+            # The "gpu" backend requires at least 1 GPU
             num_gpus = 1
 
-        return {"num_gpus": ValueWrapper(num_gpus).union}
+        if self.__result_cache is not None:
+            result_cache_info = self.__result_cache.info()
+        else:
+            result_cache_info = {"hits": 0, "misses": 0, "num_bytes": 0}
+
+        with self.__graph_objs_lock:
+            offloaded = [isinstance(G, _OffloadedGraph)
+                         for G in self.__graph_objs.values()]
+            graph_memory_bytes = sum(
+                self.__graph_num_bytes.get(gid, 0)
+                for (gid, G) in self.__graph_objs.items()
+                if not isinstance(G, _OffloadedGraph)) + \
+                self.__get_subgraph_sources_num_bytes()
+
+        return {"num_gpus": ValueWrapper(num_gpus).union,
+                "backend": ValueWrapper(self.__backend).union,
+                "result_cache_hits":
+                ValueWrapper(result_cache_info["hits"]).union,
+                "result_cache_misses":
+                ValueWrapper(result_cache_info["misses"]).union,
+                "result_cache_bytes":
+                ValueWrapper(result_cache_info["num_bytes"]).union,
+                "graph_memory_bytes": ValueWrapper(graph_memory_bytes).union,
+                "num_offloaded_graphs": ValueWrapper(sum(offloaded)).union,
+                "num_workers": ValueWrapper(self.__num_workers).union,
+                }
+
+    def get_server_stats(self, format):
+        """
+        Returns the per-method call statistics recorded in self.call_stats,
+        either as a JSON string if format is "json", or as text in the
+        Prometheus exposition format if format is "prometheus".
+        """
+        if format == "json":
+            return json.dumps({"uptime": self.uptime(),
+                               "window_seconds": self.__call_stats.window,
+                               "methods": self.__call_stats.get_stats()})
+        elif format == "prometheus":
+            return self.__call_stats.to_prometheus_text()
+        raise CugraphServiceError('format must be "json" or "prometheus", '
+                                  f"got {format!r}")
 
     def load_graph_creation_extensions(self, extension_dir_path):
         """
@@ -247,15 +785,19 @@ class CugraphHandler:
         """
         Initialize a dask client to be used for MG operations.
         """
+        if self.__backend == "cpu":
+            raise CugraphServiceError("a dask client cannot be used with the "
+                                      "cpu backend")
         if dask_scheduler_file is not None:
             # Env var UCX_MAX_RNDV_RAILS=1 must be set too.
-            dask_initialize(enable_tcp_over_ucx=True,
-                            enable_nvlink=True,
-                            enable_infiniband=True,
-                            enable_rdmacm=True,
-                            # net_devices="mlx5_0:1",
-                            )
-            self.__dask_client = Client(scheduler_file=dask_scheduler_file)
+            dask_cuda_initialize.initialize(enable_tcp_over_ucx=True,
+                                            enable_nvlink=True,
+                                            enable_infiniband=True,
+                                            enable_rdmacm=True,
+                                            # net_devices="mlx5_0:1",
+                                            )
+            self.__dask_client = dask_distributed.Client(
+                scheduler_file=dask_scheduler_file)
         else:
             # FIXME: LocalCUDACluster init. Implement when tests are in place.
             raise NotImplementedError
@@ -287,13 +829,38 @@ class CugraphHandler:
         pG = self.__create_graph()
         return self.__add_graph(pG)
 
+    @graph_locked(write=True)
     def delete_graph(self, graph_id):
         """
-        Remove the graph identified by graph_id from the server.
+        Remove the graph identified by graph_id from the server. If the graph
+        ID was returned more than once from the result cache, this only
+        removes one reference to the graph, and the graph is removed when the
+        last reference is.
         """
-        dG = self.__graph_objs.pop(graph_id, None)
+        with self.__graph_objs_lock:
+            ref_count = self.__graph_ref_counts.get(graph_id, 1)
+            if (ref_count > 1) and (graph_id in self.__graph_objs):
+                if ref_count > 2:
+                    self.__graph_ref_counts[graph_id] = ref_count - 1
+                else:
+                    del self.__graph_ref_counts[graph_id]
+                print(f"removed a reference to graph with id {graph_id}")
+                return
+            self.__graph_ref_counts.pop(graph_id, None)
+            dG = self.__graph_objs.pop(graph_id, None)
+            self.__graph_locks.pop(graph_id, None)
+            self.__graph_num_bytes.pop(graph_id, None)
+            self.__graph_access_times.pop(graph_id, None)
+            # Subgraphs of the deleted graph are no longer refreshed
+            self.__subgraph_sources = {
+                gid: source for (gid, source)
+                in self.__subgraph_sources.items()
+                if graph_id not in (gid, source.parent_graph_id)}
         if dG is None:
             raise CugraphServiceError(f"invalid graph_id {graph_id}")
+        if isinstance(dG, _OffloadedGraph):
+            dG.remove_files()
+        self.__graph_modified(graph_id)
 
         del dG
         print(f'deleted graph with id {graph_id}')
@@ -302,8 +869,10 @@ class CugraphHandler:
         """
         Returns a list of the graph IDs currently in use.
         """
-        return list(self.__graph_objs.keys())
+        with self.__graph_objs_lock:
+            return list(self.__graph_objs.keys())
 
+    @graph_locked()
     def get_graph_info(self, keys, graph_id):
         """
         Returns a dictionary of meta-data about the graph identified by
@@ -312,12 +881,18 @@ class CugraphHandler:
         Dictionary items are string:union_objs, where union_objs are Value
         "unions" used for RPC serialization.
         """
+        # Keys for the memory used by the graph, which do not require an
+        # offloaded graph to be reloaded.
+        memory_keys = set(["memory_bytes",
+                           "idle_seconds",
+                           "is_offloaded",
+                           ])
         valid_keys = set(["num_vertices",
                           "num_vertices_from_vertex_data",
                           "num_edges",
                           "num_vertex_properties",
                           "num_edge_properties",
-                          ])
+                          ]) | memory_keys
         if len(keys) == 0:
             keys = valid_keys
         else:
@@ -325,8 +900,16 @@ class CugraphHandler:
             if len(invalid_keys) != 0:
                 raise CugraphServiceError(f"got invalid keys: {invalid_keys}")
 
-        G = self._get_graph(graph_id)
         info = {}
+        if memory_keys & set(keys):
+            memory_info = self.__get_graph_memory_info(graph_id)
+            info.update((k, memory_info[k]) for k in memory_keys & set(keys))
+            keys = set(keys) - memory_keys
+            if not keys:
+                return {key: ValueWrapper(value).union
+                        for (key, value) in info.items()}
+
+        G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
             for k in keys:
                 if k == "num_vertices":
@@ -355,12 +938,14 @@ class CugraphHandler:
         return {key: ValueWrapper(value).union
                 for (key, value) in info.items()}
 
+    @graph_locked()
     def get_graph_type(self, graph_id):
         """
         Returns a string repr of the graph type associated with graph_id.
         """
         return repr(type(self._get_graph(graph_id)))
 
+    @graph_locked(write=True)
     def load_csv_as_vertex_data(self,
                                 csv_file_name,
                                 delimiter,
@@ -378,6 +963,7 @@ class CugraphHandler:
         default graph if not specified.
         """
         pG = self._get_graph(graph_id)
+        self.__graph_modified(graph_id)
         if header == -1:
             header = "infer"
         elif header == -2:
@@ -400,7 +986,9 @@ class CugraphHandler:
                                property_columns=property_columns)
         except Exception:
             raise CugraphServiceError(f"{traceback.format_exc()}")
+        self.__update_graph_memory(graph_id, pG)
 
+    @graph_locked(write=True)
     def load_csv_as_edge_data(self,
                               csv_file_name,
                               delimiter,
@@ -418,6 +1006,7 @@ class CugraphHandler:
         default graph if not specified.
         """
         pG = self._get_graph(graph_id)
+        self.__graph_modified(graph_id)
         # FIXME: error check that file exists
         # FIXME: error check that edgelist read correctly
         if header == -1:
@@ -440,9 +1029,73 @@ class CugraphHandler:
                              property_columns=property_columns)
         except Exception:
             raise CugraphServiceError(f"{traceback.format_exc()}")
+        self.__prepare_for_readers(pG)
+        self.__update_graph_memory(graph_id, pG)
+
+    @graph_locked(write=True)
+    def load_parquet_as_vertex_data(self,
+                                    parquet_path,
+                                    vertex_col_name,
+                                    type_name,
+                                    property_columns,
+                                    graph_id,
+                                    ):
+        """
+        Read the Parquet file, directory of Parquet files, or files matching
+        the glob pattern parquet_path present on the server's file system, and
+        apply it as vertex data to the graph specified by graph_id. Only the
+        vertex_col_name and property_columns (if any) columns are read.
+        """
+        pG = self._get_graph(graph_id)
+        self.__graph_modified(graph_id)
+        columns = None
+        if property_columns:
+            columns = [vertex_col_name] + [c for c in property_columns
+                                           if c != vertex_col_name]
+        try:
+            df = self.__get_dataframe_from_parquet(parquet_path, columns)
+            pG.add_vertex_data(df,
+                               type_name=type_name,
+                               vertex_col_name=vertex_col_name,
+                               property_columns=property_columns or None)
+        except Exception:
+            raise CugraphServiceError(f"{traceback.format_exc()}")
+        self.__update_graph_memory(graph_id, pG)
+
+    @graph_locked(write=True)
+    def load_parquet_as_edge_data(self,
+                                  parquet_path,
+                                  vertex_col_names,
+                                  type_name,
+                                  property_columns,
+                                  graph_id,
+                                  ):
+        """
+        Read the Parquet file, directory of Parquet files, or files matching
+        the glob pattern parquet_path present on the server's file system, and
+        apply it as edge data to the graph specified by graph_id. Only the
+        vertex_col_names and property_columns (if any) columns are read.
+        """
+        pG = self._get_graph(graph_id)
+        self.__graph_modified(graph_id)
+        columns = None
+        if property_columns:
+            columns = list(vertex_col_names) + \
+                [c for c in property_columns if c not in vertex_col_names]
+        try:
+            df = self.__get_dataframe_from_parquet(parquet_path, columns)
+            pG.add_edge_data(df,
+                             type_name=type_name,
+                             vertex_col_names=vertex_col_names,
+                             property_columns=property_columns or None)
+        except Exception:
+            raise CugraphServiceError(f"{traceback.format_exc()}")
+        self.__prepare_for_readers(pG)
+        self.__update_graph_memory(graph_id, pG)
 
     # FIXME: ensure edge IDs can also be filtered by edge type
     # See: https://github.com/rapidsai/cugraph/issues/2655
+    @graph_locked()
     def get_edge_IDs_for_vertices(self, src_vert_IDs, dst_vert_IDs, graph_id):
         """
         Return a list of edge IDs corresponding to the vertex IDs in each of
@@ -453,18 +1106,27 @@ class CugraphHandler:
         return the edge IDs for edges (0, 7), (1, 8), and (2, 9).
 
         graph_id must be associated with a Graph extracted from a PropertyGraph
-        (MG or SG).
+        (MG or SG). If any of the (src, dst) pairs are not edges in the graph,
+        a CugraphServiceError listing the missing pairs is raised.
         """
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
             raise CugraphServiceError("get_edge_IDs_for_vertices() only "
                                       "accepts an extracted subgraph ID, got "
                                       f"an ID for a {type(G)}.")
+        if len(src_vert_IDs) != len(dst_vert_IDs):
+            raise CugraphServiceError("src_vert_IDs and dst_vert_IDs must be "
+                                      "the same length, got "
+                                      f"{len(src_vert_IDs)} and "
+                                      f"{len(dst_vert_IDs)}")
 
         return self.__get_edge_IDs_from_graph_edge_data(G,
                                                         src_vert_IDs,
-                                                        dst_vert_IDs)
+                                                        dst_vert_IDs,
+                                                        graph_id)
 
+    @graph_locked()
+    @result_cached(returns_graph_id=True)
     def extract_subgraph(self,
                          create_using,
                          selection,
@@ -473,10 +1135,20 @@ class CugraphHandler:
                          allow_multi_edges,
                          renumber_graph,
                          add_edge_data,
-                         graph_id
+                         graph_id,
+                         auto_refresh=False
                          ):
         """
         Extract a subgraph, return a new graph ID
+
+        selection, if not empty, is an edge selection expression (see
+        PropertyGraph.select_edges()) for the edges to include.
+
+        If auto_refresh is True, edges added to the graph identified by
+        graph_id after the subgraph is extracted are also added to the
+        subgraph the next time it is used. Only the new edges are read from
+        the graph and filtered using the selection, but the subgraph is
+        recreated from all of its edges.
         """
         pG = self._get_graph(graph_id)
         if not(isinstance(pG, (PropertyGraph, MGPropertyGraph))):
@@ -484,71 +1156,175 @@ class CugraphHandler:
                                       "on a graph with properties.")
         # Convert defaults needed for the RPC API into defaults used by
         # PropertyGraph.extract_subgraph()
-        create_using = create_using or cugraph.Graph
+        if self.__backend == "cpu":
+            create_using = HostGraph
+        else:
+            create_using = create_using or cugraph.Graph
         selection = selection or None
         edge_weight_property = edge_weight_property or None
 
-        # FIXME: create_using and selection should not be strings at this point
+        # FIXME: create_using should not be a string at this point
 
         try:
+            property_selection = None
+            if selection is not None:
+                property_selection = pG.select_edges(selection)
             G = pG.extract_subgraph(create_using,
-                                    selection,
+                                    property_selection,
                                     edge_weight_property,
                                     default_edge_weight,
                                     allow_multi_edges,
                                     renumber_graph,
                                     add_edge_data)
+            if auto_refresh:
+                property_columns = [edge_weight_property] \
+                    if edge_weight_property else []
+                edge_ids = None
+                if selection is not None:
+                    edge_ids = self.__get_selected_edge_IDs(pG, selection)
+                source = _SubgraphSource(
+                    graph_id, pG.get_num_edges(), selection, edge_ids,
+                    property_columns,
+                    dict(create_using=create_using,
+                         edge_weight_property=edge_weight_property,
+                         default_edge_weight=default_edge_weight,
+                         allow_multi_edges=allow_multi_edges,
+                         renumber_graph=renumber_graph,
+                         add_edge_data=add_edge_data))
         except Exception:
             raise CugraphServiceError(f"{traceback.format_exc()}")
 
-        return self.__add_graph(G)
+        return self.__add_graph(G, source if auto_refresh else None)
 
+    @graph_locked()
     def get_graph_vertex_data(self,
                               id_or_ids,
                               null_replacement_value,
                               graph_id,
-                              property_keys):
+                              property_keys,
+                              result_format=None):
         """
         Returns the vertex data as a serialized numpy array for the given
         id_or_ids.  null_replacement_value must be provided if the data
-        contains NA values, since NA values cannot be serialized.
+        contains NA values, since NA values cannot be serialized. The array
+        is serialized using encode_ndarray() if result_format is
+        ResultFormat.BINARY and the data does not require an object array,
+        otherwise it is pickled.
         """
         pG = self._get_graph(graph_id)
-        ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
-        if ids == -1:
-            ids = None
-        elif not isinstance(ids, list):
-            ids = [ids]
-        if property_keys == []:
-            columns = None
-        else:
-            columns = property_keys
+        (ids, columns) = self.__get_graph_data_ids_and_columns(id_or_ids,
+                                                               property_keys)
         df = pG.get_vertex_data(vertex_ids=ids, columns=columns)
-        return self.__get_graph_data_as_numpy_bytes(df, null_replacement_value)
+        return self.__get_graph_data_as_numpy_bytes(df,
+                                                    null_replacement_value,
+                                                    result_format)
 
+    @graph_locked()
     def get_graph_edge_data(self,
                             id_or_ids,
                             null_replacement_value,
                             graph_id,
-                            property_keys):
+                            property_keys,
+                            result_format=None):
         """
         Returns the edge data as a serialized numpy array for the given
         id_or_ids.  null_replacement_value must be provided if the data
-        contains NA values, since NA values cannot be serialized.
+        contains NA values, since NA values cannot be serialized. The array
+        is serialized using encode_ndarray() if result_format is
+        ResultFormat.BINARY and the data does not require an object array,
+        otherwise it is pickled.
         """
         pG = self._get_graph(graph_id)
-        ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
-        if ids == -1:
-            ids = None
-        elif not isinstance(ids, list):
-            ids = [ids]
-        if property_keys == []:
-            columns = None
-        else:
-            columns = property_keys
+        (ids, columns) = self.__get_graph_data_ids_and_columns(id_or_ids,
+                                                               property_keys)
         df = pG.get_edge_data(edge_ids=ids, columns=columns)
-        return self.__get_graph_data_as_numpy_bytes(df, null_replacement_value)
+        return self.__get_graph_data_as_numpy_bytes(df,
+                                                    null_replacement_value,
+                                                    result_format)
+
+    @graph_locked()
+    def open_graph_vertex_data_cursor(self,
+                                      id_or_ids,
+                                      null_replacement_value,
+                                      graph_id,
+                                      property_keys,
+                                      result_format,
+                                      batch_size):
+        """
+        Returns the ID of a cursor for reading the vertex data for the given
+        id_or_ids in batches of at most batch_size rows using
+        get_next_graph_data_batch(). The arguments are the same as for
+        get_graph_vertex_data().
+        """
+        pG = self._get_graph(graph_id)
+        (ids, columns) = self.__get_graph_data_ids_and_columns(id_or_ids,
+                                                               property_keys)
+        df = pG.get_vertex_data(vertex_ids=ids, columns=columns)
+        return self.__open_graph_data_cursor(df,
+                                             null_replacement_value,
+                                             graph_id,
+                                             result_format,
+                                             batch_size)
+
+    @graph_locked()
+    def open_graph_edge_data_cursor(self,
+                                    id_or_ids,
+                                    null_replacement_value,
+                                    graph_id,
+                                    property_keys,
+                                    result_format,
+                                    batch_size):
+        """
+        Returns the ID of a cursor for reading the edge data for the given
+        id_or_ids in batches of at most batch_size rows using
+        get_next_graph_data_batch(). The arguments are the same as for
+        get_graph_edge_data().
+        """
+        pG = self._get_graph(graph_id)
+        (ids, columns) = self.__get_graph_data_ids_and_columns(id_or_ids,
+                                                               property_keys)
+        df = pG.get_edge_data(edge_ids=ids, columns=columns)
+        return self.__open_graph_data_cursor(df,
+                                             null_replacement_value,
+                                             graph_id,
+                                             result_format,
+                                             batch_size)
+
+    def get_next_graph_data_batch(self, cursor_id):
+        """
+        Returns the next batch of rows of the cursor identified by cursor_id,
+        serialized the same way as the result of get_graph_vertex_data(), or
+        empty bytes if all rows have been returned, in which case the cursor
+        is closed. Only one batch is converted to a numpy array and
+        serialized at a time, and MG data is read one partition at a time.
+        """
+        with self.__cursors_lock:
+            cursor = self.__cursors.get(cursor_id)
+        if cursor is None:
+            raise CugraphServiceError(f"invalid cursor_id {cursor_id}")
+
+        # The graph lock prevents the graph from being modified while a batch
+        # is read from it.
+        with self._get_graph_lock(cursor.graph_id).read_locked(), \
+             cursor.lock:
+            cursor.last_used_time = time.monotonic()
+            batch = next(cursor.batches, None)
+
+        if batch is None:
+            self.close_graph_data_cursor(cursor_id)
+            return b""
+        return batch
+
+    def close_graph_data_cursor(self, cursor_id):
+        """
+        Close the cursor identified by cursor_id, freeing its resources. This
+        only needs to be called for cursors that were not read until all rows
+        were returned. Closing a closed cursor does nothing.
+        """
+        with self.__cursors_lock:
+            self.__cursors.pop(cursor_id, None)
 
+    @graph_locked()
     def is_vertex_property(self, property_key, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -556,6 +1332,7 @@ class CugraphHandler:
 
         raise CugraphServiceError('Graph does not contain properties')
 
+    @graph_locked()
     def is_edge_property(self, property_key, graph_id):
         G = self._get_graph(graph_id)
         if isinstance(G, (PropertyGraph, MGPropertyGraph)):
@@ -565,108 +1342,132 @@ class CugraphHandler:
 
     ###########################################################################
     # Algos
-    def batched_ego_graphs(self, seeds, radius, graph_id):
+    @graph_locked()
+    @result_cached()
+    def batched_ego_graphs(self, seeds, radius, graph_id, result_format=None):
         """
         """
         # FIXME: finish docstring above
-        # FIXME: exception handling
-        G = self._get_graph(graph_id)
-        # FIXME: write test to catch an MGPropertyGraph being passed in
-        if isinstance(G, PropertyGraph):
-            raise CugraphServiceError("batched_ego_graphs() cannot operate "
-                                      "directly on a graph with properties, "
-                                      "call extract_subgraph() then call "
-                                      "batched_ego_graphs() on the extracted "
-                                      "subgraph instead.")
-        try:
-            # FIXME: update this to use call_algo()
-            # FIXME: this should not be needed, need to update
-            # cugraph.batched_ego_graphs to also accept a list
-            seeds = cudf.Series(seeds, dtype="int32")
-            (ego_edge_list, seeds_offsets) = \
-                cugraph.batched_ego_graphs(G, seeds, radius)
-
-            # batched_ego_graphs_result = BatchedEgoGraphsResult(
-            #     src_verts=ego_edge_list["src"].values_host.tobytes(), #i32
-            #     dst_verts=ego_edge_list["dst"].values_host.tobytes(), #i32
-            #     edge_weights=ego_edge_list["weight"].values_host.tobytes(),
-            #                                                             #f64
-            #     seeds_offsets=seeds_offsets.values_host.tobytes() #i64
-            # )
-            batched_ego_graphs_result = BatchedEgoGraphsResult(
-                src_verts=ego_edge_list["src"].values_host,
-                dst_verts=ego_edge_list["dst"].values_host,
-                edge_weights=ego_edge_list["weight"].values_host,
-                seeds_offsets=seeds_offsets.values_host
-            )
-            return batched_ego_graphs_result
-        except Exception:
-            raise CugraphServiceError(f"{traceback.format_exc()}")
-
-        return batched_ego_graphs_result
-
-    def node2vec(self, start_vertices, max_depth, graph_id):
+        columns = self.__run_algo("batched_ego_graphs", graph_id,
+                                  {"seeds": seeds, "radius": radius})
+        return make_array_result(BatchedEgoGraphsResult, result_format,
+                                 **columns)
+
+    @graph_locked()
+    @result_cached()
+    def node2vec(self, start_vertices, max_depth, graph_id,
+                 result_format=None):
         """
         """
         # FIXME: finish docstring above
-        # FIXME: exception handling
-        G = self._get_graph(graph_id)
-        # FIXME: write test to catch an MGPropertyGraph being passed in
-        if isinstance(G, PropertyGraph):
-            raise CugraphServiceError("node2vec() cannot operate directly on "
-                                      "a graph with properties, call "
-                                      "extract_subgraph() then call "
-                                      "node2vec() on the extracted subgraph "
-                                      "instead.")
-
-        try:
-            # FIXME: update this to use call_algo()
-            # FIXME: this should not be needed, need to update cugraph.node2vec
-            # to also accept a list
-            start_vertices = cudf.Series(start_vertices, dtype="int32")
-
-            (paths, weights, path_sizes) = \
-                cugraph.node2vec(G, start_vertices, max_depth)
-
-            node2vec_result = Node2vecResult(
-                vertex_paths=paths.values_host,
-                edge_weights=weights.values_host,
-                path_sizes=path_sizes.values_host,
-            )
-        except Exception:
-            raise CugraphServiceError(f"{traceback.format_exc()}")
-
-        return node2vec_result
+        columns = self.__run_algo("node2vec", graph_id,
+                                  {"start_vertices": start_vertices,
+                                   "max_depth": max_depth})
+        return make_array_result(Node2vecResult, result_format, **columns)
 
+    @graph_locked()
     def uniform_neighbor_sample(self,
                                 start_list,
                                 fanout_vals,
                                 with_replacement,
                                 graph_id,
+                                result_format=None,
                                 ):
-        G = self._get_graph(graph_id)
-        if isinstance(G, (MGPropertyGraph, PropertyGraph)):
-            raise CugraphServiceError("uniform_neighbor_sample() cannot "
-                                      "operate directly on a graph with "
-                                      "properties, call extract_subgraph() "
-                                      "then call uniform_neighbor_sample() "
-                                      "on the extracted subgraph instead.")
-
-        try:
-            return call_algo(
-                uniform_neighbor_sample,
-                G,
-                start_list=start_list,
-                fanout_vals=fanout_vals,
-                with_replacement=with_replacement
-            )
-        except Exception:
-            raise CugraphServiceError(f"{traceback.format_exc()}")
+        columns = self.__run_algo("uniform_neighbor_sample", graph_id,
+                                  {"start_list": start_list,
+                                   "fanout_vals": fanout_vals,
+                                   "with_replacement": with_replacement})
+        return make_array_result(UniformNeighborSampleResult, result_format,
+                                 **columns)
+
+    @graph_locked()
+    @result_cached()
+    def run_algo(self, algo_name, params, graph_id):
+        """
+        Runs the algo named algo_name on the graph identified by graph_id,
+        which must not be a graph with properties, passing it params, a dict
+        of param names to Value "unions". Returns an AlgoResult containing
+        each result as an array encoded using encode_ndarray().
+        """
+        params = {name: ValueWrapper(value).get_py_obj()
+                  for (name, value) in (params or {}).items()}
+        columns = self.__run_algo(algo_name, graph_id, params)
+        return AlgoResult(
+            column_names=list(columns),
+            column_buffers=[encode_ndarray(array)
+                            for array in columns.values()])
+
+    def get_algo_names(self):
+        """
+        Returns the names of the algos that can be called using run_algo() on
+        the graphs of this server.
+        """
+        if self.__backend == "cpu":
+            graph_kind = "host"
+        elif self.is_mg:
+            graph_kind = "mg"
+        else:
+            graph_kind = "sg"
+        return [name for name in algos.get_algo_names()
+                if algos.get_algo(name).has_scalar_params() and
+                (algos.get_algo(name).get_func(graph_kind) is not None)]
 
-    def pagerank(self, graph_id):
+    ###########################################################################
+    # Batches
+    def call_batch(self, calls):
         """
+        Calls the method named by each BatchCall in calls in order, passing it
+        the arguments deserialized from the BatchCall, with the arguments named
+        in its result_refs replaced by the results of the earlier calls they
+        refer to. Returns a list of the serialized result of each call (see
+        serialize_call_result()).
+
+        If a call raises an error, the calls after it are not made and the
+        last result contains the error. The calls made before it are not
+        undone. Errors in the method names or result_refs of any call are
+        raised before any calls are made.
         """
-        raise NotImplementedError
+        for (i, call) in enumerate(calls):
+            if (call.method_name not in spec.CugraphService.thrift_services) \
+               or (call.method_name == "call_batch"):
+                raise CugraphServiceError(
+                    f"call {i}: {call.method_name!r} cannot be called in a "
+                    "batch")
+            arg_names = get_call_arg_names(call.method_name)
+            for (arg_name, ref) in (call.result_refs or {}).items():
+                if arg_name not in arg_names:
+                    raise CugraphServiceError(
+                        f"call {i}: {call.method_name} has no argument "
+                        f"{arg_name!r}")
+                if not (0 <= ref < i):
+                    raise CugraphServiceError(
+                        f"call {i}: argument {arg_name!r} must refer to an "
+                        f"earlier call, got {ref}")
+
+        values = []
+        results = []
+        for call in calls:
+            args = deserialize_call_args(call.method_name,
+                                         call.serialized_args)
+            for (arg_name, ref) in (call.result_refs or {}).items():
+                args[arg_name] = values[ref]
+            try:
+                value = getattr(self, call.method_name)(*args.values())
+            except CugraphServiceError as e:
+                results.append(serialize_call_result(call.method_name,
+                                                     error=e))
+                break
+            except Exception:
+                error = CugraphServiceError(
+                    f"error running {call.method_name} : "
+                    f"{traceback.format_exc()}")
+                results.append(serialize_call_result(call.method_name,
+                                                     error=error))
+                break
+            values.append(value)
+            results.append(serialize_call_result(call.method_name, value))
+
+        return results
 
     ###########################################################################
     # "Protected" interface - used for both implementation and test/debug. Will
@@ -677,22 +1478,110 @@ class CugraphHandler:
 
         If the graph_id is the default graph ID and the default graph has not
         been created, then instantiate a new PropertyGraph as the default graph
-        and return it.
+        and return it. If the graph has been offloaded, it is reloaded.
         """
-        pG = self.__graph_objs.get(graph_id)
+        with self.__graph_objs_lock:
+            pG = self.__graph_objs.get(graph_id)
+
+            # Always create the default graph if it does not exist
+            if pG is None:
+                if graph_id == defaults.graph_id:
+                    pG = self.__create_graph()
+                    self.__graph_objs[graph_id] = pG
+                    self.__graph_num_bytes[graph_id] = 0
+                else:
+                    raise CugraphServiceError(f"invalid graph_id {graph_id}")
+            self.__graph_access_times[graph_id] = time.monotonic()
+
+        if isinstance(pG, _OffloadedGraph):
+            pG = self.__reload_graph(graph_id, pG)
+        return pG
 
-        # Always create the default graph if it does not exist
-        if pG is None:
-            if graph_id == defaults.graph_id:
-                pG = self.__create_graph()
-                self.__graph_objs[graph_id] = pG
-            else:
-                raise CugraphServiceError(f"invalid graph_id {graph_id}")
+    def _refresh_graph(self, graph_id):
+        """
+        If graph_id identifies an auto-refreshed subgraph whose parent graph
+        was modified since the subgraph was extracted or last refreshed, add
+        the edges added to the parent graph since then to the subgraph. The
+        calling thread must not hold the lock for either graph.
+        """
+        with self.__graph_objs_lock:
+            source = self.__subgraph_sources.get(graph_id)
+        if (source is None) or not source.stale:
+            return
+
+        with self._get_graph_lock(graph_id).write_locked():
+            with self.__graph_objs_lock:
+                if self.__subgraph_sources.get(graph_id) is not source:
+                    return
+                # The parent lock exists, since deleting the parent graph
+                # removes the source.
+                parent_lock = self.__graph_locks.get(source.parent_graph_id)
+            if parent_lock is None:
+                return
+            with parent_lock.read_locked():
+                # Another thread may have refreshed the subgraph while this
+                # thread was waiting for the locks.
+                if source.stale:
+                    self.__refresh_subgraph(graph_id, source)
+
+    def _get_result_cache(self):
+        """
+        Return the ResultCache used for results of methods decorated with
+        result_cached, or None if result caching is disabled.
+        """
+        return self.__result_cache
 
-        return pG
+    def _add_graph_reference(self, graph_id):
+        """
+        Add a reference to the graph associated with graph_id, which was
+        returned by a result_cached method, so that it is only deleted when
+        delete_graph() has been called for each reference. Return False if
+        there is no graph associated with graph_id.
+        """
+        with self.__graph_objs_lock:
+            if graph_id not in self.__graph_objs:
+                return False
+            self.__graph_ref_counts[graph_id] = \
+                self.__graph_ref_counts.get(graph_id, 1) + 1
+            return True
+
+    def _get_graph_lock(self, graph_id):
+        """
+        Return the ReadWriteLock for the graph associated with graph_id,
+        creating it if necessary.
+        """
+        with self.__graph_objs_lock:
+            lock = self.__graph_locks.get(graph_id)
+            if lock is None:
+                if (graph_id not in self.__graph_objs) and \
+                   (graph_id != defaults.graph_id):
+                    raise CugraphServiceError(f"invalid graph_id {graph_id}")
+                lock = ReadWriteLock()
+                self.__graph_locks[graph_id] = lock
+
+        return lock
 
     ###########################################################################
     # Private
+    def __run_algo(self, algo_name, graph_id, params):
+        """
+        Run the registered algo named algo_name on the graph identified by
+        graph_id, passing it the dict params, and return the OrderedDict of
+        numpy arrays returned by algos.Algo.run().
+        """
+        G = self._get_graph(graph_id)
+        # FIXME: write test to catch an MGPropertyGraph being passed in
+        if isinstance(G, (MGPropertyGraph, PropertyGraph)):
+            raise CugraphServiceError(f"{algo_name}() cannot operate "
+                                      "directly on a graph with properties, "
+                                      "call extract_subgraph() then call "
+                                      f"{algo_name}() on the extracted "
+                                      "subgraph instead.")
+        try:
+            return algos.get_algo(algo_name).run(G, **params)
+        except Exception:
+            raise CugraphServiceError(f"{traceback.format_exc()}")
+
     def __get_dataframe_from_csv(self,
                                  csv_file_name,
                                  delimiter,
@@ -700,35 +1589,337 @@ class CugraphHandler:
                                  header,
                                  names):
         """
-        Read a CSV into a DataFrame and return it. This will use either a cuDF
-        DataFrame or a dask_cudf DataFrame based on if the handler is
-        configured to use a dask cluster or not.
+        Read a CSV, or all CSVs matching the glob pattern csv_file_name, into
+        a DataFrame and return it. This will use either a cuDF DataFrame or a
+        dask_cudf DataFrame based on if the handler is configured to use a
+        dask cluster or not, or a pandas DataFrame if the handler uses the cpu
+        backend. With a dask cluster, the CSVs are read in partitions by the
+        dask workers.
         """
-        gdf = cudf.read_csv(csv_file_name,
-                            delimiter=delimiter,
-                            dtype=dtypes,
-                            header=header,
-                            names=names)
+        file_names = self.__get_file_names(csv_file_name)
+
+        if self.__backend == "cpu":
+            df = pd.concat([pd.read_csv(file_name,
+                                        delimiter=delimiter,
+                                        header=header,
+                                        names=names or None)
+                            for file_name in file_names],
+                           ignore_index=True)
+            # Match the string column names cudf uses for CSVs without a
+            # header, and apply dtypes by position since pandas does not
+            # accept a list of dtypes.
+            df.columns = [str(c) for c in df.columns]
+            if dtypes:
+                df = df.astype(dict(zip(df.columns, dtypes)))
+            return df
+
         if self.is_mg:
-            num_gpus = len(self.__dask_client.scheduler_info()["workers"])
-            return dask_cudf.from_cudf(gdf, npartitions=num_gpus)
+            ddf = dask_cudf.read_csv(file_names,
+                                     delimiter=delimiter,
+                                     dtype=dtypes,
+                                     header=header,
+                                     names=names)
+            return self.__partition_for_workers(ddf)
+
+        return cudf.concat([cudf.read_csv(file_name,
+                                          delimiter=delimiter,
+                                          dtype=dtypes,
+                                          header=header,
+                                          names=names)
+                            for file_name in file_names],
+                           ignore_index=True)
+
+    def __get_dataframe_from_parquet(self, parquet_path, columns):
+        """
+        Read the Parquet file, directory of Parquet files, or files matching
+        the glob pattern parquet_path into a DataFrame of the type used by the
+        handler and return it. Only columns are read, or all columns if
+        columns is None. With a dask cluster, the files are read in partitions
+        by the dask workers, otherwise they are read using multiple threads.
+        """
+        file_names = self.__get_file_names(parquet_path)
 
-        return gdf
+        if self.__backend == "cpu":
+            return pd.concat([pd.read_parquet(file_name, columns=columns)
+                              for file_name in file_names],
+                             ignore_index=True)
 
-    def __add_graph(self, G):
+        if self.is_mg:
+            ddf = dask_cudf.read_parquet(file_names, columns=columns)
+            return self.__partition_for_workers(ddf)
+
+        return cudf.read_parquet(file_names, columns=columns)
+
+    def __partition_for_workers(self, ddf):
+        """
+        Return the dask DataFrame ddf with at least one partition per dask
+        worker, so that each worker has a share of the data.
+        """
+        num_gpus = len(self.__dask_client.scheduler_info()["workers"])
+        if ddf.npartitions < num_gpus:
+            ddf = ddf.repartition(npartitions=num_gpus)
+        return ddf
+
+    @staticmethod
+    def __get_file_names(path):
+        """
+        Return a sorted list of the files or directories matching the glob
+        pattern path, or [path] if path does not contain a glob pattern.
+        """
+        if not any(c in path for c in "*?["):
+            if not os.path.exists(path):
+                raise CugraphServiceError(f"{path} does not exist")
+            return [path]
+        file_names = sorted(glob.glob(path))
+        if not file_names:
+            raise CugraphServiceError(f"no files match {path}")
+        return file_names
+
+    def __add_graph(self, G, subgraph_source=None):
         """
         Create a new graph ID for G and add G to the internal mapping of
-        graph ID:graph instance.
+        graph ID:graph instance. If G is an auto-refreshed subgraph,
+        subgraph_source is its _SubgraphSource.
         """
-        gid = self.__next_graph_id
-        self.__graph_objs[gid] = G
-        self.__next_graph_id += 1
+        self.__prepare_for_readers(G)
+        num_bytes = self.__get_graph_num_bytes(G)
+        with self.__graph_objs_lock:
+            gid = self.__next_graph_id
+            self.__graph_objs[gid] = G
+            if subgraph_source is not None:
+                self.__subgraph_sources[gid] = subgraph_source
+            self.__graph_num_bytes[gid] = num_bytes
+            self.__graph_access_times[gid] = time.monotonic()
+            self.__next_graph_id += 1
+        self.__enforce_graph_memory_budget()
         return gid
 
+    def __graph_modified(self, graph_id):
+        """
+        Remove any state derived from the graph identified by graph_id, which
+        is being modified or deleted, and mark its auto-refreshed subgraphs as
+        stale. The graph must be write-locked.
+        """
+        if self.__result_cache is not None:
+            self.__result_cache.invalidate(graph_id)
+        with self.__graph_objs_lock:
+            for source in self.__subgraph_sources.values():
+                if source.parent_graph_id == graph_id:
+                    source.stale = True
+
+    def __refresh_subgraph(self, graph_id, source):
+        """
+        Recreate the auto-refreshed subgraph identified by graph_id from the
+        edges in source and the edges added to its parent graph since they
+        were read. Both graphs must be locked, the subgraph as a writer. If
+        the subgraph cannot be refreshed, it is no longer auto-refreshed.
+        """
+        source.stale = False
+        pG = self._get_graph(source.parent_graph_id)
+        num_edges = pG.get_num_edges()
+        if num_edges == source.num_edges_read:
+            return
+
+        try:
+            # Edge IDs are assigned in order, starting at 0, so only the new
+            # edges are filtered by the selection. The edges of the subgraph
+            # are read again, since they are not kept.
+            edge_ids = source.edge_ids
+            if source.selection is not None:
+                new_edge_ids = self.__get_selected_edge_IDs(
+                    pG, source.selection,
+                    np.arange(source.num_edges_read, num_edges))
+                edge_ids = np.concatenate([edge_ids, new_edge_ids])
+            edges = pG.get_edge_data(edge_ids=edge_ids,
+                                     columns=source.property_columns)
+            edges = edges.drop(columns=pG.type_col_name)
+            G = pG.edge_props_to_graph(edges, **source.graph_args)
+        except Exception:
+            with self.__graph_objs_lock:
+                self.__subgraph_sources.pop(graph_id, None)
+            raise CugraphServiceError(
+                f"could not refresh graph {graph_id}, it will no longer be "
+                f"refreshed: {traceback.format_exc()}")
+
+        source.num_edges_read = num_edges
+        source.edge_ids = edge_ids
+        self.__prepare_for_readers(G)
+        with self.__graph_objs_lock:
+            old_G = self.__graph_objs.get(graph_id)
+            if old_G is not None:
+                self.__graph_objs[graph_id] = G
+        if isinstance(old_G, _OffloadedGraph):
+            old_G.remove_files()
+        self.__graph_modified(graph_id)
+        self.__update_graph_memory(graph_id, G)
+
+    def __update_graph_memory(self, graph_id, G):
+        """
+        Update the estimated size of the graph G identified by graph_id after
+        it was modified, offloading other graphs if necessary.
+        """
+        num_bytes = self.__get_graph_num_bytes(G)
+        with self.__graph_objs_lock:
+            if graph_id in self.__graph_objs:
+                self.__graph_num_bytes[graph_id] = num_bytes
+        self.__enforce_graph_memory_budget()
+
+    def __get_subgraph_sources_num_bytes(self):
+        """
+        Return the total size in bytes of the data kept in memory for
+        auto-refreshed subgraphs. __graph_objs_lock must be held.
+        """
+        return sum(source.num_bytes
+                   for source in self.__subgraph_sources.values())
+
+    def __get_graph_memory_info(self, graph_id):
+        """
+        Return a dictionary of the estimated size in bytes of the graph
+        identified by graph_id when in memory ("memory_bytes"), the number of
+        seconds since it was last used ("idle_seconds"), and whether it is
+        offloaded ("is_offloaded").
+        """
+        with self.__graph_objs_lock:
+            G = self.__graph_objs.get(graph_id)
+            if G is None:
+                if graph_id != defaults.graph_id:
+                    raise CugraphServiceError(f"invalid graph_id {graph_id}")
+                # The default graph has not been created yet
+                return {"memory_bytes": 0,
+                        "idle_seconds": 0,
+                        "is_offloaded": False}
+            access_time = self.__graph_access_times[graph_id]
+            return {"memory_bytes": self.__graph_num_bytes[graph_id],
+                    "idle_seconds": int(time.monotonic() - access_time),
+                    "is_offloaded": isinstance(G, _OffloadedGraph)}
+
+    def __enforce_graph_memory_budget(self):
+        """
+        Offload the least recently used graphs until the estimated total size
+        of the graphs in memory is within the memory budget, if set. Graphs
+        that are in use (locked) or cannot be offloaded are skipped.
+        """
+        if self.__graph_memory_budget <= 0:
+            return
+
+        with self.__graph_objs_lock:
+            resident = [gid for (gid, G) in self.__graph_objs.items()
+                        if not isinstance(G, _OffloadedGraph)]
+            # The edge IDs kept for auto-refreshed subgraphs are not
+            # offloaded, so they always count towards the budget.
+            total_num_bytes = sum(self.__graph_num_bytes[gid]
+                                  for gid in resident) + \
+                self.__get_subgraph_sources_num_bytes()
+            if total_num_bytes <= self.__graph_memory_budget:
+                return
+            candidates = sorted(
+                (gid for gid in resident
+                 if _OffloadedGraph.can_offload(self.__graph_objs[gid])),
+                key=lambda gid: self.__graph_access_times[gid])
+
+        for gid in candidates:
+            if total_num_bytes <= self.__graph_memory_budget:
+                break
+            try:
+                lock = self._get_graph_lock(gid)
+            except CugraphServiceError:
+                # The graph was deleted
+                continue
+            with lock.try_write_locked() as locked:
+                if not locked:
+                    continue
+                with self.__graph_objs_lock:
+                    G = self.__graph_objs.get(gid)
+                if (G is None) or isinstance(G, _OffloadedGraph):
+                    continue
+                offloaded_G = _OffloadedGraph.offload(
+                    G, self.__graph_offload_dir)
+                with self.__graph_objs_lock:
+                    self.__graph_objs[gid] = offloaded_G
+                    num_bytes = self.__graph_num_bytes[gid]
+                total_num_bytes -= num_bytes
+                print(f"offloaded graph with id {gid} to {offloaded_G.path}")
+
+    def __reload_graph(self, graph_id, offloaded_G):
+        """
+        Return the graph identified by graph_id, offloaded to offloaded_G,
+        reloading it if another thread has not already done so. The graph
+        must be locked.
+        """
+        with offloaded_G.lock:
+            if offloaded_G.graph is None:
+                G = offloaded_G.load()
+                self.__prepare_for_readers(G)
+                offloaded_G.graph = G
+                with self.__graph_objs_lock:
+                    if self.__graph_objs.get(graph_id) is offloaded_G:
+                        self.__graph_objs[graph_id] = G
+                offloaded_G.remove_files()
+        self.__enforce_graph_memory_budget()
+        return offloaded_G.graph
+
+    @staticmethod
+    def __get_graph_num_bytes(G):
+        """
+        Return the estimated size in bytes of the DataFrames containing the
+        data of the graph G.
+        """
+        def get_df_num_bytes(df):
+            if df is None:
+                return 0
+            num_bytes = df.memory_usage(deep=True).sum()
+            # dask DataFrames
+            if hasattr(num_bytes, "compute"):
+                num_bytes = num_bytes.compute()
+            return int(num_bytes)
+
+        if isinstance(G, (PropertyGraph, MGPropertyGraph)):
+            return (get_df_num_bytes(G._vertex_prop_dataframe) +
+                    get_df_num_bytes(G._edge_prop_dataframe))
+        if isinstance(G, HostGraph):
+            edgelist_df = G.edgelist_df
+        else:
+            edgelist = getattr(G, "edgelist", None)
+            edgelist_df = getattr(edgelist, "edgelist_df", None)
+        return (get_df_num_bytes(edgelist_df) +
+                get_df_num_bytes(getattr(G, "edge_data", None)))
+
+    @staticmethod
+    def __get_selected_edge_IDs(pG, selection, edge_ids=None):
+        """
+        Return a numpy array of the IDs of the edges of the PropertyGraph pG
+        (only those in edge_ids, if specified) that are selected by the edge
+        selection expression selection.
+        """
+        names = tuple([pG.src_col_name, pG.dst_col_name,
+                       pG.edge_id_col_name, pG.type_col_name] +
+                      pG.edge_property_names)
+        expression = compile_selection_expression(selection, names,
+                                                  pG.type_col_name)
+        columns = [n for n in expression.names
+                   if n in pG.edge_property_names]
+        edges = pG.get_edge_data(edge_ids=edge_ids, columns=columns)
+        selected = expression.evaluate(
+            dict([(n, edges[n]) for n in edges.columns]))
+        return algos.to_numpy(
+            edges[pG.edge_id_col_name][selected.fillna(False)])
+
+    @staticmethod
+    def __prepare_for_readers(G):
+        """
+        Perform any deferred updates to G that would otherwise be done by the
+        first call reading it, since calls reading G can run concurrently.
+        """
+        # PropertyGraph combines the edge data added since it was last read on
+        # the first read.
+        if isinstance(G, PropertyGraph):
+            G._edge_prop_dataframe
+
     def __create_graph(self):
         """
         Instantiate a graph object using a type appropriate for the handler (
-        either SG or MG)
+        either SG or MG). SG PropertyGraphs use pandas DataFrames when given
+        pandas DataFrames, which is the case for the cpu backend.
         """
         return MGPropertyGraph() if self.is_mg else PropertyGraph()
 
@@ -759,7 +1950,8 @@ class CugraphHandler:
     def __get_edge_IDs_from_graph_edge_data(self,
                                             G,
                                             src_vert_IDs,
-                                            dst_vert_IDs):
+                                            dst_vert_IDs,
+                                            graph_id):
         """
         Return a list of edge IDs corresponding to the vertex IDs in each of
         src_vert_IDs and dst_vert_IDs that, when combined, define an edge in G.
@@ -767,32 +1959,125 @@ class CugraphHandler:
         For example, if src_vert_IDs is [0, 1, 2] and dst_vert_IDs is [7, 8, 9]
         return the edge IDs for edges (0, 7), (1, 8), and (2, 9).
 
-        G must have an "edge_data" attribute.
+        G must have an "edge_data" attribute, which contains the src, dst,
+        and edge ID of each edge. All pairs are looked up using a single join
+        with G.edge_data, instead of scanning G.edge_data per pair. If G has
+        multiple edges for a pair, the smallest edge ID is returned.
         """
-        edge_IDs = []
-        num_edges = len(src_vert_IDs)
-
-        for i in range(num_edges):
-            src_mask = G.edge_data[PropertyGraph.src_col_name] == \
-                src_vert_IDs[i]
-            dst_mask = G.edge_data[PropertyGraph.dst_col_name] == \
-                dst_vert_IDs[i]
-            value = (G.edge_data[src_mask & dst_mask]
-                     [PropertyGraph.edge_id_col_name]
-                     )
+        src_col_name = PropertyGraph.src_col_name
+        dst_col_name = PropertyGraph.dst_col_name
+        edge_id_col_name = PropertyGraph.edge_id_col_name
+        pos_col_name = "_POS_"
+
+        edge_table = G.edge_data
+        num_pairs = len(src_vert_IDs)
+        df_lib = pd if isinstance(G, HostGraph) else cudf
+        pairs = df_lib.DataFrame(
+            {src_col_name: df_lib.Series(src_vert_IDs).astype(
+                edge_table[src_col_name].dtype),
+             dst_col_name: df_lib.Series(dst_vert_IDs).astype(
+                 edge_table[dst_col_name].dtype),
+             pos_col_name: df_lib.Series(np.arange(num_pairs))})
+        if self.is_mg:
+            pairs = dask_cudf.from_cudf(pairs, npartitions=1)
 
-            # FIXME: This will compute the result (if using dask) then transfer
-            # to host memory for each iteration - is there a more efficient
-            # way?
-            if self.is_mg:
-                value = value.compute()
-            edge_IDs.append(value.values_host[0])
+        found = edge_table.merge(pairs,
+                                 on=[src_col_name, dst_col_name],
+                                 how="inner")
+        if self.is_mg:
+            found = found.compute()
+        found = found.sort_values([pos_col_name, edge_id_col_name])\
+                     .drop_duplicates(subset=pos_col_name, keep="first")
+
+        if len(found) != num_pairs:
+            found_mask = np.zeros(num_pairs, dtype=bool)
+            found_mask[found[pos_col_name].to_numpy()] = True
+            missing = [(src_vert_IDs[i], dst_vert_IDs[i])
+                       for i in np.flatnonzero(~found_mask)]
+            max_listed = 10
+            missing_str = ", ".join([str(m) for m in missing[:max_listed]])
+            if len(missing) > max_listed:
+                missing_str += f", ... ({len(missing) - max_listed} more)"
+            raise CugraphServiceError(f"{len(missing)} of {num_pairs} "
+                                      "(src, dst) pairs are not edges in "
+                                      f"graph {graph_id}: {missing_str}")
+
+        return found[edge_id_col_name].to_numpy().tolist()
+
+    @staticmethod
+    def __get_graph_data_ids_and_columns(id_or_ids, property_keys):
+        """
+        Return a tuple of the IDs and columns to pass to PropertyGraph
+        get_vertex_data() or get_edge_data() for the id_or_ids and
+        property_keys values passed to get_graph_*_data().
+        """
+        ids = GraphVertexEdgeIDWrapper(id_or_ids).get_py_obj()
+        if ids == -1:
+            ids = None
+        elif not isinstance(ids, list):
+            ids = [ids]
+        if property_keys == []:
+            columns = None
+        else:
+            columns = property_keys
+        return (ids, columns)
+
+    def __open_graph_data_cursor(self,
+                                 dataframe,
+                                 null_replacement_value,
+                                 graph_id,
+                                 result_format,
+                                 batch_size):
+        """
+        Create a cursor for reading dataframe, the vertex or edge data of the
+        graph identified by graph_id, in batches of batch_size rows, and
+        return its ID. Cursors that have not been read from in
+        self.cursor_timeout seconds are closed.
+        """
+        if batch_size < 1:
+            raise CugraphServiceError("batch_size must be at least 1, got "
+                                      f"{batch_size}")
+        batches = (
+            self.__get_graph_data_as_numpy_bytes(df,
+                                                 null_replacement_value,
+                                                 result_format)
+            for df in self.__iter_dataframe_batches(dataframe, batch_size))
+        cursor = _GraphDataCursor(batches, graph_id)
+
+        with self.__cursors_lock:
+            expire_time = time.monotonic() - self.cursor_timeout
+            for (expired_id, expired) in list(self.__cursors.items()):
+                if expired.last_used_time < expire_time:
+                    del self.__cursors[expired_id]
+            cursor_id = self.__next_cursor_id
+            self.__next_cursor_id += 1
+            self.__cursors[cursor_id] = cursor
+
+        return cursor_id
+
+    @staticmethod
+    def __iter_dataframe_batches(dataframe, batch_size):
+        """
+        Yield slices of at most batch_size rows of dataframe, computing only
+        one partition at a time if dataframe is a dask_cudf DataFrame. Nothing
+        is yielded if dataframe is None.
+        """
+        if dataframe is None:
+            return
+        if isinstance(dataframe, dask_cudf.DataFrame):
+            partitions = (dataframe.get_partition(i).compute()
+                          for i in range(dataframe.npartitions))
+        else:
+            partitions = [dataframe]
 
-        return edge_IDs
+        for df in partitions:
+            for start in range(0, len(df), batch_size):
+                yield df.iloc[start:start + batch_size]
 
     def __get_graph_data_as_numpy_bytes(self,
                                         dataframe,
-                                        null_replacement_value):
+                                        null_replacement_value,
+                                        result_format=None):
         """
         Returns a byte array repr of the vertex or edge graph data. Since the
         byte array cannot represent NA values, null_replacement_value must be
@@ -800,7 +2085,10 @@ class CugraphHandler:
         """
         try:
             if dataframe is None:
-                return np.ndarray(shape=(0, 0)).dumps()
+                df_numpy = np.ndarray(shape=(0, 0))
+                if result_format == ResultFormat.BINARY:
+                    return encode_ndarray(df_numpy)
+                return df_numpy.dumps()
             elif isinstance(dataframe, dask_cudf.DataFrame):
                 df = dataframe.compute()
             else:
@@ -814,6 +2102,11 @@ class CugraphHandler:
             # prevent a copy? (note: any other type required to be de-serialzed
             # on the client end could add dependencies on the client)
             df_numpy = df.to_numpy(na_value=n)
+            # Object arrays (eg. from string properties) cannot be represented
+            # as raw buffers, so those are always pickled.
+            if (result_format == ResultFormat.BINARY) and \
+               not df_numpy.dtype.hasobject:
+                return encode_ndarray(df_numpy)
             return df_numpy.dumps()
 
         except Exception:
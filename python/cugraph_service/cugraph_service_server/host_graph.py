@@ -0,0 +1,443 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Graph class and algorithms using only host memory (pandas and NumPy), used by
+a CugraphHandler using the "cpu" backend in place of cugraph Graphs and
+algorithms.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class HostGraph:
+    """
+    A graph stored in host memory as a pandas edge list, implementing the
+    subset of the cugraph Graph API used by PropertyGraph.extract_subgraph()
+    and the cugraph_service server. Vertex IDs are never renumbered.
+    """
+    def __init__(self, directed=False):
+        self.__directed = directed
+        self.edgelist_df = None
+        # Set by PropertyGraph.extract_subgraph() if add_edge_data is True
+        self.edge_data = None
+        # (vertices, starts, ends, neighbors, weights) arrays, where the
+        # neighbors and weights of vertices[i] are in
+        # neighbors[starts[i]:ends[i]] and weights[starts[i]:ends[i]]
+        self.__adjacency = None
+
+    def from_pandas_edgelist(self,
+                             df,
+                             source="source",
+                             destination="destination",
+                             edge_attr=None,
+                             renumber=True):
+        """
+        Initialize the graph from the pandas DataFrame df containing the
+        source, destination, and (optionally) edge_attr weight columns.
+        renumber is accepted for compatibility with cugraph Graphs and is
+        ignored.
+        """
+        edgelist = {"src": df[source].to_numpy(),
+                    "dst": df[destination].to_numpy()}
+        if edge_attr is not None:
+            edgelist["weights"] = df[edge_attr].to_numpy()
+        self.edgelist_df = pd.DataFrame(edgelist)
+        self.__adjacency = None
+
+    def is_directed(self):
+        return self.__directed
+
+    def is_weighted(self):
+        return (self.edgelist_df is not None) and \
+            ("weights" in self.edgelist_df.columns)
+
+    def number_of_vertices(self):
+        return len(self._get_adjacency()[0])
+
+    def number_of_edges(self):
+        if self.edgelist_df is None:
+            return 0
+        return len(self.edgelist_df)
+
+    def _get_adjacency(self):
+        """
+        Return the (vertices, starts, ends, neighbors, weights) arrays
+        describing the neighbors of each vertex, creating them if necessary.
+        Edges of undirected graphs are traversable in both directions.
+        """
+        if self.__adjacency is None:
+            if self.edgelist_df is None:
+                empty = np.array([], dtype="int64")
+                self.__adjacency = (empty, empty, empty, empty,
+                                    np.array([], dtype="float64"))
+                return self.__adjacency
+
+            src = self.edgelist_df["src"].to_numpy()
+            dst = self.edgelist_df["dst"].to_numpy()
+            if self.is_weighted():
+                weights = self.edgelist_df["weights"].to_numpy()
+            else:
+                weights = np.ones(len(src), dtype="float64")
+            if not self.__directed:
+                (src, dst) = (np.concatenate([src, dst]),
+                              np.concatenate([dst, src]))
+                weights = np.concatenate([weights, weights])
+
+            order = np.argsort(src, kind="stable")
+            (src, dst, weights) = (src[order], dst[order], weights[order])
+            vertices = np.unique(np.concatenate([src, dst]))
+            starts = np.searchsorted(src, vertices, side="left")
+            ends = np.searchsorted(src, vertices, side="right")
+            self.__adjacency = (vertices, starts, ends, dst, weights)
+
+        return self.__adjacency
+
+    def _expand_neighbors(self, vertex_ids):
+        """
+        Return a tuple of arrays (group, edge_positions) for the neighbors of
+        each vertex in vertex_ids, where group[i] is the index into vertex_ids
+        of the vertex that is the source of the edge at position
+        edge_positions[i] in the neighbors and weights adjacency arrays.
+        Vertices not in the graph have no neighbors.
+        """
+        (vertices, starts, ends, _, _) = self._get_adjacency()
+        vertex_ids = np.asarray(vertex_ids)
+        if len(vertices) == 0:
+            empty = np.array([], dtype="int64")
+            return (empty, empty)
+        positions = np.searchsorted(vertices, vertex_ids)
+        positions[positions >= len(vertices)] = 0
+        found = vertices[positions] == vertex_ids
+
+        degrees = np.where(found, ends[positions] - starts[positions], 0)
+        group = np.repeat(np.arange(len(vertex_ids)), degrees)
+        group_starts = np.cumsum(degrees) - degrees
+        offsets_in_group = np.arange(len(group)) - group_starts[group]
+        edge_positions = starts[positions][group] + offsets_in_group
+        return (group, edge_positions)
+
+
+def uniform_neighbor_sample(G,
+                            start_list,
+                            fanout_vals,
+                            with_replacement=True,
+                            random_state=None):
+    """
+    Host version of cugraph.uniform_neighbor_sample() for HostGraph G. Returns
+    a pandas DataFrame with "sources", "destinations", and "indices" (edge
+    weight) columns, containing the edges sampled for each hop. The vertices
+    sampled in one hop are the start vertices of the next hop, and a fanout
+    value of -1 samples all neighbors.
+    """
+    rng = np.random.default_rng(random_state)
+    (_, _, _, neighbors, weights) = G._get_adjacency()
+    frontier = np.asarray(start_list)
+    results = []
+
+    for fanout in fanout_vals:
+        (group, edge_positions) = G._expand_neighbors(frontier)
+        if fanout < 0:
+            selected = edge_positions
+            selected_group = group
+        elif with_replacement:
+            degrees = np.bincount(group, minlength=len(frontier))
+            has_neighbors = np.flatnonzero(degrees)
+            selected_group = np.repeat(has_neighbors, fanout)
+            group_starts = np.cumsum(degrees) - degrees
+            choices = (rng.random(len(selected_group)) *
+                       degrees[selected_group]).astype("int64")
+            selected = edge_positions[group_starts[selected_group] + choices]
+        else:
+            # Randomly order the neighbors of each vertex, then select the
+            # first fanout of them.
+            order = np.lexsort((rng.random(len(group)), group))
+            (group, edge_positions) = (group[order], edge_positions[order])
+            degrees = np.bincount(group, minlength=len(frontier))
+            group_starts = np.cumsum(degrees) - degrees
+            rank = np.arange(len(group)) - group_starts[group]
+            mask = rank < fanout
+            selected = edge_positions[mask]
+            selected_group = group[mask]
+
+        results.append(pd.DataFrame(
+            {"sources": frontier[selected_group],
+             "destinations": neighbors[selected],
+             "indices": weights[selected].astype("float64")}))
+        frontier = np.unique(neighbors[selected])
+
+    if not results:
+        return pd.DataFrame({"sources": [], "destinations": [],
+                             "indices": []})
+    return pd.concat(results, ignore_index=True)
+
+
+def batched_ego_graphs(G, seeds, radius=1):
+    """
+    Host version of cugraph.batched_ego_graphs() for HostGraph G. Returns a
+    tuple of a pandas DataFrame with "src", "dst", and "weight" columns
+    containing the edges of the ego graph of each seed, one after the other,
+    and a pandas Series of the offsets of the edges of each ego graph in the
+    DataFrame.
+    """
+    (_, _, _, neighbors, _) = G._get_adjacency()
+    src = G.edgelist_df["src"].to_numpy()
+    dst = G.edgelist_df["dst"].to_numpy()
+    if G.is_weighted():
+        weights = G.edgelist_df["weights"].to_numpy()
+    else:
+        weights = np.ones(len(src), dtype="float64")
+
+    ego_edge_lists = []
+    seeds_offsets = [0]
+    for seed in np.asarray(seeds):
+        reached = np.array([seed])
+        frontier = reached
+        for _ in range(radius):
+            (_, edge_positions) = G._expand_neighbors(frontier)
+            frontier = np.setdiff1d(neighbors[edge_positions], reached)
+            if len(frontier) == 0:
+                break
+            reached = np.union1d(reached, frontier)
+
+        mask = np.isin(src, reached) & np.isin(dst, reached)
+        ego_edge_lists.append(pd.DataFrame({"src": src[mask],
+                                            "dst": dst[mask],
+                                            "weight": weights[mask]}))
+        seeds_offsets.append(seeds_offsets[-1] + int(mask.sum()))
+
+    ego_edge_list = pd.concat(ego_edge_lists, ignore_index=True) \
+        if ego_edge_lists else pd.DataFrame({"src": [], "dst": [],
+                                             "weight": []})
+    return (ego_edge_list, pd.Series(seeds_offsets, dtype="int64"))
+
+
+def node2vec(G, start_vertices, max_depth, random_state=None):
+    """
+    Host version of cugraph.node2vec() for HostGraph G, using the default p
+    and q values of 1.0 (uniform random walks). Returns a tuple of pandas
+    Series of the vertices of each path, one after the other, the weights of
+    the edges of each path, and the number of vertices in each path. Paths
+    end early at vertices without neighbors.
+    """
+    rng = np.random.default_rng(random_state)
+    (_, _, _, neighbors, weights) = G._get_adjacency()
+    start_vertices = np.asarray(start_vertices)
+    num_paths = len(start_vertices)
+
+    paths = np.zeros((num_paths, max_depth), dtype=start_vertices.dtype)
+    path_weights = np.zeros((num_paths, max(max_depth - 1, 0)),
+                            dtype="float64")
+    path_sizes = np.ones(num_paths, dtype="int64")
+    paths[:, 0] = start_vertices
+    active = np.arange(num_paths)
+
+    for step in range(1, max_depth):
+        (group, edge_positions) = G._expand_neighbors(paths[active,
+                                                            step - 1])
+        degrees = np.bincount(group, minlength=len(active))
+        has_neighbors = degrees > 0
+        group_starts = np.cumsum(degrees) - degrees
+        choices = (rng.random(len(active)) * degrees).astype("int64")
+        selected = edge_positions[(group_starts + choices)[has_neighbors]]
+
+        active = active[has_neighbors]
+        if len(active) == 0:
+            break
+        paths[active, step] = neighbors[selected]
+        path_weights[active, step - 1] = weights[selected]
+        path_sizes[active] += 1
+
+    # Boolean indexing of a 2D array returns elements in row order, so each
+    # path remains contiguous.
+    vertex_mask = np.arange(max_depth) < path_sizes[:, None]
+    weight_mask = np.arange(max(max_depth - 1, 0)) < (path_sizes - 1)[:, None]
+    return (pd.Series(paths[vertex_mask]),
+            pd.Series(path_weights[weight_mask]),
+            pd.Series(path_sizes))
+
+
+def _get_edge_indices(G):
+    """
+    Return a tuple of arrays (vertices, src, dst, weights) for the traversable
+    edges of HostGraph G, where src and dst are indices into vertices.
+    """
+    (vertices, starts, ends, neighbors, weights) = G._get_adjacency()
+    src = np.repeat(np.arange(len(vertices)), ends - starts)
+    dst = np.searchsorted(vertices, neighbors)
+    return (vertices, src, dst, weights)
+
+
+def _get_vertex_index(vertices, vertex):
+    """
+    Return the index of vertex in the sorted array vertices, raising
+    ValueError if it is not in the graph.
+    """
+    index = np.searchsorted(vertices, vertex)
+    if (index >= len(vertices)) or (vertices[index] != vertex):
+        raise ValueError(f"vertex {vertex} is not in the graph")
+    return index
+
+
+def pagerank(G, alpha=0.85, max_iter=100, tol=1.0e-5):
+    """
+    Host version of cugraph.pagerank() for HostGraph G, using the edge
+    weights if G is weighted. The rank of vertices without outgoing edges is
+    distributed evenly to all vertices. Returns a pandas DataFrame with
+    "vertex" and "pagerank" columns.
+    """
+    (vertices, src, dst, weights) = _get_edge_indices(G)
+    num_vertices = len(vertices)
+    if num_vertices == 0:
+        return pd.DataFrame({"vertex": vertices, "pagerank": weights})
+    ranks = np.full(num_vertices, 1.0 / num_vertices)
+    out_weights = np.bincount(src, weights, minlength=num_vertices)
+    dangling = out_weights == 0
+    edge_factors = weights / out_weights[src]
+
+    for _ in range(max_iter):
+        new_ranks = np.bincount(dst, ranks[src] * edge_factors,
+                                minlength=num_vertices)
+        new_ranks += ranks[dangling].sum() / num_vertices
+        new_ranks = alpha * new_ranks + (1 - alpha) / num_vertices
+        converged = np.abs(new_ranks - ranks).sum() < tol
+        ranks = new_ranks
+        if converged:
+            break
+
+    return pd.DataFrame({"vertex": vertices, "pagerank": ranks})
+
+
+def bfs(G, start, depth_limit=None):
+    """
+    Host version of cugraph.bfs() for HostGraph G. Returns a pandas DataFrame
+    with "vertex", "distance", and "predecessor" columns. Unreached vertices
+    have the maximum int32 value as their distance and -1 as their
+    predecessor.
+    """
+    (vertices, _, _, neighbors, _) = G._get_adjacency()
+    unreached = np.iinfo("int32").max
+    distances = np.full(len(vertices), unreached, dtype="int32")
+    predecessors = np.full(len(vertices), -1, dtype=vertices.dtype)
+    start_index = _get_vertex_index(vertices, start)
+    distances[start_index] = 0
+
+    frontier = np.array([start_index])
+    depth = 0
+    while len(frontier) and ((depth_limit is None) or (depth < depth_limit)):
+        depth += 1
+        (group, edge_positions) = G._expand_neighbors(vertices[frontier])
+        reached = np.searchsorted(vertices, neighbors[edge_positions])
+        is_new = distances[reached] == unreached
+        # Each newly reached vertex gets the first frontier vertex it was
+        # reached from as its predecessor.
+        (new_frontier, first) = np.unique(reached[is_new], return_index=True)
+        distances[new_frontier] = depth
+        predecessors[new_frontier] = vertices[frontier[group[is_new][first]]]
+        frontier = new_frontier
+
+    return pd.DataFrame({"vertex": vertices,
+                         "distance": distances,
+                         "predecessor": predecessors})
+
+
+def sssp(G, source, cutoff=None):
+    """
+    Host version of cugraph.sssp() for HostGraph G, using an edge weight of
+    1.0 if G is unweighted. Returns a pandas DataFrame with "vertex",
+    "distance", and "predecessor" columns. Vertices that are unreachable, or
+    further than cutoff from source, have the maximum float64 value as their
+    distance and -1 as their predecessor.
+    """
+    (vertices, src, dst, weights) = _get_edge_indices(G)
+    distances = np.full(len(vertices), np.inf)
+    predecessors = np.full(len(vertices), -1, dtype=vertices.dtype)
+    distances[_get_vertex_index(vertices, source)] = 0
+
+    # Relax all edges at once until no distance improves (Bellman-Ford),
+    # using the edge with the smallest candidate distance into each vertex.
+    for _ in range(len(vertices)):
+        candidates = distances[src] + weights
+        order = np.lexsort((candidates, dst))
+        (targets, first) = np.unique(dst[order], return_index=True)
+        best_edges = order[first]
+        improved = candidates[best_edges] < distances[targets]
+        if not improved.any():
+            break
+        best_edges = best_edges[improved]
+        distances[targets[improved]] = candidates[best_edges]
+        predecessors[targets[improved]] = vertices[src[best_edges]]
+
+    unreached = np.isinf(distances)
+    if cutoff is not None:
+        unreached |= distances > cutoff
+    distances[unreached] = np.finfo("float64").max
+    predecessors[unreached] = -1
+    return pd.DataFrame({"vertex": vertices,
+                         "distance": distances,
+                         "predecessor": predecessors})
+
+
+def weakly_connected_components(G):
+    """
+    Host version of cugraph.weakly_connected_components() for HostGraph G.
+    Returns a pandas DataFrame with "labels" and "vertex" columns, where the
+    label of each component is the smallest vertex ID in it.
+    """
+    (vertices, src, dst, _) = _get_edge_indices(G)
+    labels = np.arange(len(vertices))
+
+    # Propagate the smallest label across edges in both directions, then
+    # shortcut each label to the label of the vertex it refers to, until no
+    # label changes.
+    while True:
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, dst, labels[src])
+        np.minimum.at(new_labels, src, labels[dst])
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    return pd.DataFrame({"labels": vertices[labels], "vertex": vertices})
+
+
+def katz_centrality(G, alpha=None, beta=1.0, max_iter=100, tol=1.0e-6,
+                    normalized=True):
+    """
+    Host version of cugraph.katz_centrality() for HostGraph G, which computes
+    the out-edge Katz centrality and ignores edge weights. alpha defaults to
+    1 / (maximum out degree). Returns a pandas DataFrame with "vertex" and
+    "katz_centrality" columns.
+    """
+    (vertices, starts, ends, _, _) = G._get_adjacency()
+    (_, src, dst, _) = _get_edge_indices(G)
+    if alpha is None:
+        max_degree = (ends - starts).max() if len(vertices) else 0
+        alpha = 1.0 / max(max_degree, 1)
+
+    centralities = np.zeros(len(vertices))
+    for _ in range(max_iter):
+        new_centralities = alpha * np.bincount(
+            src, centralities[dst], minlength=len(vertices)) + beta
+        converged = np.abs(new_centralities - centralities).sum() < tol
+        centralities = new_centralities
+        if converged:
+            break
+
+    if normalized and len(vertices):
+        centralities /= np.linalg.norm(centralities)
+    return pd.DataFrame({"vertex": vertices,
+                         "katz_centrality": centralities})
@@ -21,13 +21,30 @@ from cugraph_service_server.cugraph_handler import CugraphHandler
 
 
 def create_handler(graph_creation_extension_dir=None,
-                   dask_scheduler_file=None):
+                   dask_scheduler_file=None,
+                   backend="gpu",
+                   result_cache_size=0,
+                   graph_memory_budget=0,
+                   graph_offload_dir=None,
+                   num_workers=defaults.num_workers):
     """
     Create and return a CugraphHandler instance initialized with
     options. Setting graph_creation_extension_dir to a valid dir results in the
-    handler loading graph creation extensions from that dir.
+    handler loading graph creation extensions from that dir. backend is either
+    "gpu" or "cpu" (pandas and NumPy only, no MG support). Setting
+    result_cache_size to a number of bytes greater than 0 enables caching
+    results of repeated algorithm and extract_subgraph calls. Setting
+    graph_memory_budget to a number of bytes greater than 0 enables offloading
+    the least recently used graphs to graph_offload_dir (or the default
+    temporary directory) when the graphs in memory exceed it. num_workers is
+    the number of client connections the server will handle concurrently,
+    which the handler reports to clients.
     """
-    handler = CugraphHandler()
+    handler = CugraphHandler(backend=backend,
+                             result_cache_size=result_cache_size,
+                             graph_memory_budget=graph_memory_budget,
+                             graph_offload_dir=graph_offload_dir,
+                             num_workers=num_workers)
     if graph_creation_extension_dir is not None:
         handler.load_graph_creation_extensions(graph_creation_extension_dir)
     if dask_scheduler_file is not None:
@@ -37,12 +54,16 @@ def create_handler(graph_creation_extension_dir=None,
     return handler
 
 
-def start_server_blocking(handler, host, port):
+def start_server_blocking(handler, host, port,
+                          num_workers=defaults.num_workers):
     """
     Start the cugraph_service server on host/port, using handler as the request
-    handler instance. This call blocks indefinitely until Ctrl-C.
+    handler instance and num_workers threads to handle concurrent client
+    connections. This call blocks indefinitely until Ctrl-C.
     """
-    server = create_server(handler, host=host, port=port)
+    server = create_server(handler, host=host, port=port,
+                           num_workers=num_workers,
+                           call_stats=handler.call_stats)
     server.serve()  # blocks until Ctrl-C (kill -2)
 
 
@@ -58,6 +79,12 @@ if __name__ == "__main__":
                             default=defaults.port,
                             help="port the server should listen on, default "
                             f"is {defaults.port}")
+    arg_parser.add_argument("--num-workers",
+                            type=int,
+                            default=defaults.num_workers,
+                            help="number of client connections to handle "
+                            "concurrently, default is "
+                            f"{defaults.num_workers}")
     arg_parser.add_argument("--graph-creation-extension-dir",
                             type=Path,
                             help="dir to load graph creation extension "
@@ -66,9 +93,41 @@ if __name__ == "__main__":
                             type=Path,
                             help="file generated by a dask scheduler, used "
                             "for connecting to a dask cluster for MG support")
+    arg_parser.add_argument("--backend",
+                            choices=CugraphHandler.backends,
+                            default="gpu",
+                            help="use cuDF and cuGraph (gpu) or pandas and "
+                            "NumPy (cpu) for graph data and algorithms, "
+                            "default is gpu")
+    arg_parser.add_argument("--result-cache-size",
+                            type=int,
+                            default=0,
+                            help="maximum number of bytes of algorithm and "
+                            "extract_subgraph results to cache and return "
+                            "for repeated calls on unchanged graphs, default "
+                            "is 0 (disabled)")
+    arg_parser.add_argument("--graph-memory-budget",
+                            type=int,
+                            default=0,
+                            help="maximum number of bytes of graph data to "
+                            "keep in memory, beyond which the least recently "
+                            "used graphs are offloaded to disk and reloaded "
+                            "when next used, default is 0 (disabled)")
+    arg_parser.add_argument("--graph-offload-dir",
+                            type=Path,
+                            help="dir to offload graphs to, default is the "
+                            "system temporary dir")
     args = arg_parser.parse_args()
+    if (args.backend == "cpu") and (args.dask_scheduler_file is not None):
+        arg_parser.error("--dask-scheduler-file cannot be used with "
+                         "--backend=cpu")
     handler = create_handler(args.graph_creation_extension_dir,
-                             args.dask_scheduler_file)
+                             args.dask_scheduler_file,
+                             args.backend,
+                             args.result_cache_size,
+                             args.graph_memory_budget,
+                             args.graph_offload_dir,
+                             args.num_workers)
     print("Starting the cugraph_service server...", flush=True)
-    start_server_blocking(handler, args.host, args.port)
+    start_server_blocking(handler, args.host, args.port, args.num_workers)
     print("done.")
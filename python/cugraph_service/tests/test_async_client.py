@@ -0,0 +1,314 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+
+# If the rapids-pytest-benchmark plugin is installed, the "gpubenchmark"
+# fixture will be available automatically. Check that this fixture is available
+# by trying to import rapids_pytest_benchmark, and if that fails, set
+# "gpubenchmark" to the standard "benchmark" fixture provided by
+# pytest-benchmark.
+try:
+    import rapids_pytest_benchmark  # noqa: F401
+except ImportError:
+    import pytest_benchmark
+    gpubenchmark = pytest_benchmark.plugin.benchmark
+
+
+###############################################################################
+# fixtures
+
+class StandinHandler:
+    """
+    Handler for a stand-in cugraph_service server, which does not need a GPU.
+    uniform_neighbor_sample() returns each start vertex as a source with
+    destinations start vertex + 1 after sleeping for sample_time seconds, to
+    simulate a server that is busy sampling. get_server_info() reports the
+    num_workers the server was started with.
+    """
+    sample_time = 0.01
+
+    def __init__(self, num_workers):
+        self.num_workers = num_workers
+
+    def uptime(self):
+        return 0
+
+    def get_server_info(self):
+        from cugraph_service_client.types import ValueWrapper
+
+        return {"num_workers": ValueWrapper(self.num_workers).union}
+
+    def uniform_neighbor_sample(self, start_list, fanout_vals,
+                                with_replacement, graph_id, result_format):
+        from cugraph_service_client.types import (
+            UniformNeighborSampleResult,
+            encode_ndarray,
+        )
+
+        time.sleep(self.sample_time)
+        sources = np.array(start_list, dtype="int32")
+        return UniformNeighborSampleResult(
+            sources_buffer=encode_ndarray(sources),
+            destinations_buffer=encode_ndarray(sources + 1),
+            indices_buffer=encode_ndarray(np.ones(len(sources))))
+
+
+# The client_timeout (in ms) used by the stand-in servers, long enough that
+# a call waiting for the server to time out an idle connection is detected.
+standin_client_timeout = 5000
+
+
+def start_standin_server(num_workers):
+    """
+    Start a stand-in cugraph_service server using a StandinHandler and
+    num_workers workers in a background thread, and return the server object
+    and its (host, port).
+    """
+    from cugraph_service_client.cugraph_service_thrift import create_server
+
+    host = "localhost"
+    with socket.socket() as s:
+        s.bind((host, 0))
+        port = s.getsockname()[1]
+
+    server = create_server(StandinHandler(num_workers), host=host, port=port,
+                           client_timeout=standin_client_timeout,
+                           num_workers=num_workers)
+    server_thread = threading.Thread(target=server.serve, daemon=True)
+    server_thread.start()
+    return (server, (host, port))
+
+
+@pytest.fixture(scope="module")
+def standin_server():
+    """
+    Start a stand-in cugraph_service server with 32 workers, and return its
+    (host, port).
+    """
+    (server, host_port) = start_standin_server(num_workers=32)
+    yield host_port
+    server.close()
+
+
+@pytest.fixture(scope="module")
+def default_standin_server():
+    """
+    Start a stand-in cugraph_service server with the default number of
+    workers, and return its (host, port).
+    """
+    from cugraph_service_client import defaults
+
+    (server, host_port) = start_standin_server(defaults.num_workers)
+    yield host_port
+    server.close()
+
+
+@pytest.fixture(scope="module")
+def single_worker_standin_server():
+    """
+    Start a stand-in cugraph_service server with a single worker, which
+    handles one client connection at a time, and return its (host, port).
+    """
+    (server, host_port) = start_standin_server(num_workers=1)
+    yield host_port
+    server.close()
+
+
+###############################################################################
+# tests
+
+def test_async_client(standin_server):
+    from cugraph_service_client import AsyncCugraphServiceClient
+
+    (host, port) = standin_server
+
+    async def run():
+        async with AsyncCugraphServiceClient(host, port) as client:
+            assert await client.uptime() == 0
+            return await client.uniform_neighbor_sample([1, 2, 3], [10])
+
+    result = asyncio.run(run())
+    assert result.sources.tolist() == [1, 2, 3]
+    assert result.destinations.tolist() == [2, 3, 4]
+    assert result.indices.tolist() == [1.0, 1.0, 1.0]
+    # Arrays decoded from binary results can be modified
+    assert result.sources.flags.writeable
+
+
+def test_async_client_calls_in_flight(standin_server):
+    """
+    Ensures up to max_in_flight calls are handled by the server at the same
+    time, and that each call returns its own result.
+    """
+    from cugraph_service_client import AsyncCugraphServiceClient
+
+    (host, port) = standin_server
+    num_calls = 8
+
+    async def run():
+        client = AsyncCugraphServiceClient(host, port,
+                                           max_in_flight=num_calls)
+        async with client:
+            return await asyncio.gather(
+                *[client.uniform_neighbor_sample([i], [10])
+                  for i in range(num_calls)])
+
+    st = time.monotonic()
+    results = asyncio.run(run())
+    elapsed = time.monotonic() - st
+
+    assert [r.sources.tolist() for r in results] == \
+        [[i] for i in range(num_calls)]
+    assert elapsed < (num_calls * StandinHandler.sample_time)
+
+
+def test_async_client_errors(standin_server):
+    from cugraph_service_client import AsyncCugraphServiceClient
+
+    (host, port) = standin_server
+
+    with pytest.raises(ValueError):
+        AsyncCugraphServiceClient(host, port, max_in_flight=0)
+
+    async def run():
+        client = AsyncCugraphServiceClient(host, port)
+        await client.close()
+        with pytest.raises(RuntimeError):
+            await client.uptime()
+
+    asyncio.run(run())
+
+
+def test_async_client_default_server(default_standin_server):
+    """
+    Ensures a client with the default max_in_flight can make concurrent calls
+    on a server with the default number of workers without waiting for the
+    server to time out idle connections.
+    """
+    from cugraph_service_client import AsyncCugraphServiceClient
+
+    (host, port) = default_standin_server
+    num_calls = 8
+
+    async def run():
+        async with AsyncCugraphServiceClient(host, port) as client:
+            return await asyncio.gather(
+                *[client.uniform_neighbor_sample([i], [10])
+                  for i in range(num_calls)])
+
+    st = time.monotonic()
+    results = asyncio.run(run())
+    elapsed = time.monotonic() - st
+
+    assert [r.sources.tolist() for r in results] == \
+        [[i] for i in range(num_calls)]
+    assert elapsed < (standin_client_timeout / 1000)
+
+
+def test_async_client_single_worker_server(single_worker_standin_server):
+    """
+    Ensures a client with max_in_flight greater than the number of server
+    workers fails on its first call instead of waiting for the server to time
+    out idle connections, and that a client with a max_in_flight the server
+    can handle works.
+    """
+    from cugraph_service_client import AsyncCugraphServiceClient
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    (host, port) = single_worker_standin_server
+    num_calls = 4
+
+    async def run(max_in_flight):
+        client = AsyncCugraphServiceClient(host, port,
+                                           max_in_flight=max_in_flight)
+        async with client:
+            return await asyncio.gather(
+                *[client.uniform_neighbor_sample([i], [10])
+                  for i in range(num_calls)])
+
+    st = time.monotonic()
+    with pytest.raises(CugraphServiceError, match="--num-workers 4"):
+        asyncio.run(run(max_in_flight=4))
+    results = asyncio.run(run(max_in_flight=1))
+    elapsed = time.monotonic() - st
+
+    assert [r.sources.tolist() for r in results] == \
+        [[i] for i in range(num_calls)]
+    assert elapsed < (standin_client_timeout / 1000)
+
+
+def test_async_client_close_releases_connections(
+        single_worker_standin_server):
+    """
+    Ensures close() closes the connections to the server, even if a CallBatch
+    from the client is still referenced, so that the server can handle other
+    clients.
+    """
+    from cugraph_service_client import (
+        AsyncCugraphServiceClient,
+        CugraphServiceClient,
+    )
+
+    (host, port) = single_worker_standin_server
+
+    async def run():
+        async with AsyncCugraphServiceClient(host, port,
+                                             max_in_flight=1) as client:
+            await client.uptime()
+            return client.batch()
+
+    batch = asyncio.run(run())
+
+    # The single server worker can only handle this call once the connection
+    # used by the closed client has been closed.
+    st = time.monotonic()
+    assert CugraphServiceClient(host, port).uptime() == 0
+    elapsed = time.monotonic() - st
+
+    assert elapsed < (standin_client_timeout / 1000)
+    assert len(batch) == 0
+
+
+###############################################################################
+# benchmarks
+
+@pytest.mark.parametrize("max_in_flight", [1, 4, 16])
+def bench_async_client_uniform_neighbor_sample(gpubenchmark, standin_server,
+                                               max_in_flight):
+    """
+    Benchmark making 64 uniform_neighbor_sample() calls with max_in_flight
+    calls outstanding at a time.
+    """
+    from cugraph_service_client import AsyncCugraphServiceClient
+
+    (host, port) = standin_server
+    client = AsyncCugraphServiceClient(host, port,
+                                       max_in_flight=max_in_flight)
+
+    async def sample():
+        return await asyncio.gather(
+            *[client.uniform_neighbor_sample([i], [10]) for i in range(64)])
+
+    try:
+        results = gpubenchmark(lambda: asyncio.run(sample()))
+        assert len(results) == 64
+    finally:
+        asyncio.run(client.close())
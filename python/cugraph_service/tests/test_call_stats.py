@@ -0,0 +1,79 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+###############################################################################
+# tests
+
+def test_rolling_histogram():
+    from cugraph_service_server.call_stats import RollingHistogram
+
+    hist = RollingHistogram([1, 10, 100], window=100, num_slots=10)
+    for value in [0.5, 5, 5, 50, 500]:
+        hist.record(value, now=1000)
+    hist.record(5, now=1055)
+
+    rolling = hist.rolling(now=1060)
+    assert rolling["buckets"] == [1, 3, 1, 1]
+    assert rolling["count"] == 6
+    assert rolling["sum"] == 565.5
+    assert rolling["p50"] == 10
+    assert rolling["p90"] is None
+
+    # The values recorded at 1000 are no longer in the window, but are still
+    # included in the cumulative counts.
+    rolling = hist.rolling(now=1100)
+    assert rolling["buckets"] == [0, 1, 0, 0]
+    assert rolling["p50"] == rolling["p99"] == 10
+    assert hist.cumulative()["buckets"] == [1, 3, 1, 1]
+
+    assert hist.rolling(now=2000)["count"] == 0
+    assert hist.rolling(now=2000)["p50"] is None
+
+
+def test_call_stats():
+    from cugraph_service_server.call_stats import CallStats
+
+    stats = CallStats()
+    stats.start_call()
+    stats.add_queue_wait(0.25)
+    stats.record_call("node2vec", call_seconds=1.0,
+                      serialization_seconds=0.002, request_bytes=100,
+                      response_bytes=1000, error=False)
+    stats.start_call()
+    stats.record_call("node2vec", call_seconds=0.001,
+                      serialization_seconds=0.0, request_bytes=100,
+                      response_bytes=50, error=True)
+
+    node2vec_stats = stats.get_stats()["node2vec"]
+    assert node2vec_stats["calls"] == 2
+    assert node2vec_stats["errors"] == 1
+    assert node2vec_stats["request_bytes"] == 200
+    assert node2vec_stats["response_bytes"] == 1050
+    assert node2vec_stats["queue_wait_seconds"]["sum"] == 0.25
+    # The queue wait is not included in the execution time
+    assert node2vec_stats["execution_seconds"]["sum"] == 0.751
+    assert node2vec_stats["response_size_bytes"]["count"] == 2
+
+    lines = stats.to_prometheus_text().splitlines()
+    assert "# TYPE cugraph_service_calls_total counter" in lines
+    assert 'cugraph_service_calls_total{method="node2vec"} 2' in lines
+    assert 'cugraph_service_errors_total{method="node2vec"} 1' in lines
+    assert "# TYPE cugraph_service_execution_seconds histogram" in lines
+    assert 'cugraph_service_execution_seconds_bucket{method="node2vec",' \
+        'le="0.001"} 1' in lines
+    assert 'cugraph_service_execution_seconds_bucket{method="node2vec",' \
+        'le="+Inf"} 2' in lines
+    assert 'cugraph_service_execution_seconds_count{method="node2vec"} 2' \
+        in lines
@@ -12,10 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib.util
 import pickle
+import threading
+import time
 
+import numpy as np
 import pytest
 
+from . import data
+
+# The tests using the "gpu" backend (the default) require cuDF, the tests
+# using the "cpu" backend do not.
+has_cudf = importlib.util.find_spec("cudf") is not None
+requires_cudf = pytest.mark.skipif(not(has_cudf),
+                                   reason="cudf is not installed")
 
 ###############################################################################
 # fixtures
@@ -25,6 +36,7 @@ import pytest
 ###############################################################################
 # tests
 
+@requires_cudf
 def test_load_and_call_graph_creation_extension(graph_creation_extension2):
     """
     Ensures load_extensions reads the extensions and makes the new APIs they
@@ -77,6 +89,7 @@ def test_load_and_call_graph_creation_extension(graph_creation_extension2):
     assert ("c" in edge_props)
 
 
+@requires_cudf
 def test_load_and_unload_graph_creation_extension(graph_creation_extension2):
     """
     Ensure extensions can be unloaded.
@@ -102,6 +115,7 @@ def test_load_and_unload_graph_creation_extension(graph_creation_extension2):
             "my_graph_creation_function", "('a', 'b', 'c')", "{}")
 
 
+@requires_cudf
 def test_load_and_unload_graph_creation_extension_no_args(
         graph_creation_extension1):
     """
@@ -119,6 +133,7 @@ def test_load_and_unload_graph_creation_extension_no_args(
     assert new_graph_ID in handler.get_graph_ids()
 
 
+@requires_cudf
 def test_load_and_unload_graph_creation_extension_no_facade_arg(
         graph_creation_extension_no_facade_arg):
     """
@@ -136,6 +151,7 @@ def test_load_and_unload_graph_creation_extension_no_facade_arg(
     assert new_graph_ID in handler.get_graph_ids()
 
 
+@requires_cudf
 def test_load_and_unload_graph_creation_extension_bad_arg_order(
         graph_creation_extension_bad_arg_order):
     """
@@ -155,6 +171,7 @@ def test_load_and_unload_graph_creation_extension_bad_arg_order(
             "graph_creation_function", "('a', 'b')", "{}")
 
 
+@requires_cudf
 def test_get_graph_data_large_vertex_ids(
         graph_creation_extension_big_vertex_ids):
     """
@@ -209,6 +226,56 @@ def test_get_graph_data_large_vertex_ids(
     assert len(pickle.loads(edge_data)) == 1
 
 
+@requires_cudf
+def test_get_edge_IDs_for_vertices(graph_creation_extension_big_vertex_ids):
+    """
+    Test that edge IDs are returned in the order of the (src, dst) pairs, and
+    that missing edges are reported.
+    """
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    handler = CugraphHandler()
+
+    extension_dir = graph_creation_extension_big_vertex_ids
+
+    handler.load_graph_creation_extensions(extension_dir)
+    new_graph_id = handler.call_graph_creation_extension(
+        "graph_creation_function_vert_and_edge_data_big_vertex_ids",
+        "()", "{}")
+    extracted_graph_id = handler.extract_subgraph(create_using=None,
+                                                  selection=None,
+                                                  edge_weight_property=None,
+                                                  default_edge_weight=1.0,
+                                                  allow_multi_edges=True,
+                                                  renumber_graph=True,
+                                                  add_edge_data=True,
+                                                  graph_id=new_graph_id)
+
+    # Edges are (big_num + i, big_num + i + 1) with edge ID i
+    big_num = (2**32)+1
+    eIDs = handler.get_edge_IDs_for_vertices([big_num+3, big_num, big_num+9],
+                                             [big_num+4, big_num+1,
+                                              big_num+10],
+                                             extracted_graph_id)
+    assert eIDs == [3, 0, 9]
+
+    # Lookups for an existing graph reuse the same table
+    eIDs = handler.get_edge_IDs_for_vertices([big_num+1], [big_num+2],
+                                             extracted_graph_id)
+    assert eIDs == [1]
+
+    with pytest.raises(CugraphServiceError, match="1 of 2"):
+        handler.get_edge_IDs_for_vertices([big_num, big_num+1],
+                                          [big_num+1, big_num],
+                                          extracted_graph_id)
+
+    with pytest.raises(CugraphServiceError):
+        handler.get_edge_IDs_for_vertices([big_num], [],
+                                          extracted_graph_id)
+
+
+@requires_cudf
 def test_get_graph_data_empty_graph(graph_creation_extension_empty_graph):
     """
     Tests that get_graph_*_data() handles empty graphs correctly.
@@ -241,3 +308,425 @@ def test_get_graph_data_empty_graph(graph_creation_extension_empty_graph):
         property_keys=None)
 
     assert len(pickle.loads(edge_data)) == 0
+
+
+def test_cpu_backend():
+    """
+    Tests loading data, extracting a subgraph, and running algos using a
+    handler with the cpu backend.
+    """
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+    from cugraph_service_client import defaults
+    from cugraph_service_client.types import ResultFormat, decode_ndarray
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    handler = CugraphHandler(backend="cpu")
+    assert handler.backend == "cpu"
+    assert not handler.is_mg
+    server_info = handler.get_server_info()
+    assert server_info["num_gpus"].int32_value == 0
+    assert server_info["backend"].string_value == "cpu"
+    assert server_info["num_workers"].int32_value == defaults.num_workers
+
+    test_data = data.edgelist_csv_data["karate"]
+    handler.load_csv_as_edge_data(test_data["csv_file_name"],
+                                  delimiter=" ",
+                                  dtypes=test_data["dtypes"],
+                                  header=None,
+                                  vertex_col_names=["0", "1"],
+                                  type_name="",
+                                  property_columns=[],
+                                  names=[],
+                                  graph_id=defaults.graph_id,
+                                  )
+    extracted_graph_id = handler.extract_subgraph(create_using="",
+                                                  selection="",
+                                                  edge_weight_property="2",
+                                                  default_edge_weight=0.0,
+                                                  allow_multi_edges=False,
+                                                  renumber_graph=True,
+                                                  add_edge_data=True,
+                                                  graph_id=defaults.graph_id)
+    assert "HostGraph" in handler.get_graph_type(extracted_graph_id)
+    info = handler.get_graph_info(["num_edges"], extracted_graph_id)
+    assert info["num_edges"].int32_value == test_data["num_edges"]
+
+    result = handler.uniform_neighbor_sample([1, 2], [2, 2], True,
+                                             extracted_graph_id,
+                                             ResultFormat.BINARY)
+    sources = decode_ndarray(result.sources_buffer)
+    assert len(sources) > 0
+    assert set([1, 2]) <= set(sources.tolist())
+
+    result = handler.batched_ego_graphs([0], 1, extracted_graph_id,
+                                        ResultFormat.LEGACY)
+    assert result.seeds_offsets[0] == 0
+    assert result.seeds_offsets[1] > 0
+
+    result = handler.node2vec([0], 3, extracted_graph_id,
+                              ResultFormat.LEGACY)
+    assert result.vertex_paths[0] == 0
+
+    # Edge (1, 0) is the first line of the CSV
+    assert handler.get_edge_IDs_for_vertices([1], [0],
+                                             extracted_graph_id) == [0]
+
+    with pytest.raises(CugraphServiceError):
+        handler.initialize_dask_client(None)
+
+    with pytest.raises(ValueError):
+        CugraphHandler(backend="tpu")
+
+
+@pytest.mark.skipif(has_cudf, reason="cudf is installed")
+def test_gpu_backend_without_cudf():
+    """
+    Ensures the handler can be imported and used with the cpu backend when
+    cuDF is not installed, and the gpu backend cannot be used.
+    """
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+
+    with pytest.raises(RuntimeError, match="cudf"):
+        CugraphHandler()
+    assert CugraphHandler(backend="cpu").backend == "cpu"
+
+
+def test_run_algo_cpu_backend():
+    """
+    Tests running algos by name using a handler with the cpu backend.
+    """
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+    from cugraph_service_client import defaults
+    from cugraph_service_client.types import ValueWrapper, decode_ndarray
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    handler = CugraphHandler(backend="cpu")
+    test_data = data.edgelist_csv_data["karate"]
+    handler.load_csv_as_edge_data(test_data["csv_file_name"],
+                                  delimiter=" ",
+                                  dtypes=test_data["dtypes"],
+                                  header=None,
+                                  vertex_col_names=["0", "1"],
+                                  type_name="",
+                                  property_columns=[],
+                                  names=[],
+                                  graph_id=defaults.graph_id,
+                                  )
+    extracted_graph_id = handler.extract_subgraph(create_using="",
+                                                  selection="",
+                                                  edge_weight_property="2",
+                                                  default_edge_weight=0.0,
+                                                  allow_multi_edges=False,
+                                                  renumber_graph=True,
+                                                  add_edge_data=True,
+                                                  graph_id=defaults.graph_id)
+
+    # louvain has no host version
+    algo_names = handler.get_algo_names()
+    assert "louvain" not in algo_names
+    for name in ["pagerank", "bfs", "sssp", "weakly_connected_components",
+                 "katz_centrality"]:
+        assert name in algo_names
+
+    def run_algo(algo_name, **params):
+        params = {name: ValueWrapper(value).union
+                  for (name, value) in params.items()}
+        result = handler.run_algo(algo_name, params, extracted_graph_id)
+        return dict(zip(result.column_names,
+                        map(decode_ndarray, result.column_buffers)))
+
+    results = run_algo("pagerank", alpha=0.9, max_iter=50)
+    assert list(results) == ["vertex", "pagerank"]
+    assert len(results["vertex"]) == 34
+    assert results["pagerank"].sum() == pytest.approx(1.0)
+
+    results = run_algo("bfs", start=0, depth_limit=1)
+    assert set(results["distance"].tolist()) == \
+        {0, 1, np.iinfo("int32").max}
+
+    results = run_algo("weakly_connected_components")
+    assert set(results["labels"].tolist()) == {0}
+
+    for (algo_name, params) in [("louvain", {}),
+                                ("not_an_algo", {}),
+                                ("bfs", {}),
+                                ("bfs", {"start": 0, "not_a_param": 1}),
+                                ("pagerank", {"alpha": "high"})]:
+        with pytest.raises(CugraphServiceError):
+            run_algo(algo_name, **params)
+    with pytest.raises(CugraphServiceError):
+        handler.run_algo("pagerank", {}, defaults.graph_id)
+
+
+def test_result_cache():
+    """
+    Ensures repeated calls return cached results, and that results are
+    removed from the cache when the graphs they depend on are modified or
+    deleted.
+    """
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+    from cugraph_service_client import defaults
+    from cugraph_service_client.exceptions import CugraphServiceError
+    from cugraph_service_client.types import ResultFormat
+
+    handler = CugraphHandler(backend="cpu", result_cache_size=2**20)
+    test_data = data.edgelist_csv_data["karate"]
+
+    def load_karate():
+        handler.load_csv_as_edge_data(test_data["csv_file_name"],
+                                      delimiter=" ",
+                                      dtypes=test_data["dtypes"],
+                                      header=None,
+                                      vertex_col_names=["0", "1"],
+                                      type_name="",
+                                      property_columns=[],
+                                      names=[],
+                                      graph_id=defaults.graph_id,
+                                      )
+
+    def extract_subgraph():
+        return handler.extract_subgraph(create_using="",
+                                        selection="",
+                                        edge_weight_property="2",
+                                        default_edge_weight=0.0,
+                                        allow_multi_edges=True,
+                                        renumber_graph=True,
+                                        add_edge_data=True,
+                                        graph_id=defaults.graph_id)
+
+    def get_cache_info():
+        info = handler.get_server_info()
+        return (info["result_cache_hits"].int32_value,
+                info["result_cache_misses"].int32_value)
+
+    load_karate()
+    extracted_graph_id = extract_subgraph()
+    assert extract_subgraph() == extracted_graph_id
+    result = handler.batched_ego_graphs([0, 33], 1, extracted_graph_id,
+                                        ResultFormat.BINARY)
+    assert handler.batched_ego_graphs([0, 33], 1, extracted_graph_id,
+                                      ResultFormat.BINARY) is result
+    assert handler.batched_ego_graphs([0], 1, extracted_graph_id,
+                                      ResultFormat.BINARY) is not result
+    assert get_cache_info() == (2, 3)
+    assert handler.get_server_info()["result_cache_bytes"].int32_value > 0
+
+    # The extracted graph ID was returned twice, so the graph is only deleted
+    # after being deleted twice, which removes the results that depend on it
+    handler.delete_graph(extracted_graph_id)
+    assert extracted_graph_id in handler.get_graph_ids()
+    assert handler.batched_ego_graphs([0, 33], 1, extracted_graph_id,
+                                      ResultFormat.BINARY) is result
+    handler.delete_graph(extracted_graph_id)
+    assert extracted_graph_id not in handler.get_graph_ids()
+    with pytest.raises(CugraphServiceError):
+        handler.delete_graph(extracted_graph_id)
+    new_extracted_graph_id = extract_subgraph()
+    assert new_extracted_graph_id != extracted_graph_id
+    assert get_cache_info() == (3, 4)
+
+    # Modifying the graph removes the results that depend on it
+    load_karate()
+    assert extract_subgraph() != new_extracted_graph_id
+    assert get_cache_info() == (3, 5)
+
+
+def test_graph_memory_offload(tmp_path):
+    """
+    Ensures the least recently used graphs are offloaded when the graphs in
+    memory exceed the memory budget, and are reloaded when used.
+    """
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+    from cugraph_service_client import defaults
+    from cugraph_service_client.types import ResultFormat, ValueWrapper
+
+    test_data = data.edgelist_csv_data["karate"]
+    handler = CugraphHandler(backend="cpu", graph_memory_budget=1,
+                             graph_offload_dir=tmp_path)
+
+    def get_memory_info(graph_id):
+        info = handler.get_graph_info(
+            ["memory_bytes", "is_offloaded", "idle_seconds"], graph_id)
+        return {k: ValueWrapper(v).get_py_obj() for (k, v) in info.items()}
+
+    handler.load_csv_as_edge_data(test_data["csv_file_name"],
+                                  delimiter=" ",
+                                  dtypes=test_data["dtypes"],
+                                  header=None,
+                                  vertex_col_names=["0", "1"],
+                                  type_name="",
+                                  property_columns=[],
+                                  names=[],
+                                  graph_id=defaults.graph_id,
+                                  )
+    # The graph being modified is not offloaded
+    pg_info = get_memory_info(defaults.graph_id)
+    assert pg_info["memory_bytes"] > 0
+    assert pg_info["is_offloaded"] is False
+
+    # The default graph is in use while extracting, so the new graph is
+    # offloaded.
+    extracted_gid = handler.extract_subgraph(create_using="",
+                                             selection="",
+                                             edge_weight_property="2",
+                                             default_edge_weight=0.0,
+                                             allow_multi_edges=True,
+                                             renumber_graph=True,
+                                             add_edge_data=True,
+                                             graph_id=defaults.graph_id)
+    assert get_memory_info(extracted_gid)["is_offloaded"] is True
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Using the extracted graph reloads it, and offloads the default graph
+    result = handler.uniform_neighbor_sample([1, 2], [2], True,
+                                             extracted_gid,
+                                             ResultFormat.LEGACY)
+    assert len(result.sources) == 4
+    assert get_memory_info(extracted_gid)["is_offloaded"] is False
+    assert get_memory_info(defaults.graph_id)["is_offloaded"] is True
+
+    info = handler.get_graph_info(["num_edges"], defaults.graph_id)
+    assert info["num_edges"].int32_value == test_data["num_edges"]
+    assert get_memory_info(defaults.graph_id)["is_offloaded"] is False
+
+    server_info = handler.get_server_info()
+    assert server_info["num_offloaded_graphs"].int32_value == 1
+
+    # Deleting an offloaded graph removes its files
+    handler.delete_graph(extracted_gid)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_extract_subgraph_auto_refresh(tmp_path):
+    """
+    Ensures edges added to a graph are added to the subgraphs extracted from
+    it with auto_refresh set the next time they are used.
+    """
+    import pandas as pd
+    from cugraph_service_server.cugraph_handler import CugraphHandler
+    from cugraph_service_client import defaults
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    test_data = data.edgelist_csv_data["karate"]
+    df = pd.read_csv(test_data["csv_file_name"], delimiter=" ", header=None)
+    half = len(df) // 2
+    df[:half].to_csv(tmp_path / "karate_0.csv", sep=" ", header=False,
+                     index=False)
+    df[half:].to_csv(tmp_path / "karate_1.csv", sep=" ", header=False,
+                     index=False)
+
+    handler = CugraphHandler(backend="cpu", result_cache_size=2**20)
+
+    def load_edges(file_name):
+        handler.load_csv_as_edge_data((tmp_path / file_name).as_posix(),
+                                      delimiter=" ",
+                                      dtypes=test_data["dtypes"],
+                                      header=None,
+                                      vertex_col_names=["0", "1"],
+                                      type_name="",
+                                      property_columns=[],
+                                      names=[],
+                                      graph_id=defaults.graph_id,
+                                      )
+
+    def extract_subgraph(auto_refresh, selection=""):
+        return handler.extract_subgraph(create_using="",
+                                        selection=selection,
+                                        edge_weight_property="2",
+                                        default_edge_weight=0.0,
+                                        allow_multi_edges=False,
+                                        renumber_graph=True,
+                                        add_edge_data=True,
+                                        graph_id=defaults.graph_id,
+                                        auto_refresh=auto_refresh)
+
+    def get_num_edges(graph_id):
+        info = handler.get_graph_info(["num_edges"], graph_id)
+        return info["num_edges"].int32_value
+
+    load_edges("karate_0.csv")
+    refreshed_gid = extract_subgraph(auto_refresh=True)
+    snapshot_gid = extract_subgraph(auto_refresh=False)
+    assert get_num_edges(refreshed_gid) == get_num_edges(snapshot_gid) == half
+    # Only the edges matching the selection are added to this subgraph
+    selected_gid = extract_subgraph(auto_refresh=True, selection="_SRC_ > 1")
+    assert get_num_edges(selected_gid) == (df[0][:half] > 1).sum()
+    # The IDs of the selected edges are counted in the graph memory
+    server_info = handler.get_server_info()
+    assert server_info["graph_memory_bytes"].int32_value >= \
+        8 * (df[0][:half] > 1).sum()
+    pagerank = handler.run_algo("pagerank", {}, refreshed_gid)
+
+    load_edges("karate_1.csv")
+    assert get_num_edges(refreshed_gid) == test_data["num_edges"]
+    assert get_num_edges(snapshot_gid) == half
+    assert get_num_edges(selected_gid) == (df[0] > 1).sum()
+    # The cached result for the subgraph before the refresh is not used
+    assert handler.run_algo("pagerank", {}, refreshed_gid) != pagerank
+    # The new edges can be looked up by edge ID
+    (src, dst) = df.iloc[-1][[0, 1]].tolist()
+    assert handler.get_edge_IDs_for_vertices([src], [dst], refreshed_gid) \
+        == [test_data["num_edges"] - 1]
+
+    with pytest.raises(CugraphServiceError):
+        extract_subgraph(auto_refresh=True, selection="_SRC_ > x")
+
+    # The subgraph remains after the graph it was extracted from is deleted
+    handler.delete_graph(defaults.graph_id)
+    assert get_num_edges(refreshed_gid) == test_data["num_edges"]
+
+
+def test_result_cache_eviction():
+    from cugraph_service_server.cugraph_handler import ResultCache
+
+    cache = ResultCache(100)
+    cache.put("a", b"a" * 60, [1])
+    cache.put("b", b"b" * 30, [2])
+    assert cache.get("a") == b"a" * 60
+    # "b" is the least recently used, so it is evicted to make room for "c"
+    cache.put("c", b"c" * 30, [1, 3])
+    assert cache.get("b") is None
+    # Results larger than the cache are not cached
+    cache.put("d", b"d" * 101, [4])
+    assert cache.get("d") is None
+    assert cache.info() == {"hits": 1, "misses": 2, "num_results": 2,
+                            "num_bytes": 90, "max_bytes": 100}
+
+    cache.invalidate(1)
+    assert cache.info()["num_results"] == 0
+
+
+def test_read_write_lock():
+    """
+    Ensures a ReadWriteLock can be held by multiple readers at the same time,
+    but only by a single writer.
+    """
+    from cugraph_service_server.cugraph_handler import ReadWriteLock
+
+    lock = ReadWriteLock()
+    events = []
+
+    def read():
+        with lock.read_locked():
+            events.append("read start")
+            time.sleep(0.5)
+            events.append("read end")
+
+    def write():
+        with lock.write_locked():
+            events.append("write start")
+            time.sleep(0.5)
+            events.append("write end")
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    for t in readers:
+        t.start()
+    time.sleep(0.1)
+    writer = threading.Thread(target=write)
+    writer.start()
+    for t in readers + [writer]:
+        t.join()
+
+    # All readers ran concurrently, and the writer waited for them
+    assert events == ["read start"] * 3 + ["read end"] * 3 + \
+        ["write start", "write end"]
@@ -15,9 +15,11 @@
 import os
 import sys
 import subprocess
+import threading
 import time
 from collections.abc import Sequence
 
+import numpy as np
 import pytest
 
 from . import data
@@ -40,6 +42,7 @@ def server(graph_creation_extension1):
     server_process = None
     host = "localhost"
     port = 9090
+    num_workers = 4
     graph_creation_extension_dir = graph_creation_extension1
     client = CugraphServiceClient(host, port)
 
@@ -65,6 +68,7 @@ def server(graph_creation_extension1):
                 [sys.executable, server_file,
                  "--host", host,
                  "--port", str(port),
+                 "--num-workers", str(num_workers),
                  "--graph-creation-extension-dir",
                  graph_creation_extension_dir],
                 env=env_dict,
@@ -225,6 +229,81 @@ def test_load_csv_as_edge_data_nondefault_graph(client):
                                      graph_id=9999)
 
 
+def test_load_parquet_and_multiple_csvs(client, tmp_path):
+    """
+    Ensures data can be loaded from a directory of Parquet files, and from
+    multiple CSVs using a glob pattern.
+    """
+    import pandas as pd
+
+    test_data = data.edgelist_csv_data["karate"]
+    df = pd.read_csv(test_data["csv_file_name"], delimiter=" ", header=None,
+                     names=["src", "dst", "weight"])
+    half = len(df) // 2
+    parquet_dir = tmp_path / "karate_parquet"
+    parquet_dir.mkdir()
+    df[:half].to_parquet(parquet_dir / "part_0.parquet")
+    df[half:].to_parquet(parquet_dir / "part_1.parquet")
+    df[:half].to_csv(tmp_path / "karate_0.csv", sep=" ", header=False,
+                     index=False)
+    df[half:].to_csv(tmp_path / "karate_1.csv", sep=" ", header=False,
+                     index=False)
+
+    graph_id = client.create_graph()
+    client.load_parquet_as_edge_data(parquet_dir.as_posix(),
+                                     vertex_col_names=["src", "dst"],
+                                     property_columns=["weight"],
+                                     graph_id=graph_id)
+    assert client.get_graph_info("num_edges", graph_id) == \
+        test_data["num_edges"]
+    assert client.is_edge_property("weight", graph_id)
+
+    graph_id = client.create_graph()
+    client.load_csv_as_edge_data((tmp_path / "karate_*.csv").as_posix(),
+                                 dtypes=test_data["dtypes"],
+                                 vertex_col_names=["0", "1"],
+                                 graph_id=graph_id)
+    assert client.get_graph_info("num_edges", graph_id) == \
+        test_data["num_edges"]
+
+
+def test_extract_subgraph_auto_refresh(client, tmp_path):
+    """
+    Ensures a subgraph extracted with auto_refresh set includes the edges
+    added to the graph it was extracted from afterwards.
+    """
+    import pandas as pd
+
+    test_data = data.edgelist_csv_data["karate"]
+    df = pd.read_csv(test_data["csv_file_name"], delimiter=" ", header=None,
+                     names=["src", "dst", "weight"])
+    half = len(df) // 2
+    df[:half].to_csv(tmp_path / "karate_0.csv", sep=" ", header=False,
+                     index=False)
+    df[half:].to_csv(tmp_path / "karate_1.csv", sep=" ", header=False,
+                     index=False)
+
+    graph_id = client.create_graph()
+    client.load_csv_as_edge_data((tmp_path / "karate_0.csv").as_posix(),
+                                 dtypes=test_data["dtypes"],
+                                 vertex_col_names=["0", "1"],
+                                 graph_id=graph_id)
+    refreshed_gid = client.extract_subgraph(graph_id=graph_id,
+                                            auto_refresh=True)
+    snapshot_gid = client.extract_subgraph(graph_id=graph_id)
+    assert client.get_graph_info("num_edges", refreshed_gid) == half
+
+    client.load_csv_as_edge_data((tmp_path / "karate_1.csv").as_posix(),
+                                 dtypes=test_data["dtypes"],
+                                 vertex_col_names=["0", "1"],
+                                 graph_id=graph_id)
+    assert client.get_graph_info("num_edges", refreshed_gid) == \
+        test_data["num_edges"]
+    assert client.get_graph_info("num_edges", snapshot_gid) == half
+    results = client.weakly_connected_components(graph_id=refreshed_gid)
+    assert len(results["vertex"]) == 34
+
+
 def test_get_num_edges_nondefault_graph(client_with_edgelist_csv_loaded):
     from cugraph_service_client.exceptions import CugraphServiceError
 
@@ -316,6 +395,104 @@ def test_load_and_call_graph_creation_long_running_extension(
     assert client.get_graph_info(["num_edges"], new_graph_ID) == 0
 
 
+def test_long_running_call_does_not_block_clients(
+        client,
+        graph_creation_extension_long_running):
+    """
+    Ensures other clients can make calls while a long-running call is in
+    progress.
+    """
+    from cugraph_service_client import CugraphServiceClient, defaults
+
+    extension_dir = graph_creation_extension_long_running
+    client.load_graph_creation_extensions(extension_dir)
+
+    long_running_call = threading.Thread(
+        target=client.call_graph_creation_extension,
+        args=("long_running_graph_creation_function",))
+    long_running_call.start()
+    # Give the long-running call time to reach the server
+    time.sleep(1)
+
+    other_client = CugraphServiceClient(defaults.host, defaults.port)
+    st = time.time()
+    other_client.uptime()
+    other_client.get_graph_ids()
+    assert (time.time() - st) < 5
+
+    long_running_call.join()
+
+
+def test_concurrent_clients(client_with_property_csvs_loaded):
+    """
+    Drives several clients concurrently reading the same graph and ensures
+    they all get correct results.
+    """
+    from cugraph_service_client import CugraphServiceClient, defaults
+
+    (client, test_data) = client_with_property_csvs_loaded
+    num_clients = 8
+    calls_per_client = 20
+
+    expected_vertex_data = client.get_graph_vertex_data()
+    expected_edge_data = client.get_graph_edge_data()
+    errors = []
+
+    def run_client():
+        try:
+            c = CugraphServiceClient(defaults.host, defaults.port)
+            for _ in range(calls_per_client):
+                vertex_data = c.get_graph_vertex_data()
+                edge_data = c.get_graph_edge_data()
+                assert (vertex_data == expected_vertex_data).all()
+                assert (edge_data == expected_edge_data).all()
+                assert c.get_graph_info(["num_edges"]) == \
+                    len(expected_edge_data)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run_client)
+               for _ in range(num_clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+
+
+def test_connection_pool(client_with_edgelist_csv_loaded):
+    """
+    Ensures a client using a connection pool can be used from multiple threads
+    and reuses its connections.
+    """
+    from cugraph_service_client import CugraphServiceClient, defaults
+
+    (client, test_data) = client_with_edgelist_csv_loaded
+    num_edges = client.get_graph_info(["num_edges"])
+
+    pooled_client = CugraphServiceClient(defaults.host, defaults.port,
+                                         pool_size=2)
+    errors = []
+
+    def run_calls():
+        try:
+            for _ in range(50):
+                assert pooled_client.get_graph_info(["num_edges"]) == \
+                    num_edges
+                assert pooled_client.get_graph_ids() == [0]
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run_calls) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+
+
 def test_call_graph_creation_extension(client):
     """
     Ensure the graph creation extension preloaded by the server fixture is
@@ -382,6 +559,58 @@ def test_get_graph_edge_data(client_with_property_csvs_loaded):
     assert np_array[0][2] == 1
 
 
+def test_get_graph_data_batches(client_with_property_csvs_loaded):
+    """
+    Ensures the data returned in batches is the same as the data returned by
+    get_graph_*_data().
+    """
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    (client, test_data) = client_with_property_csvs_loaded
+
+    all_vertex_data = client.get_graph_vertex_data()
+    batches = list(client.get_graph_vertex_data_batches(batch_size=4))
+    assert [len(b) for b in batches] == [4, 4, 1]
+    assert (np.concatenate(batches) == all_vertex_data).all()
+
+    all_edge_data = client.get_graph_edge_data(property_keys=["volume"])
+    batches = list(client.get_graph_edge_data_batches(
+        property_keys=["volume"], batch_size=5))
+    assert [len(b) for b in batches] == [5, 5, 5, 2]
+    assert (np.concatenate(batches) == all_edge_data).all()
+
+    batches = list(client.get_graph_edge_data_batches([0, 1, 2]))
+    assert len(batches) == 1
+    assert batches[0][:, 2].tolist() == [0, 1, 2]
+
+    # Stopping early closes the cursor on the server
+    for batch in client.get_graph_edge_data_batches(batch_size=1):
+        break
+
+    with pytest.raises(CugraphServiceError):
+        client.get_graph_edge_data_batches(batch_size=0)
+
+
+def test_get_server_stats(client_with_edgelist_csv_loaded):
+    (client, test_data) = client_with_edgelist_csv_loaded
+
+    extracted_gid = client.extract_subgraph(default_edge_weight=1.0)
+    for _ in range(3):
+        client.uniform_neighbor_sample([1, 2], [5], graph_id=extracted_gid)
+
+    stats = client.get_server_stats()
+    sample_stats = stats["methods"]["uniform_neighbor_sample"]
+    assert sample_stats["calls"] >= 3
+    assert sample_stats["request_bytes"] > 0
+    assert sample_stats["response_bytes"] > 0
+    assert sample_stats["execution_seconds"]["count"] >= 3
+    assert stats["window_seconds"] > 0
+
+    text = client.get_server_stats(format="prometheus")
+    assert 'cugraph_service_calls_total{method="uniform_neighbor_sample"}' \
+        in text
+
+
 def test_get_graph_info(client_with_property_csvs_loaded):
     (client, test_data) = client_with_property_csvs_loaded
 
@@ -418,6 +647,19 @@ def test_batched_ego_graphs(client_with_edgelist_csv_loaded):
     assert isinstance(seeds_offsets, Sequence)
     assert len(srcs) == seeds_offsets[-1]
 
+    # The binary result format returns the same values as writable arrays
+    client.result_format = "binary"
+    try:
+        binary_results = client.batched_ego_graphs(
+            seeds, radius=1, graph_id=extracted_gid)
+    finally:
+        client.result_format = "legacy"
+
+    for (result, binary_result) in zip(results_lists, binary_results):
+        assert isinstance(binary_result, np.ndarray)
+        assert binary_result.flags.writeable
+        assert binary_result.tolist() == result
+
 
 def test_get_edge_IDs_for_vertices(client_with_edgelist_csv_loaded):
     (client, test_data) = client_with_edgelist_csv_loaded
@@ -456,3 +698,108 @@ def test_uniform_neighbor_sampling(client_with_edgelist_csv_loaded):
                                    fanout_vals=fanout_vals,
                                    with_replacement=with_replacement,
                                    graph_id=extracted_gid)
+
+
+def test_algos(client_with_edgelist_csv_loaded):
+    from cugraph_service_client.exceptions import CugraphServiceError
+    from cugraph_service_client import defaults
+
+    (client, test_data) = client_with_edgelist_csv_loaded
+    algo_names = client.get_algo_names()
+    for name in ["pagerank", "bfs", "sssp", "louvain",
+                 "weakly_connected_components", "katz_centrality"]:
+        assert name in algo_names
+
+    # invalid graph type - default graph is a PG, needs an extracted subgraph
+    with pytest.raises(CugraphServiceError):
+        client.pagerank(graph_id=defaults.graph_id)
+
+    extracted_gid = client.extract_subgraph()
+    num_vertices = client.get_graph_info("num_vertices",
+                                         graph_id=extracted_gid)
+
+    results = client.pagerank(graph_id=extracted_gid)
+    assert sorted(results) == ["pagerank", "vertex"]
+    assert len(results["vertex"]) == num_vertices
+    assert results["pagerank"].sum() == pytest.approx(1.0, rel=1e-3)
+    assert np.allclose(
+        client.run_algo("pagerank", extracted_gid, alpha=0.85)["pagerank"],
+        results["pagerank"])
+
+    results = client.bfs(0, graph_id=extracted_gid)
+    assert results["distance"][results["vertex"] == 0] == 0
+
+    results = client.sssp(0, graph_id=extracted_gid)
+    assert results["distance"][results["vertex"] == 0] == 0
+
+    (parts, modularity) = client.louvain(graph_id=extracted_gid)
+    assert len(parts["partition"]) == num_vertices
+    assert isinstance(modularity, float)
+
+    # The karate graph is connected
+    results = client.weakly_connected_components(graph_id=extracted_gid)
+    assert len(set(results["labels"].tolist())) == 1
+
+    results = client.katz_centrality(graph_id=extracted_gid)
+    assert len(results["katz_centrality"]) == num_vertices
+
+    with pytest.raises(CugraphServiceError):
+        client.run_algo("not_an_algo", extracted_gid)
+    with pytest.raises(CugraphServiceError):
+        client.run_algo("bfs", extracted_gid)
+    with pytest.raises(CugraphServiceError):
+        client.run_algo("pagerank", extracted_gid, not_a_param=1)
+
+
+def test_call_batch(client):
+    from cugraph_service_client.client import BatchResultRef
+
+    test_data = data.edgelist_csv_data["karate"]
+
+    batch = client.batch()
+    graph_id = batch.create_graph()
+    assert isinstance(graph_id, BatchResultRef)
+    batch.load_csv_as_edge_data(test_data["csv_file_name"],
+                                dtypes=test_data["dtypes"],
+                                vertex_col_names=["0", "1"],
+                                type_name="",
+                                graph_id=graph_id)
+    batch.get_graph_info(["num_edges"], graph_id=graph_id)
+    subgraph_id = batch.extract_subgraph(edge_weight_property="2",
+                                         graph_id=graph_id)
+    batch.uniform_neighbor_sample([1, 2, 3], [2, 2], graph_id=subgraph_id)
+    assert len(batch) == 5
+
+    results = batch.execute()
+
+    assert len(results) == 5
+    assert results[0] in client.get_graph_ids()
+    assert results[1] is None
+    assert results[2] == test_data["num_edges"]
+    assert results[3] in client.get_graph_ids()
+    assert len(results[4].sources) == len(results[4].destinations)
+
+
+def test_call_batch_errors(client):
+    from cugraph_service_client.exceptions import CugraphServiceError
+
+    batch = client.batch()
+    with pytest.raises(AttributeError):
+        batch.get_graph_vertex_data_batches()
+    with pytest.raises(AttributeError):
+        batch.close()
+
+    # Calls after the one that fails are not made
+    graph_id = batch.create_graph()
+    batch.node2vec([0], 2, graph_id=9999)
+    batch.delete_graph(graph_id)
+    num_graphs = len(client.get_graph_ids())
+    with pytest.raises(CugraphServiceError):
+        batch.execute()
+    assert len(client.get_graph_ids()) == num_graphs + 1
+
+    # A result can only be passed to a later call in the same batch
+    batch2 = client.batch()
+    batch2.delete_graph(graph_id)
+    with pytest.raises(ValueError):
+        batch2.execute()
@@ -0,0 +1,206 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+###############################################################################
+# fixtures
+
+@pytest.fixture(scope="module")
+def host_graph():
+    """
+    Returns an undirected, weighted HostGraph of a path 0-1-2-3 and an
+    isolated edge 10-11.
+    """
+    from cugraph_service_server.host_graph import HostGraph
+
+    df = pd.DataFrame({"s": [0, 1, 2, 10],
+                       "d": [1, 2, 3, 11],
+                       "w": [0.5, 1.5, 2.5, 3.5]})
+    G = HostGraph()
+    G.from_pandas_edgelist(df, source="s", destination="d", edge_attr="w")
+    return G
+
+
+###############################################################################
+# tests
+
+def test_host_graph(host_graph):
+    from cugraph_service_server.host_graph import HostGraph
+
+    assert not host_graph.is_directed()
+    assert host_graph.is_weighted()
+    assert host_graph.number_of_vertices() == 6
+    assert host_graph.number_of_edges() == 4
+    assert host_graph.edgelist_df.columns.tolist() == ["src", "dst",
+                                                       "weights"]
+
+    G = HostGraph(directed=True)
+    assert G.is_directed()
+    assert not G.is_weighted()
+    assert G.number_of_vertices() == 0
+    assert G.number_of_edges() == 0
+
+
+def test_uniform_neighbor_sample(host_graph):
+    from cugraph_service_server.host_graph import uniform_neighbor_sample
+
+    # All neighbors of 1, then all neighbors of those
+    result = uniform_neighbor_sample(host_graph, [1], [-1, -1])
+    assert result.columns.tolist() == ["sources", "destinations", "indices"]
+    edges = set(zip(result.sources, result.destinations, result.indices))
+    assert edges == {(1, 0, 0.5), (1, 2, 1.5),
+                     (0, 1, 0.5), (2, 1, 1.5), (2, 3, 2.5)}
+
+    # Without replacement, at most fanout neighbors are sampled per vertex
+    result = uniform_neighbor_sample(host_graph, [1, 10], [1],
+                                     with_replacement=False, random_state=42)
+    assert sorted(result.sources.tolist()) == [1, 10]
+    assert set(result.destinations) <= {0, 2, 11}
+
+    # With replacement, exactly fanout neighbors are sampled per vertex
+    result = uniform_neighbor_sample(host_graph, [1, 99], [5],
+                                     with_replacement=True, random_state=42)
+    assert result.sources.tolist() == [1] * 5
+    assert set(result.destinations) <= {0, 2}
+
+
+def test_batched_ego_graphs(host_graph):
+    from cugraph_service_server.host_graph import batched_ego_graphs
+
+    (ego_edge_list, seeds_offsets) = batched_ego_graphs(host_graph, [0, 10],
+                                                        radius=2)
+    assert seeds_offsets.tolist() == [0, 2, 3]
+    assert ego_edge_list.src.tolist() == [0, 1, 10]
+    assert ego_edge_list.dst.tolist() == [1, 2, 11]
+    assert ego_edge_list.weight.tolist() == [0.5, 1.5, 3.5]
+
+
+def test_node2vec(host_graph):
+    from cugraph_service_server.host_graph import node2vec
+
+    (paths, weights, path_sizes) = node2vec(host_graph, [0, 3, 10], 4,
+                                            random_state=42)
+    assert path_sizes.tolist() == [4, 4, 4]
+    assert len(paths) == 12
+    assert len(weights) == 9
+    # Each step of a walk follows an edge of the graph
+    edges = {(0, 1): 0.5, (1, 2): 1.5, (2, 3): 2.5, (10, 11): 3.5}
+    paths = paths.to_numpy().reshape(3, 4)
+    weights = weights.to_numpy().reshape(3, 3)
+    for (path, path_weights) in zip(paths, weights):
+        for (u, v, w) in zip(path[:-1], path[1:], path_weights):
+            assert edges[(min(u, v), max(u, v))] == w
+
+    # Walks end early at vertices without neighbors
+    from cugraph_service_server.host_graph import HostGraph
+    G = HostGraph(directed=True)
+    G.from_pandas_edgelist(pd.DataFrame({"src": [0], "dst": [1]}),
+                           source="src", destination="dst")
+    (paths, weights, path_sizes) = node2vec(G, np.array([0, 1]), 3)
+    assert paths.tolist() == [0, 1, 1]
+    assert weights.tolist() == [1.0]
+    assert path_sizes.tolist() == [2, 1]
+
+
+def test_pagerank(host_graph):
+    from cugraph_service_server.host_graph import HostGraph, pagerank
+
+    result = pagerank(host_graph)
+    assert result.columns.tolist() == ["vertex", "pagerank"]
+    assert result.vertex.tolist() == [0, 1, 2, 3, 10, 11]
+    ranks = result.pagerank.to_numpy()
+    assert ranks.sum() == pytest.approx(1.0)
+    assert ranks[4] == pytest.approx(ranks[5])
+    # Rank flows along the heavier edges of the path
+    assert ranks[2] > ranks[1] > ranks[0]
+
+    # The rank of the dangling vertex 1 is distributed to all vertices
+    G = HostGraph(directed=True)
+    G.from_pandas_edgelist(pd.DataFrame({"src": [0], "dst": [1]}),
+                           source="src", destination="dst")
+    ranks = pagerank(G, alpha=0.5, tol=1e-10).pagerank.to_numpy()
+    assert ranks.tolist() == pytest.approx([0.4, 0.6])
+
+
+def test_bfs(host_graph):
+    from cugraph_service_server.host_graph import bfs
+
+    result = bfs(host_graph, 1)
+    assert result.columns.tolist() == ["vertex", "distance", "predecessor"]
+    unreached = np.iinfo("int32").max
+    assert result.distance.tolist() == [1, 0, 1, 2, unreached, unreached]
+    assert result.predecessor.tolist() == [1, -1, 1, 2, -1, -1]
+
+    result = bfs(host_graph, 0, depth_limit=1)
+    assert result.distance.tolist()[:3] == [0, 1, unreached]
+
+    with pytest.raises(ValueError):
+        bfs(host_graph, 99)
+
+
+def test_sssp():
+    from cugraph_service_server.host_graph import HostGraph, sssp
+
+    # The path 0-2-1 is shorter than the edge 0-1
+    G = HostGraph(directed=True)
+    G.from_pandas_edgelist(pd.DataFrame({"src": [0, 0, 2, 3],
+                                         "dst": [1, 2, 1, 0],
+                                         "w": [5.0, 1.0, 2.0, 1.0]}),
+                           source="src", destination="dst", edge_attr="w")
+    result = sssp(G, 0)
+    assert result.columns.tolist() == ["vertex", "distance", "predecessor"]
+    unreached = np.finfo("float64").max
+    assert result.distance.tolist() == [0.0, 3.0, 1.0, unreached]
+    assert result.predecessor.tolist() == [-1, 2, 0, -1]
+
+    result = sssp(G, 0, cutoff=2.0)
+    assert result.distance.tolist() == [0.0, unreached, 1.0, unreached]
+
+
+def test_weakly_connected_components(host_graph):
+    from cugraph_service_server.host_graph import (
+        HostGraph,
+        weakly_connected_components,
+    )
+
+    result = weakly_connected_components(host_graph)
+    assert result.columns.tolist() == ["labels", "vertex"]
+    assert result.labels.tolist() == [0, 0, 0, 0, 10, 10]
+
+    # Edge directions are ignored
+    G = HostGraph(directed=True)
+    G.from_pandas_edgelist(pd.DataFrame({"src": [3, 2, 5], "dst": [1, 1, 4]}),
+                           source="src", destination="dst")
+    result = weakly_connected_components(G)
+    assert result.vertex.tolist() == [1, 2, 3, 4, 5]
+    assert result.labels.tolist() == [1, 1, 1, 4, 4]
+
+
+def test_katz_centrality(host_graph):
+    from cugraph_service_server.host_graph import katz_centrality
+
+    result = katz_centrality(host_graph)
+    assert result.columns.tolist() == ["vertex", "katz_centrality"]
+    centralities = result.katz_centrality.to_numpy()
+    assert np.linalg.norm(centralities) == pytest.approx(1.0)
+    assert centralities[1] == pytest.approx(centralities[2])
+    assert centralities[1] > centralities[0]
+
+    result = katz_centrality(host_graph, alpha=0.1, normalized=False)
+    # 11 has the single neighbor 10, so x = 0.1 * x + 1
+    assert result.katz_centrality.tolist()[4] == pytest.approx(1 / 0.9)
@@ -173,6 +173,7 @@ def test_get_graph_data_empty_graph(
 
 def test_get_edge_IDs_for_vertices(handler_with_karate_edgelist_loaded):
     from cugraph_service_client import defaults
+    from cugraph_service_client.exceptions import CugraphServiceError
 
     (handler, test_data) = handler_with_karate_edgelist_loaded
 
@@ -195,6 +196,12 @@ def test_get_edge_IDs_for_vertices(handler_with_karate_edgelist_loaded):
                                              extracted_graph_id)
     assert eIDs == [0, 1, 2]
 
+    # (0, 0) is not an edge in karate
+    with pytest.raises(CugraphServiceError, match="1 of 2"):
+        handler.get_edge_IDs_for_vertices([1, 0],
+                                          [0, 0],
+                                          extracted_graph_id)
+
 
 def test_get_graph_info(handler_with_karate_edgelist_loaded):
     """
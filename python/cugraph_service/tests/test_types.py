@@ -0,0 +1,55 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+
+###############################################################################
+# tests
+
+@pytest.mark.parametrize("array", [np.arange(10, dtype="int32"),
+                                   np.arange(12.0).reshape(3, 4),
+                                   np.arange(12).reshape(3, 4)[:, 1],
+                                   np.arange(5, dtype=">i8"),
+                                   np.array([True, False]),
+                                   np.array(42),
+                                   np.ndarray(shape=(0, 0))])
+def test_encode_decode_ndarray(array):
+    from cugraph_service_client.types import (
+        encode_ndarray,
+        decode_ndarray,
+        is_ndarray_buffer,
+    )
+
+    buffer = encode_ndarray(array)
+    assert is_ndarray_buffer(buffer)
+
+    decoded = decode_ndarray(buffer)
+    assert decoded.shape == array.shape
+    assert decoded.dtype == array.dtype.newbyteorder("<")
+    assert (decoded == array).all()
+    # The decoded array uses the memory of the buffer
+    assert not decoded.flags.owndata
+    assert not decoded.flags.writeable
+
+
+def test_encode_decode_ndarray_errors():
+    from cugraph_service_client.types import encode_ndarray, decode_ndarray
+
+    with pytest.raises(TypeError):
+        encode_ndarray(np.array(["a", 1], dtype=object))
+
+    with pytest.raises(ValueError):
+        decode_ndarray(np.arange(10).dumps())